@@ -0,0 +1,52 @@
+"""
+Throughput of exact (Fraction) mode against the float path.
+
+Exact conversion and scaling never drift, at the cost of rational
+arithmetic; this shows how much that costs for each workload so the mode
+can be picked per use.
+
+Run from the repository root:
+    python -m benchmarks.bench_exact
+"""
+
+import timeit
+
+from benchmarks.data import make_recipe, unit_pairs
+from lethimcook import convert, scale_recipe
+from lethimcook.converter import convert_exact
+from lethimcook.units import UnitType
+
+SIZES = (10, 100)
+
+
+def _per_second(func, number: int) -> float:
+    timer = timeit.Timer(func)
+    return number / min(timer.repeat(repeat=5, number=number))
+
+
+def main() -> None:
+    print(f"{'workload':<24} {'float/s':>12} {'exact/s':>12} {'slowdown':>9}")
+
+    pairs = unit_pairs(UnitType.VOLUME, 64) + unit_pairs(UnitType.TEMPERATURE, 64)
+
+    def run(func):
+        def call():
+            for value, from_unit, to_unit in pairs:
+                func(value, from_unit, to_unit)
+        return call
+
+    floats = _per_second(run(convert), 50) * len(pairs)
+    exact = _per_second(run(convert_exact), 50) * len(pairs)
+    print(f"{'convert':<24} {floats:>12.0f} {exact:>12.0f} {floats / exact:>8.1f}x")
+
+    for size in SIZES:
+        recipe = make_recipe(size)
+        number = max(1, 2000 // size)
+        floats = _per_second(lambda: scale_recipe(recipe, 7), number)
+        exact = _per_second(lambda: scale_recipe(recipe, 7, exact=True), number)
+        name = f"scale_recipe ({size})"
+        print(f"{name:<24} {floats:>12.0f} {exact:>12.0f} {floats / exact:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
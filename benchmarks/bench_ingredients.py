@@ -0,0 +1,30 @@
+"""
+Throughput benchmark for the ingredient line parser.
+
+Parses a seeded mix of ingredient lines (fractions, mixed numbers, unicode
+fractions, ranges, multi-word units and notes) with parse_ingredients and
+reports lines per minute.
+
+Run from the repository root:
+    python -m benchmarks.bench_ingredients
+"""
+
+import timeit
+from collections import deque
+
+from benchmarks.data import make_ingredient_lines
+from lethimcook import parse_ingredients
+
+LINES = 100_000
+
+
+def main() -> None:
+    lines = make_ingredient_lines(LINES)
+    timer = timeit.Timer(lambda: deque(parse_ingredients(lines), maxlen=0))
+    seconds = min(timer.repeat(repeat=3, number=1))
+    print(f"{LINES} lines in {seconds:.3f}s: {LINES / seconds * 60 / 1e6:.2f}M lines/minute "
+          f"({seconds / LINES * 1e9:.0f} ns/line)")
+
+
+if __name__ == "__main__":
+    main()
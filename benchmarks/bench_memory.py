@@ -0,0 +1,66 @@
+"""
+Memory benchmark for ingredient representations.
+
+Reports the bytes of Python heap allocated per ingredient when holding many
+ingredients as pydantic Ingredient models, as IngredientRecord tuples and,
+when NumPy is installed, as RecipeBatch columns (not counting the template
+recipes a batch references). Names, units and notes are shared between
+ingredients, as they typically are in a catalog.
+
+Run from the repository root:
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import tracemalloc
+
+from lethimcook.recipe import Ingredient, Recipe
+from lethimcook.records import IngredientRecord
+from lethimcook.store import _INGREDIENT
+
+COUNT = 100_000
+
+
+def _bytes_per_item(build) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return (after - before) / COUNT
+
+
+def _models():
+    return [Ingredient(amount=i * 0.5, unit="cups", name="flour", note="sifted") for i in range(COUNT)]
+
+
+def _records():
+    return [IngredientRecord(i * 0.5, "cups", "flour", "sifted") for i in range(COUNT)]
+
+
+def measure() -> dict[str, float]:
+    """Bytes per ingredient for each representation."""
+    results = {
+        "pydantic Ingredient": _bytes_per_item(_models),
+        "IngredientRecord": _bytes_per_item(_records),
+    }
+    try:
+        from lethimcook.batch import RecipeBatch
+    except ImportError:
+        pass
+    else:
+        recipe = Recipe(servings=1, ingredients=_models())
+        results["RecipeBatch columns"] = _bytes_per_item(lambda: RecipeBatch([recipe]))
+    results["RecipeStore record (on disk)"] = float(_INGREDIENT.size)
+    return results
+
+
+def main() -> None:
+    for representation, size in measure().items():
+        print(f"{representation:<30} {size:>8.1f} bytes/ingredient")
+
+
+if __name__ == "__main__":
+    main()
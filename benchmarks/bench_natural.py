@@ -0,0 +1,74 @@
+"""
+Microbenchmark for convert_natural.
+
+Compares per-query latency of the single-pass compiled grammar against the
+previous implementation, which tried three uncompiled patterns in turn.
+
+Run from the repository root:
+    python -m benchmarks.bench_natural
+"""
+
+import re
+import timeit
+
+from benchmarks.data import NATURAL_QUERIES
+from lethimcook import convert, convert_natural
+from lethimcook.natural import _format_number
+
+
+def legacy_convert_natural(text: str) -> str:
+    """The sequential three-pattern implementation, kept for comparison."""
+    text = text.lower().strip()
+
+    pattern1 = r"(\d+\.?\d*)\s+([a-z\s]+?)\s+(?:to|in)\s+([a-z\s]+)"
+    match = re.match(pattern1, text)
+    if match:
+        value = float(match.group(1))
+        from_unit = match.group(2).strip()
+        to_unit = match.group(3).strip()
+        result = convert(value, from_unit, to_unit)
+        return f"{_format_number(value)} {from_unit} = {result:.2f} {to_unit}"
+
+    pattern2 = r"convert\s+(\d+\.?\d*)\s+([a-z\s]+?)\s+to\s+([a-z\s]+)"
+    match = re.match(pattern2, text)
+    if match:
+        value = float(match.group(1))
+        from_unit = match.group(2).strip()
+        to_unit = match.group(3).strip()
+        result = convert(value, from_unit, to_unit)
+        return f"{_format_number(value)} {from_unit} = {result:.2f} {to_unit}"
+
+    pattern3 = r"how\s+many\s+([a-z\s]+?)\s+in\s+(\d+\.?\d*)\s+([a-z\s]+)"
+    match = re.match(pattern3, text)
+    if match:
+        to_unit = match.group(1).strip()
+        value = float(match.group(2))
+        from_unit = match.group(3).strip()
+        result = convert(value, from_unit, to_unit)
+        return f"{_format_number(value)} {from_unit} = {result:.2f} {to_unit}"
+
+    raise ValueError(f"Could not parse conversion request: {text}")
+
+
+def _latency(func, query: str, number: int) -> float:
+    """Best-of-five per-call latency in nanoseconds."""
+    def call():
+        try:
+            func(query)
+        except ValueError:
+            pass
+
+    timer = timeit.Timer(call)
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main(number: int = 20_000) -> None:
+    print(f"{'phrasing':<12} {'legacy ns':>10} {'compiled ns':>12} {'speedup':>8}")
+    for phrasing, query in NATURAL_QUERIES.items():
+        legacy = _latency(legacy_convert_natural, query, number)
+        compiled = _latency(convert_natural, query, number)
+        print(f"{phrasing:<12} {legacy:>10.0f} {compiled:>12.0f} {legacy / compiled:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Throughput benchmark for scale_recipe.
+
+Compares scale_recipe, which copies the already-validated models without
+re-validating them, against the previous implementation, which dumped every
+ingredient and the recipe and re-validated them.
+
+Run from the repository root:
+    python -m benchmarks.bench_recipe
+"""
+
+import timeit
+
+from benchmarks.data import make_recipe
+from lethimcook.recipe import Ingredient, Recipe, scale_recipe
+
+SIZES = (10, 100, 1000)
+
+
+def legacy_scale_recipe(recipe: Recipe, new_servings: int) -> Recipe:
+    """The dump-and-revalidate implementation, kept for comparison."""
+    if new_servings <= 0:
+        raise ValueError("New servings must be positive")
+
+    scale_factor = new_servings / recipe.servings
+
+    scaled_ingredients = []
+    for ingredient in recipe.ingredients:
+        ingredient_dict = ingredient.model_dump()
+        if ingredient.amount is not None:
+            ingredient_dict["amount"] = ingredient.amount * scale_factor
+        scaled_ingredients.append(Ingredient(**ingredient_dict))
+
+    recipe_dict = recipe.model_dump(exclude={"servings", "ingredients"})
+    recipe_dict["servings"] = new_servings
+    recipe_dict["ingredients"] = scaled_ingredients
+
+    return Recipe(**recipe_dict)
+
+
+def _recipes_per_second(func, recipe: Recipe) -> float:
+    number = max(1, 2000 // len(recipe.ingredients))
+    timer = timeit.Timer(lambda: func(recipe, 6))
+    return number / min(timer.repeat(repeat=5, number=number))
+
+
+def main() -> None:
+    print(f"{'ingredients':>11} {'legacy/s':>10} {'copy/s':>10} {'speedup':>8}")
+    for size in SIZES:
+        recipe = make_recipe(size)
+        legacy = _recipes_per_second(legacy_scale_recipe, recipe)
+        current = _recipes_per_second(scale_recipe, recipe)
+        print(f"{size:>11} {legacy:>10.0f} {current:>10.0f} {current / legacy:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Thread-scaling benchmark for convert, convert_natural and scale_recipe.
+
+Runs the same fixed amount of work split across 1, 2, 4 and 8 threads and
+reports throughput and speedup over one thread. On a standard (GIL) build
+the speedup stays near 1x; on a free-threaded build (e.g. python3.13t)
+it should grow with the number of cores, since the conversion paths read
+immutable tables and take no locks.
+
+Run from the repository root:
+    python -m benchmarks.bench_threads
+    python3.13t -m benchmarks.bench_threads --threads 1 2 4 8 16
+"""
+
+import argparse
+import os
+import sys
+import threading
+from collections.abc import Callable
+from time import perf_counter
+
+from benchmarks.data import NATURAL_QUERIES, make_recipe, unit_pairs
+from lethimcook import convert, convert_natural, scale_recipe
+from lethimcook.units import UnitType
+
+OPERATIONS = 40_000
+
+
+def _workloads() -> dict[str, Callable[[int], None]]:
+    pairs = unit_pairs(UnitType.VOLUME, 64) + unit_pairs(UnitType.WEIGHT, 64)
+    queries = [
+        query for name, query in NATURAL_QUERIES.items()
+        if name not in ("unparseable", "unknown unit")
+    ]
+    recipe = make_recipe(10)
+
+    def run_convert(count: int) -> None:
+        for i in range(count):
+            value, from_unit, to_unit = pairs[i % len(pairs)]
+            convert(value, from_unit, to_unit)
+
+    def run_natural(count: int) -> None:
+        for i in range(count):
+            convert_natural(queries[i % len(queries)])
+
+    def run_scale(count: int) -> None:
+        for i in range(count):
+            scale_recipe(recipe, 1 + i % 12)
+
+    return {"convert": run_convert, "convert_natural": run_natural, "scale_recipe": run_scale}
+
+
+def _throughput(work: Callable[[int], None], threads: int) -> float:
+    """Operations per second with OPERATIONS split evenly across threads."""
+    share = OPERATIONS // threads
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        work(share)
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    start = perf_counter()
+    barrier.wait()
+    for thread in pool:
+        thread.join()
+    return share * threads / (perf_counter() - start)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure throughput scaling across threads")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, "
+          f"{os.cpu_count()} CPUs")
+    print(f"{'workload':<16} {'threads':>7} {'ops/s':>12} {'speedup':>8}")
+    for name, work in _workloads().items():
+        work(1000)  # warm the resolution and density caches
+        single = None
+        for threads in args.threads:
+            rate = _throughput(work, threads)
+            single = single or rate
+            print(f"{name:<16} {threads:>7} {rate:>12.0f} {rate / single:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
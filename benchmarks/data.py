@@ -0,0 +1,91 @@
+"""
+Reproducible synthetic data for the benchmarks.
+
+Every generator takes a seed, so the same arguments always produce the same
+data across runs and machines.
+"""
+
+import random
+
+from lethimcook.recipe import Ingredient, Recipe
+from lethimcook.units import UnitType, get_registry
+
+# One representative query per convert_natural phrasing, including failures
+NATURAL_QUERIES = {
+    "to": "2 cups to ml",
+    "in": "1.5 pounds in grams",
+    "convert": "convert 1 pound to grams",
+    "how many": "how many ml in 3 teaspoons",
+    "unparseable": "this is gibberish",
+    "unknown unit": "2 blorg to ml",
+}
+
+INGREDIENT_NAMES = (
+    "flour", "sugar", "butter", "milk", "salt", "eggs", "vanilla extract",
+    "baking soda", "olive oil", "garlic", "onion", "rice", "water", "honey",
+)
+
+
+def units_by_type() -> dict[UnitType, list[str]]:
+    """Every known unit alias, grouped by unit type."""
+    registry = get_registry()
+    grouped: dict[UnitType, list[str]] = {}
+    for alias, unit_id in registry.ids.items():
+        grouped.setdefault(registry.types[unit_id], []).append(alias)
+    return grouped
+
+
+def unit_pairs(unit_type: UnitType, count: int, seed: int = 0) -> list[tuple[float, str, str]]:
+    """Random (value, from unit, to unit) triples of one unit type."""
+    rng = random.Random(seed)
+    units = units_by_type()[unit_type]
+    return [
+        (round(rng.uniform(0.1, 500), 2), rng.choice(units), rng.choice(units))
+        for _ in range(count)
+    ]
+
+
+def make_recipe(size: int, seed: int = 0) -> Recipe:
+    """A recipe with `size` ingredients in assorted volume, weight and count units."""
+    rng = random.Random(seed)
+    units = units_by_type()
+    pool = units[UnitType.VOLUME] + units[UnitType.WEIGHT] + units[UnitType.COUNT]
+    return Recipe(
+        servings=rng.randint(1, 12),
+        name=f"Synthetic recipe ({size} ingredients)",
+        prep_time="20 minutes",
+        ingredients=[
+            Ingredient(
+                amount=round(rng.uniform(0.25, 10), 2),
+                unit=rng.choice(pool),
+                name=rng.choice(INGREDIENT_NAMES),
+                note="chopped" if rng.random() < 0.2 else None,
+            )
+            for _ in range(size)
+        ],
+    )
+
+
+def make_catalog(count: int, size: int = 10, seed: int = 0) -> list[Recipe]:
+    """`count` recipes of `size` ingredients each."""
+    return [make_recipe(size, seed=seed * 1_000_003 + i) for i in range(count)]
+
+
+# Amount spellings accepted by the ingredient line parser
+_LINE_AMOUNTS = ("1", "2", "1/2", "1 1/2", "½", "1¾", "0.25", "2-3", "1 to 2", "")
+_LINE_NOTES = ("", "", ", sifted", ", chopped", " (optional)", ", at room temperature")
+
+
+def make_ingredient_lines(count: int, seed: int = 0) -> list[str]:
+    """Free-text ingredient lines in assorted amount, unit and note styles."""
+    rng = random.Random(seed)
+    units = units_by_type()
+    pool = units[UnitType.VOLUME] + units[UnitType.WEIGHT] + [""]
+    lines = []
+    for _ in range(count):
+        amount = rng.choice(_LINE_AMOUNTS)
+        unit = rng.choice(pool) if amount else ""
+        name = rng.choice(INGREDIENT_NAMES)
+        line = " ".join(part for part in (amount, unit, name) if part)
+        lines.append(line + rng.choice(_LINE_NOTES))
+    return lines
@@ -0,0 +1,142 @@
+"""
+Load generator for lethimcook.server.
+
+Opens keep-alive connections to a running server and sends a mix of
+convert, convert_natural and scale_recipe requests, then reports
+throughput and client-side p50/p99 latency alongside the server's /stats.
+
+Run from the repository root against a server started on this machine:
+    python -m benchmarks.loadgen --port 8765
+or let it start one on a free port:
+    python -m benchmarks.loadgen --spawn
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+from time import perf_counter
+
+RECIPE = {
+    "servings": 4,
+    "name": "Pancakes",
+    "ingredients": [
+        {"amount": 2, "unit": "cups", "name": "flour"},
+        {"amount": 1, "unit": "tsp", "name": "salt"},
+        {"amount": 2, "unit": "whole", "name": "eggs"},
+    ],
+}
+
+WORKLOAD = (
+    ("/convert", {"value": 2, "from": "cups", "to": "ml"}),
+    ("/convert", {"value": 350, "from": "f", "to": "c"}),
+    ("/convert", {"value": 1, "from": "lb", "to": "g"}),
+    ("/convert_natural", {"query": "how many ml in 3 teaspoons"}),
+    ("/scale_recipe", {"recipe": RECIPE, "servings": 10}),
+)
+
+
+class Connection:
+    """A minimal keep-alive HTTP/1.1 JSON client."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def open(cls, host: str, port: int, unix_path: str | None) -> "Connection":
+        if unix_path is not None:
+            return cls(*await asyncio.open_unix_connection(unix_path))
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def request(self, method: str, path: str, payload: dict | None = None) -> tuple[int, dict]:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        self.writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while (line := await self.reader.readline()) not in (b"\r\n", b""):
+            name, _, value = line.decode().partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return status, json.loads(await self.reader.readexactly(length))
+
+    async def close(self) -> None:
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+async def _client(args, latencies: list[float], errors: list[int], offset: int) -> None:
+    connection = await Connection.open(args.host, args.port, args.unix)
+    try:
+        for i in range(args.requests):
+            path, payload = WORKLOAD[(offset + i) % len(WORKLOAD)]
+            start = perf_counter()
+            status, _ = await connection.request("POST", path, payload)
+            latencies.append(perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        await connection.close()
+
+
+async def run(args) -> dict:
+    latencies: list[float] = []
+    errors: list[int] = []
+    start = perf_counter()
+    await asyncio.gather(*(
+        _client(args, latencies, errors, offset) for offset in range(args.connections)
+    ))
+    elapsed = perf_counter() - start
+
+    connection = await Connection.open(args.host, args.port, args.unix)
+    _, server_stats = await connection.request("GET", "/stats")
+    await connection.close()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "seconds": elapsed,
+        "requests_per_second": len(latencies) / elapsed,
+        "client_p50_ms": latencies[len(latencies) // 2] * 1000,
+        "client_p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "server": server_stats,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH", help="connect to a Unix socket instead")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500, help="requests per connection")
+    parser.add_argument("--spawn", action="store_true", help="start a server on a free local port")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "lethimcook.server", "--host", args.host, "--port", "0"],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        # "Serving on HOST:PORT"
+        args.port = int(server.stdout.readline().rsplit(":", 1)[1])
+        args.unix = None
+
+    try:
+        print(json.dumps(asyncio.run(run(args)), indent=2))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
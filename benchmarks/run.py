@@ -0,0 +1,231 @@
+"""
+Benchmark suite covering every public entry point.
+
+Measures scalar convert for each unit type and across volume and weight,
+each convert_natural phrasing (including failures, with and without the
+result cache), scale_recipe at several recipe sizes, ingredient line
+parsing, recipe serialization, package import time and memory per
+ingredient. Results are written as JSON and can be compared against a
+stored baseline; any benchmark slower than the baseline by more than the
+threshold fails the run.
+
+Run from the repository root:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --compare benchmarks/baseline.json --threshold 0.25
+
+Timings depend on the machine, so regenerate the baseline with --output
+when moving to different hardware.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import timeit
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+
+from benchmarks import bench_memory
+from benchmarks.data import NATURAL_QUERIES, make_ingredient_lines, make_recipe, unit_pairs
+from lethimcook import convert, convert_natural, parse_ingredients, scale_recipe
+from lethimcook.natural import disable_result_cache, enable_result_cache
+from lethimcook.units import UnitType
+
+ROOT = Path(__file__).resolve().parent.parent
+RECIPE_SIZES = (10, 100, 1000)
+
+
+def _ns_per_call(func: Callable[[], object], repeat: int) -> float:
+    """Best-of-`repeat` nanoseconds per call, auto-ranging the loop count."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e9
+
+
+def _tolerant(func: Callable[..., object], *args) -> Callable[[], None]:
+    """Wrap a call so expected ValueErrors are part of the measurement."""
+    def call():
+        try:
+            func(*args)
+        except ValueError:
+            pass
+    return call
+
+
+def bench_convert(repeat: int) -> dict[str, float]:
+    results = {}
+    for unit_type in UnitType:
+        pairs = unit_pairs(unit_type, 64)
+
+        def run(pairs=pairs):
+            for value, from_unit, to_unit in pairs:
+                convert(value, from_unit, to_unit)
+
+        results[f"convert.{unit_type}"] = _ns_per_call(run, repeat) / len(pairs)
+    results["convert.volume_to_weight"] = _ns_per_call(
+        lambda: convert(2, "cups", "g", ingredient="sifted cake flour"), repeat
+    )
+    return results
+
+
+def bench_natural(repeat: int) -> dict[str, float]:
+    results = {
+        f"convert_natural.{phrasing.replace(' ', '_')}": _ns_per_call(
+            _tolerant(convert_natural, query), repeat
+        )
+        for phrasing, query in NATURAL_QUERIES.items()
+    }
+    enable_result_cache()
+    try:
+        for phrasing in ("to", "unparseable"):
+            results[f"convert_natural.cached_{phrasing}"] = _ns_per_call(
+                _tolerant(convert_natural, NATURAL_QUERIES[phrasing]), repeat
+            )
+    finally:
+        disable_result_cache()
+    return results
+
+
+def bench_scale(repeat: int) -> dict[str, float]:
+    results = {}
+    for size in RECIPE_SIZES:
+        recipe = make_recipe(size)
+        results[f"scale_recipe.{size}"] = _ns_per_call(lambda: scale_recipe(recipe, 24), repeat)
+    return results
+
+
+def bench_parse(repeat: int) -> dict[str, float]:
+    lines = make_ingredient_lines(1000)
+    return {
+        "parse_ingredients.per_line": _ns_per_call(
+            lambda: deque(parse_ingredients(lines), maxlen=0), repeat
+        ) / len(lines)
+    }
+
+
+def bench_serialize(repeat: int) -> dict[str, float]:
+    """Per recipe: streaming serializer versus model_dump plus json.dumps."""
+    from lethimcook.serialize import dump_recipes
+
+    recipes = [make_recipe(10)] * 1000
+    sink = io.BytesIO()
+
+    def stream():
+        sink.seek(0)
+        dump_recipes(recipes, sink)
+
+    return {
+        "serialize.dump_recipes": _ns_per_call(stream, repeat) / len(recipes),
+        "serialize.json_dumps": _ns_per_call(
+            lambda: json.dumps([r.model_dump(mode="json") for r in recipes]), repeat
+        ) / len(recipes),
+    }
+
+
+def bench_import(repeat: int) -> dict[str, float]:
+    """
+    Cumulative `import lethimcook` time in a fresh interpreter, in ns.
+
+    Bytecode is written and reused even under PYTHONDONTWRITEBYTECODE, so the
+    timing covers loading the package rather than compiling its source.
+    """
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    command = [sys.executable, "-X", "importtime", "-c", "import lethimcook"]
+    # Warm-up run populates __pycache__
+    subprocess.run(command, capture_output=True, check=True, cwd=ROOT, env=env)
+    timings = []
+    for _ in range(repeat):
+        stderr = subprocess.run(
+            command, capture_output=True, text=True, check=True, cwd=ROOT, env=env,
+        ).stderr
+        match = re.search(r"\|\s+(\d+) \| lethimcook$", stderr, re.MULTILINE)
+        timings.append(int(match.group(1)) * 1000)
+    return {"import.lethimcook": float(min(timings))}
+
+
+def bench_memory_per_object(repeat: int) -> dict[str, float]:
+    """Bytes per ingredient; deterministic, so measured once."""
+    return {
+        f"memory.{name.split(' (')[0].replace(' ', '_')}": size
+        for name, size in bench_memory.measure().items()
+    }
+
+
+SUITES = {
+    "convert": bench_convert,
+    "natural": bench_natural,
+    "scale": bench_scale,
+    "parse": bench_parse,
+    "serialize": bench_serialize,
+    "import": bench_import,
+    "memory": bench_memory_per_object,
+}
+
+
+def run(suites: list[str], repeat: int) -> dict:
+    results: dict[str, float] = {}
+    for suite in suites:
+        results.update(SUITES[suite](repeat))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "units": "ns per call; memory.* in bytes per ingredient",
+        },
+        "results": results,
+    }
+
+
+def compare(results: dict[str, float], baseline: dict[str, float], threshold: float) -> list[str]:
+    """Print a comparison table and return the names of regressed benchmarks."""
+    regressions = []
+    print(f"{'benchmark':<34} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, value in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<34} {'-':>12} {value:>12.1f} {'new':>8}")
+            continue
+        change = value / base - 1 if base else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<34} {base:>12.1f} {value:>12.1f} {change:>+7.1%}{flag}")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Run the lethimcook benchmark suite")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES),
+                        help="run only these suites (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--compare", type=Path, metavar="BASELINE",
+                        help="compare against a results file written by --output")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before failing (default: 0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = run(args.suite or list(SUITES), args.repeat)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(report["results"], baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+    else:
+        for name, value in report["results"].items():
+            print(f"{name:<34} {value:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
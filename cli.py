@@ -3,7 +3,27 @@
 
 import sys
 
-from lethimcook import convert_natural
+from lethimcook import convert_natural, convert_natural_stream
+
+
+def run_batch(source: str) -> None:
+    """
+    Convert one query per line from a file, or stdin when source is '-'.
+
+    Bytes that are not valid UTF-8 are replaced, so the line holding them
+    yields an error line like any other unparseable query.
+    """
+    if source == "-":
+        sys.stdin.reconfigure(encoding="utf-8", errors="replace")
+        sys.stdout.writelines(f"{result}\n" for result in convert_natural_stream(sys.stdin))
+        return
+
+    try:
+        with open(source, encoding="utf-8", errors="replace") as f:
+            sys.stdout.writelines(f"{result}\n" for result in convert_natural_stream(f))
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
 
 
 def main():
@@ -14,12 +34,27 @@ def main():
         print("  python cli.py '2 cups to ml'")
         print("  python cli.py 'convert 1 pound to grams'")
         print("  python cli.py 'how many ml in 3 teaspoons'")
+        print("  python cli.py --batch queries.txt   (one query per line, '-' for stdin)")
+        print("  python cli.py scale recipes.jsonl scaled.jsonl --servings 8")
         print("\nSupported units:")
         print("  Volume: tsp, tbsp, fl oz, cup, pint, quart, gallon, ml, liter")
         print("  Weight: oz, pound, gram, kilogram")
         print("  Temperature: fahrenheit, celsius, kelvin")
         sys.exit(1)
 
+    if sys.argv[1] == "scale":
+        from lethimcook.pipeline import main as scale_main
+
+        scale_main(sys.argv[2:])
+        return
+
+    if sys.argv[1] == "--batch":
+        if len(sys.argv) != 3:
+            print("Usage: python cli.py --batch FILE|-", file=sys.stderr)
+            sys.exit(1)
+        run_batch(sys.argv[2])
+        return
+
     query = " ".join(sys.argv[1:])
 
     try:
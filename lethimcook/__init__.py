@@ -1,7 +1,54 @@
 """LetHimCook - A Python library for unit conversions, especially for cooking."""
 
-from lethimcook.converter import convert
-from lethimcook.natural import convert_natural
-from lethimcook.recipe import Ingredient, Recipe, scale_recipe
+from importlib import import_module
 
-__all__ = ["convert", "convert_natural", "scale_recipe", "Recipe", "Ingredient"]
+from lethimcook.converter import convert, convert_many
+from lethimcook.ingredients import UnparsedLine, parse_ingredient, parse_ingredients
+from lethimcook.natural import convert_natural, convert_natural_result, convert_natural_stream
+from lethimcook.records import IngredientRecord, RecipeRecord
+
+# Exports whose modules import pydantic or NumPy; loaded on first attribute access
+_LAZY_EXPORTS = {
+    "RecipeBatch": "lethimcook.batch",
+    "aggregate_ingredients": "lethimcook.recipe",
+    "Ingredient": "lethimcook.recipe",
+    "ExactIngredient": "lethimcook.recipe",
+    "ExactRecipe": "lethimcook.recipe",
+    "Recipe": "lethimcook.recipe",
+    "scale_recipe": "lethimcook.recipe",
+    "ScalableRecipe": "lethimcook.scalable",
+}
+
+__all__ = [
+    "convert",
+    "convert_many",
+    "convert_natural",
+    "convert_natural_result",
+    "convert_natural_stream",
+    "parse_ingredient",
+    "parse_ingredients",
+    "UnparsedLine",
+    "scale_recipe",
+    "aggregate_ingredients",
+    "Recipe",
+    "Ingredient",
+    "ExactRecipe",
+    "ExactIngredient",
+    "RecipeBatch",
+    "ScalableRecipe",
+    "IngredientRecord",
+    "RecipeRecord",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,235 @@
+"""
+Asyncio counterparts of the batch entry points.
+
+Work is split into chunks and each chunk runs on an executor, so a large
+batch never blocks the event loop and other tasks run between chunks. Pass
+a ``concurrent.futures`` thread or process pool per call, or set one for
+all calls with set_default_executor; without either, the event loop's
+default thread pool is used.
+
+At most ``max_pending`` chunks are in flight at once, and the async
+iterators only read more input when the consumer asks for more results, so
+a slow consumer holds back a fast producer. Cancelling the consuming task,
+or leaving an ``async for`` early, cancels chunks that have not started.
+
+Process pools see only the built-in units and densities: anything added
+with register_units or register_densities lives in the parent process.
+The same goes for the convert_natural result cache and the metrics
+recorder, which worker processes neither use nor update.
+
+Example:
+    async for scaled in scale_recipes(recipes, 8):
+        await send(scaled)
+"""
+
+import asyncio
+from array import array
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable, Mapping, Sequence
+from concurrent.futures import Executor
+from functools import partial
+from typing import TYPE_CHECKING
+
+from lethimcook.converter import convert_many as _convert_many
+from lethimcook.natural import convert_natural_stream as _convert_natural_stream
+from lethimcook.records import _check_servings
+from lethimcook.units import UnitType
+
+if TYPE_CHECKING:
+    from lethimcook.recipe import Recipe
+    from lethimcook.records import RecipeRecord
+
+# Default items per chunk: numbers for convert_many, recipes for
+# scale_recipes and queries for convert_natural_stream
+VALUES_PER_CHUNK = 65536
+RECIPES_PER_CHUNK = 64
+QUERIES_PER_CHUNK = 256
+
+# Chunks submitted to the executor ahead of the consumer
+DEFAULT_MAX_PENDING = 2
+
+_default_executor: Executor | None = None
+
+
+def set_default_executor(executor: Executor | None) -> None:
+    """Use ``executor`` when a call does not pass one; None restores the loop's default."""
+    global _default_executor
+    _default_executor = executor
+
+
+async def _run_chunks(
+    calls: AsyncIterable[Callable[[], object]],
+    executor: Executor | None,
+    max_pending: int,
+) -> AsyncIterator:
+    """Run calls on the executor, yielding their results in order."""
+    loop = asyncio.get_running_loop()
+    executor = executor or _default_executor
+    pending: deque[asyncio.Future] = deque()
+    try:
+        async for call in calls:
+            pending.append(loop.run_in_executor(executor, call))
+            if len(pending) >= max_pending:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            # Chunks that already failed are marked retrieved so asyncio
+            # does not log them
+            if not future.cancel() and not future.cancelled():
+                future.exception()
+
+
+async def _chunks(items: Iterable | AsyncIterable, size: int) -> AsyncIterator[list]:
+    """Group a sync or async iterable into lists of up to ``size`` items."""
+    chunk = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _check_chunking(chunk_size: int, max_pending: int) -> None:
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if max_pending <= 0:
+        raise ValueError("Max pending chunks must be positive")
+
+
+async def convert_many(
+    values: Sequence[float] | array,
+    from_unit: str | Sequence[str],
+    to_unit: str | Sequence[str],
+    ingredient: str | None = None,
+    *,
+    executor: Executor | None = None,
+    chunk_size: int = VALUES_PER_CHUNK,
+    max_pending: int = DEFAULT_MAX_PENDING,
+):
+    """
+    Convert many values at once; see lethimcook.convert_many.
+
+    Raises:
+        ValueError: If units are incompatible or unknown, a per-row unit
+            sequence does not match the length of ``values``, or the
+            chunking settings are not positive
+    """
+    _check_chunking(chunk_size, max_pending)
+    length = len(values)
+    for units in (from_unit, to_unit):
+        if not isinstance(units, str) and len(units) != length:
+            raise ValueError(f"Expected {length} units, got {len(units)}")
+
+    def rows(units, start):
+        return units if isinstance(units, str) else units[start:start + chunk_size]
+
+    async def calls():
+        # An empty batch still makes one call so units are validated
+        for start in range(0, max(length, 1), chunk_size):
+            yield partial(
+                _convert_many,
+                values[start:start + chunk_size],
+                rows(from_unit, start),
+                rows(to_unit, start),
+                ingredient,
+            )
+
+    parts = [part async for part in _run_chunks(calls(), executor, max_pending)]
+    if len(parts) == 1:
+        return parts[0]
+    if isinstance(parts[0], array):
+        result = array("d")
+        for part in parts:
+            result.extend(part)
+        return result
+    import numpy as np
+
+    return np.concatenate(parts)
+
+
+def _scale_chunk(recipes: list, new_servings: int, normalize_units: bool,
+                 display_units: Mapping[UnitType, str] | None, exact: bool) -> list:
+    from lethimcook.recipe import scale_recipe
+
+    return [
+        scale_recipe(recipe, new_servings, normalize_units, display_units, exact)
+        for recipe in recipes
+    ]
+
+
+async def scale_recipes(
+    recipes: "Iterable[Recipe | RecipeRecord] | AsyncIterable[Recipe | RecipeRecord]",
+    new_servings: int,
+    normalize_units: bool = False,
+    display_units: Mapping[UnitType, str] | None = None,
+    exact: bool = False,
+    *,
+    executor: Executor | None = None,
+    chunk_size: int = RECIPES_PER_CHUNK,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> "AsyncIterator[Recipe | RecipeRecord]":
+    """
+    Scale recipes to ``new_servings`` each; see lethimcook.scale_recipe.
+
+    Yields:
+        Scaled recipes, in input order
+
+    Raises:
+        ValueError: If new_servings is not a positive whole number, a display
+            unit is unknown or of an unrelated type, or the chunking settings
+            are not positive
+    """
+    _check_chunking(chunk_size, max_pending)
+    new_servings = _check_servings(new_servings)
+
+    async def calls():
+        async for chunk in _chunks(recipes, chunk_size):
+            yield partial(_scale_chunk, chunk, new_servings, normalize_units, display_units, exact)
+
+    async for scaled in _run_chunks(calls(), executor, max_pending):
+        for recipe in scaled:
+            yield recipe
+
+
+def _natural_chunk(lines: list[str]) -> list[str]:
+    return list(_convert_natural_stream(lines))
+
+
+async def convert_natural_stream(
+    lines: Iterable[str] | AsyncIterable[str],
+    *,
+    executor: Executor | None = None,
+    chunk_size: int = QUERIES_PER_CHUNK,
+    max_pending: int = DEFAULT_MAX_PENDING,
+) -> AsyncIterator[str]:
+    """
+    Convert line-delimited queries; see lethimcook.convert_natural_stream.
+
+    Blank lines are skipped and failed queries yield ``"Error: ..."`` lines.
+
+    Yields:
+        Formatted conversion results, in input order
+
+    Raises:
+        ValueError: If the chunking settings are not positive
+    """
+    _check_chunking(chunk_size, max_pending)
+
+    async def calls():
+        async for chunk in _chunks(lines, chunk_size):
+            yield partial(_natural_chunk, chunk)
+
+    async for results in _run_chunks(calls(), executor, max_pending):
+        for result in results:
+            yield result
@@ -0,0 +1,131 @@
+"""Columnar recipe batches for scaling many recipes to many serving sizes."""
+
+from collections.abc import Iterable, Iterator
+from math import isnan
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "lethimcook.batch requires NumPy: pip install lethimcook[numpy]"
+    ) from e
+
+from lethimcook.recipe import Recipe, _with_amount, _with_ingredients
+from lethimcook.records import _check_servings
+
+
+def _intern(values: Iterable[str | None], table: dict[str | None, int]) -> list[int]:
+    """Map each value to a categorical code, growing the code table as needed."""
+    return [table.setdefault(value, len(table)) for value in values]
+
+
+class RecipeBatch:
+    """
+    Many recipes packed into flat columns.
+
+    All ingredient amounts live in one float64 array, with ``offsets[i]`` to
+    ``offsets[i + 1]`` delimiting the ingredients of recipe ``i``. Missing
+    amounts are stored as NaN. Units and names are interned as integer
+    codes into the ``units`` and ``names`` tables.
+
+    The source recipes are kept as templates and are only copied when a
+    scaled recipe is materialized.
+
+    Example:
+        batch = RecipeBatch.from_recipes(recipes)
+        scaled = batch.scale(range(1, 201))
+        recipe = scaled.recipe(0, servings=8)
+    """
+
+    def __init__(self, recipes: list[Recipe]):
+        self._recipes = recipes
+
+        units: dict[str | None, int] = {}
+        names: dict[str | None, int] = {}
+        amounts, unit_codes, name_codes, counts = [], [], [], []
+        for recipe in recipes:
+            ingredients = recipe.ingredients
+            counts.append(len(ingredients))
+            amounts.extend(
+                np.nan if ingredient.amount is None else ingredient.amount
+                for ingredient in ingredients
+            )
+            unit_codes.extend(_intern((i.unit for i in ingredients), units))
+            name_codes.extend(_intern((i.name for i in ingredients), names))
+
+        self.servings = np.fromiter((r.servings for r in recipes), dtype=np.float64, count=len(recipes))
+        self.offsets = np.zeros(len(recipes) + 1, dtype=np.intp)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.amounts = np.asarray(amounts, dtype=np.float64)
+        self.unit_codes = np.asarray(unit_codes, dtype=np.int32)
+        self.name_codes = np.asarray(name_codes, dtype=np.int32)
+        self.units: list[str] = list(units)
+        self.names: list[str] = list(names)
+
+        # Recipe index of every ingredient, for broadcasting per-recipe factors
+        self.recipe_index = np.repeat(np.arange(len(recipes)), counts)
+
+    @classmethod
+    def from_recipes(cls, recipes: Iterable[Recipe]) -> "RecipeBatch":
+        """Pack recipes into a batch."""
+        return cls(list(recipes))
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def ingredient_slice(self, index: int) -> slice:
+        """Return the slice of the ingredient columns belonging to a recipe."""
+        return slice(self.offsets[index], self.offsets[index + 1])
+
+    def scale(self, targets: Iterable[int]) -> "ScaledRecipeBatch":
+        """
+        Scale every recipe to every serving target in one vectorized pass.
+
+        Args:
+            targets: Target numbers of servings
+
+        Returns:
+            A ScaledRecipeBatch whose ``amounts[t]`` holds all ingredient
+            amounts scaled to ``targets[t]`` servings
+
+        Raises:
+            ValueError: If any target is not a positive whole number
+        """
+        # Checked before casting, which would truncate 2.5 to 2
+        targets = np.asarray([_check_servings(target) for target in targets], dtype=np.int64)
+
+        factors = targets[:, np.newaxis] / self.servings[np.newaxis, :]
+        amounts = factors[:, self.recipe_index] * self.amounts
+        return ScaledRecipeBatch(self, targets, amounts)
+
+
+class ScaledRecipeBatch:
+    """The result of RecipeBatch.scale: one row of amounts per serving target."""
+
+    def __init__(self, batch: RecipeBatch, targets, amounts):
+        self.batch = batch
+        self.targets = targets
+        self.amounts = amounts
+        self._rows = {target: row for row, target in enumerate(targets.tolist())}
+
+    def recipe(self, index: int, servings: int) -> Recipe:
+        """
+        Materialize recipe ``index`` scaled to ``servings``.
+
+        Raises:
+            ValueError: If servings is not a positive whole number
+            KeyError: If ``servings`` was not one of the scaled targets
+        """
+        servings = _check_servings(servings)
+        amounts = self.amounts[self._rows[servings], self.batch.ingredient_slice(index)]
+        template = self.batch._recipes[index]
+        ingredients = [
+            _with_amount(ingredient, None if isnan(amount) else amount)
+            for ingredient, amount in zip(template.ingredients, amounts.tolist())
+        ]
+        return _with_ingredients(template, servings, ingredients)
+
+    def recipes(self, servings: int) -> Iterator[Recipe]:
+        """Materialize every recipe scaled to ``servings``, lazily."""
+        for index in range(len(self.batch)):
+            yield self.recipe(index, servings)
@@ -1,14 +1,22 @@
 """Core unit conversion functionality."""
 
-from lethimcook.units import (
-    CONVERSIONS,
-    UnitType,
-    get_unit_type,
-    normalize_unit,
-)
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING
 
+from lethimcook import metrics
+from lethimcook.density import crossing_scale
+from lethimcook.units import ResolvedUnit, UnitRegistry, UnitType, get_registry, readable_unit
 
-def convert(value: float, from_unit: str, to_unit: str) -> float:
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+# Unit types whose amounts may be displayed in a unit of the other type,
+# converting through the ingredient's density
+_CROSSABLE = {UnitType.VOLUME: UnitType.WEIGHT, UnitType.WEIGHT: UnitType.VOLUME}
+
+
+def convert(value: float, from_unit: str, to_unit: str, ingredient: str | None = None) -> float:
     """
     Convert a value from one unit to another.
 
@@ -16,61 +24,253 @@ def convert(value: float, from_unit: str, to_unit: str) -> float:
         value: The numeric value to convert
         from_unit: The source unit
         to_unit: The target unit
+        ingredient: Ingredient name; allows converting between volume and
+            weight using the ingredient's density
 
     Returns:
         The converted value
 
     Raises:
-        ValueError: If units are incompatible or unknown
+        ValueError: If units are incompatible or unknown, or the ingredient
+            is needed but has no known density
+
+    Example:
+        convert(2, "cups", "g", ingredient="flour")
+    """
+    registry = get_registry()
+    recorder = metrics.recorder
+    if recorder is None:
+        source = registry.resolve(from_unit)
+        target = registry.resolve(to_unit)
+    else:
+        with recorder.timer("units.resolve"):
+            source = registry.resolve(from_unit)
+            target = registry.resolve(to_unit)
+
+    if ingredient is not None and source.unit_type != target.unit_type:
+        return value * crossing_scale(ingredient, source, target)
+
+    # Precomputed from_unit -> to_unit factor (affine for temperature)
+    scale, offset = registry.transform(source.unit_id, target.unit_id)
+
+    return value * scale + offset
+
+
+def convert_exact(
+    value: "float | Fraction", from_unit: str, to_unit: str, ingredient: str | None = None
+) -> "Fraction":
+    """
+    Convert a value exactly, as a Fraction.
+
+    Like convert, but the value and the conversion factors are rational, so
+    chained conversions never drift. Floats are read as the fraction or
+    decimal they represent (see lethimcook.exact.as_fraction).
+
+    Raises:
+        ValueError: If units are incompatible or unknown, or the ingredient
+            is needed but has no known density
+
+    Example:
+        convert_exact(212, "f", "c")  # Fraction(100, 1)
     """
-    from_unit = normalize_unit(from_unit)
-    to_unit = normalize_unit(to_unit)
+    from lethimcook.exact import as_fraction
 
-    # Get unit types
-    from_type = get_unit_type(from_unit)
-    to_type = get_unit_type(to_unit)
+    registry = get_registry()
+    source = registry.resolve(from_unit)
+    target = registry.resolve(to_unit)
+    if ingredient is not None and source.unit_type != target.unit_type:
+        return as_fraction(value) * crossing_scale(ingredient, source, target, exact=True)
+    scale, offset = registry.exact_transform(source.unit_id, target.unit_id)
+    return as_fraction(value) * scale + offset
 
-    # Check compatibility
-    if from_type != to_type:
+
+def convert_many(
+    values: Sequence[float] | array,
+    from_unit: str | Sequence[str],
+    to_unit: str | Sequence[str],
+    ingredient: str | None = None,
+):
+    """
+    Convert many values at once.
+
+    Units are resolved once per distinct unit pair and applied to the whole
+    column as ``value * scale + offset`` (offset is only non-zero for
+    temperature). Either unit may be a single string or a sequence with one
+    unit per row; rows are then grouped by unit pair.
+
+    Args:
+        values: A NumPy array, sequence or ``array.array`` of numbers
+        from_unit: The source unit, or one source unit per row
+        to_unit: The target unit, or one target unit per row
+        ingredient: Ingredient name for volume/weight conversions, as in
+            convert; applies to every row
+
+    Returns:
+        A float64 ``numpy.ndarray`` when NumPy is installed, otherwise an
+        ``array.array("d")``
+
+    Raises:
+        ValueError: If units are incompatible or unknown, or if a per-row
+            unit sequence does not match the length of ``values``
+
+    Example:
+        convert_many([1, 2, 3], "cups", "ml")
+        convert_many([1, 350], ["cup", "f"], ["ml", "c"])
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return _convert_many_python(values, from_unit, to_unit, ingredient)
+
+    data = np.asarray(values, dtype=np.float64)
+
+    if isinstance(from_unit, str) and isinstance(to_unit, str):
+        scale, offset = _affine(from_unit, to_unit, ingredient)
+        result = data * scale
+        if offset:
+            result += offset
+        return result
+
+    from_codes, from_names = _unit_codes(np, from_unit, len(data))
+    to_codes, to_names = _unit_codes(np, to_unit, len(data))
+
+    # One code per (from, to) combination, then resolve each distinct pair once
+    pair_codes = from_codes * len(to_names) + to_codes
+    pairs, pair_index = np.unique(pair_codes, return_inverse=True)
+    scales = np.empty(len(pairs), dtype=np.float64)
+    offsets = np.empty(len(pairs), dtype=np.float64)
+    for i, code in enumerate(pairs.tolist()):
+        f, t = divmod(code, len(to_names))
+        scales[i], offsets[i] = _affine(from_names[f], to_names[t], ingredient)
+
+    return data * scales[pair_index] + offsets[pair_index]
+
+
+def _unit_codes(np, units: str | Sequence[str], length: int):
+    """Encode a unit or per-row units as integer codes plus the code table."""
+    if isinstance(units, str):
+        return np.zeros(length, dtype=np.intp), [units]
+    if len(units) != length:
         raise ValueError(
-            f"Cannot convert between {from_type} and {to_type}"
+            f"Expected {length} units, got {len(units)}"
         )
+    names, codes = np.unique(np.asarray(units, dtype=str), return_inverse=True)
+    return codes.reshape(-1), names.tolist()
 
-    # Handle temperature separately (non-linear conversion)
-    if from_type == UnitType.TEMPERATURE:
-        return _convert_temperature(value, from_unit, to_unit)
 
-    # Handle count (no conversion needed)
-    if from_type == UnitType.COUNT:
-        return value
+def _convert_many_python(
+    values: Sequence[float] | array,
+    from_unit: str | Sequence[str],
+    to_unit: str | Sequence[str],
+    ingredient: str | None = None,
+) -> array:
+    """Pure-Python fallback for convert_many when NumPy is unavailable."""
+    if isinstance(from_unit, str) and isinstance(to_unit, str):
+        scale, offset = _affine(from_unit, to_unit, ingredient)
+        return array("d", [v * scale + offset for v in values])
 
-    # Convert: from_unit -> base_unit -> to_unit
-    base_value = value * CONVERSIONS[from_unit]
-    result = base_value / CONVERSIONS[to_unit]
+    length = len(values)
+    from_units = [from_unit] * length if isinstance(from_unit, str) else from_unit
+    to_units = [to_unit] * length if isinstance(to_unit, str) else to_unit
+    for units in (from_units, to_units):
+        if len(units) != length:
+            raise ValueError(f"Expected {length} units, got {len(units)}")
 
+    transforms = {}
+    result = array("d", bytes(8 * length))
+    for i, (value, f, t) in enumerate(zip(values, from_units, to_units)):
+        pair = (f, t)
+        if pair not in transforms:
+            transforms[pair] = _affine(f, t, ingredient)
+        scale, offset = transforms[pair]
+        result[i] = value * scale + offset
     return result
 
 
-def _convert_temperature(value: float, from_unit: str, to_unit: str) -> float:
-    """Convert temperature between different scales."""
-    # First convert to Celsius
-    match from_unit:
-        case "celsius" | "c":
-            celsius = value
-        case "fahrenheit" | "f":
-            celsius = (value - 32) * 5 / 9
-        case "kelvin" | "k":
-            celsius = value - 273.15
-        case _:
-            raise ValueError(f"Unknown temperature unit: {from_unit}")
-
-    # Then convert from Celsius to target
-    match to_unit:
-        case "celsius" | "c":
-            return celsius
-        case "fahrenheit" | "f":
-            return celsius * 9 / 5 + 32
-        case "kelvin" | "k":
-            return celsius + 273.15
-        case _:
-            raise ValueError(f"Unknown temperature unit: {to_unit}")
+def _affine(from_unit: str, to_unit: str, ingredient: str | None = None) -> tuple[float, float]:
+    """Resolve a unit pair to (scale, offset) such that result = value * scale + offset."""
+    registry = get_registry()
+    source = registry.resolve(from_unit)
+    target = registry.resolve(to_unit)
+    if ingredient is not None and source.unit_type != target.unit_type:
+        return crossing_scale(ingredient, source, target), 0.0
+    return registry.transform(source.unit_id, target.unit_id)
+
+
+def _display_targets(
+    registry: UnitRegistry, display_units: Mapping[UnitType, str]
+) -> dict[UnitType, tuple[str, ResolvedUnit]]:
+    """
+    Resolve a unit type -> display unit mapping.
+
+    Volume may be displayed in a weight unit and vice versa. Unit IDs are
+    only meaningful within ``registry``, so pass the same registry to
+    _to_display_unit.
+
+    Raises:
+        ValueError: If a display unit is unknown or of an unrelated type
+    """
+    targets = {}
+    for unit_type, unit in display_units.items():
+        target = registry.resolve(unit)
+        if target.unit_type != unit_type and target.unit_type != _CROSSABLE.get(unit_type):
+            raise ValueError(f"Display unit {unit} is not a {unit_type} unit")
+        targets[unit_type] = (unit, target)
+    return targets
+
+
+def _to_display_unit(
+    registry: UnitRegistry,
+    amount: float,
+    unit: str,
+    ingredient: str,
+    targets: Mapping[UnitType, tuple[str, ResolvedUnit]],
+) -> tuple[float, str]:
+    """
+    Express an amount in the display unit for its type.
+
+    Amounts in unknown units, in types without a display unit, or that
+    would need the density of an unknown ingredient are returned unchanged.
+    """
+    try:
+        source = registry.resolve(unit)
+    except ValueError:
+        return amount, unit
+    display = targets.get(source.unit_type)
+    if display is None:
+        return amount, unit
+    target_unit, target = display
+    if target.unit_type == source.unit_type:
+        return registry.convert(amount, source.unit_id, target.unit_id), target_unit
+    try:
+        return amount * crossing_scale(ingredient, source, target), target_unit
+    except ValueError:
+        return amount, unit
+
+
+def _scale_exact(
+    amount: "float | Fraction",
+    factor: "Fraction",
+    unit: str,
+    ingredient: str,
+    targets: Mapping[UnitType, tuple[str, ResolvedUnit]] | None,
+    normalize_units: bool,
+    registry: UnitRegistry,
+) -> tuple["Fraction", str]:
+    """
+    Scale an amount exactly, then apply display units and normalization.
+
+    The target unit is chosen with the float helpers, then the amount is
+    converted to it exactly in one step.
+    """
+    from lethimcook.exact import as_fraction
+
+    scaled = as_fraction(amount) * factor
+    approximate, target = float(scaled), unit
+    if targets:
+        approximate, target = _to_display_unit(registry, approximate, target, ingredient, targets)
+    if normalize_units:
+        _, target = readable_unit(approximate, target)
+    if target != unit:
+        scaled = convert_exact(scaled, unit, target, ingredient=ingredient)
+    return scaled, target
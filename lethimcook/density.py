@@ -0,0 +1,428 @@
+"""
+Ingredient densities for converting between volume and weight.
+
+Densities are in grams per milliliter, measured the way the ingredient is
+usually portioned in a home kitchen (flour spooned and leveled, brown
+sugar packed, nuts chopped). Names are matched loosely: case, punctuation and
+plural ``s`` are ignored, preparation words are skipped ("sifted cake
+flour" finds "cake flour") and small spelling differences are tolerated
+through a trigram index. Descriptions that only share a word with a known
+name ("sugar snap peas"), are part of several names ("coconut") or are
+about as close to two names are left unmatched rather than guessed. Every lookup goes through an LRU cache, so
+repeated names cost a single dict lookup after the first call.
+
+Example:
+    from lethimcook import convert
+
+    convert(2, "cups", "g", ingredient="flour")  # 250.3
+"""
+
+import re
+import threading
+from collections import Counter
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+from typing import NamedTuple
+
+from lethimcook.units import DEFAULT_CACHE_SIZE, ResolvedUnit, UnitType
+
+# Grams per milliliter
+DENSITIES: Mapping[str, float] = {
+    # Flours and starches
+    "flour": 0.529,
+    "all-purpose flour": 0.529,
+    "bread flour": 0.550,
+    "cake flour": 0.486,
+    "pastry flour": 0.448,
+    "self-rising flour": 0.486,
+    "whole wheat flour": 0.507,
+    "rye flour": 0.431,
+    "spelt flour": 0.423,
+    "almond flour": 0.406,
+    "coconut flour": 0.473,
+    "rice flour": 0.634,
+    "buckwheat flour": 0.507,
+    "chickpea flour": 0.389,
+    "cornmeal": 0.583,
+    "cornstarch": 0.507,
+    "potato starch": 0.676,
+    "tapioca starch": 0.507,
+    "semolina": 0.706,
+    "polenta": 0.689,
+    # Sugars and syrups
+    "sugar": 0.845,
+    "granulated sugar": 0.845,
+    "caster sugar": 0.845,
+    "brown sugar": 0.899,
+    "powdered sugar": 0.507,
+    "confectioners sugar": 0.507,
+    "icing sugar": 0.507,
+    "coconut sugar": 0.676,
+    "honey": 1.420,
+    "maple syrup": 1.330,
+    "corn syrup": 1.390,
+    "golden syrup": 1.420,
+    "molasses": 1.420,
+    "agave syrup": 1.390,
+    # Fats
+    "butter": 0.959,
+    "margarine": 0.959,
+    "shortening": 0.811,
+    "lard": 0.870,
+    "oil": 0.920,
+    "vegetable oil": 0.920,
+    "olive oil": 0.910,
+    "canola oil": 0.920,
+    "coconut oil": 0.920,
+    "sesame oil": 0.920,
+    # Dairy and eggs
+    "water": 1.000,
+    "milk": 1.030,
+    "buttermilk": 1.030,
+    "heavy cream": 1.010,
+    "whipping cream": 1.010,
+    "half and half": 1.020,
+    "sour cream": 1.010,
+    "yogurt": 1.040,
+    "greek yogurt": 1.070,
+    "cream cheese": 0.980,
+    "ricotta": 1.040,
+    "evaporated milk": 1.070,
+    "sweetened condensed milk": 1.290,
+    "coconut milk": 0.980,
+    "grated parmesan": 0.423,
+    "shredded cheddar": 0.477,
+    "shredded mozzarella": 0.477,
+    "egg": 1.030,
+    "egg white": 1.030,
+    "egg yolk": 1.030,
+    # Leavening, salt and spices
+    "salt": 1.217,
+    "table salt": 1.217,
+    "kosher salt": 0.575,
+    "sea salt": 1.217,
+    "baking soda": 0.933,
+    "baking powder": 0.811,
+    "yeast": 0.639,
+    "instant yeast": 0.639,
+    "cocoa powder": 0.359,
+    "ground cinnamon": 0.528,
+    "ground ginger": 0.365,
+    "ground cumin": 0.426,
+    "paprika": 0.467,
+    "black pepper": 0.467,
+    "vanilla extract": 0.880,
+    # Grains, legumes and cereals
+    "rice": 0.782,
+    "white rice": 0.782,
+    "brown rice": 0.782,
+    "oats": 0.380,
+    "rolled oats": 0.380,
+    "quinoa": 0.719,
+    "couscous": 0.735,
+    "lentils": 0.812,
+    "dried chickpeas": 0.845,
+    "breadcrumbs": 0.465,
+    "panko": 0.211,
+    # Nuts, seeds and dried fruit
+    "chopped walnuts": 0.507,
+    "walnuts": 0.423,
+    "pecans": 0.423,
+    "almonds": 0.600,
+    "sliced almonds": 0.389,
+    "peanuts": 0.600,
+    "hazelnuts": 0.600,
+    "pine nuts": 0.571,
+    "sesame seeds": 0.609,
+    "chia seeds": 0.676,
+    "ground flaxseed": 0.444,
+    "sunflower seeds": 0.592,
+    "shredded coconut": 0.359,
+    "raisins": 0.634,
+    "dried cranberries": 0.507,
+    "chocolate chips": 0.719,
+    "peanut butter": 1.090,
+    "tahini": 1.020,
+    # Sauces and liquids
+    "lemon juice": 1.030,
+    "lime juice": 1.030,
+    "orange juice": 1.040,
+    "vinegar": 1.010,
+    "soy sauce": 1.150,
+    "ketchup": 1.150,
+    "mayonnaise": 0.910,
+    "mustard": 1.050,
+    "stock": 1.010,
+    "broth": 1.010,
+    "wine": 0.990,
+    "beer": 1.010,
+    "coffee": 1.000,
+    "jam": 1.330,
+    # Produce
+    "blueberries": 0.626,
+    "strawberries": 0.634,
+    "chopped onion": 0.676,
+    "minced garlic": 0.575,
+    "spinach": 0.127,
+}
+
+# Lowest trigram similarity (Dice coefficient) accepted as a fuzzy match.
+# Set high enough that e.g. "chicken" does not match "chickpeas".
+_SIMILARITY = 0.6
+
+# Lead the best fuzzy match needs over the next name; closer than this the
+# query is ambiguous ("coconut oyl" scores 0.70 for coconut oil and 0.67 for
+# coconut milk)
+_SIMILARITY_MARGIN = 0.1
+
+
+# Preparation and descriptive words that may surround a known name without
+# changing its density ("2 large eggs, beaten", "cold unsalted butter")
+_MODIFIER_WORDS = """
+    sifted softened melted chopped diced minced sliced grated shredded ground
+    crushed cubed peeled rinsed drained beaten whisked cooled divided packed
+    heaping level leveled scant loosely firmly lightly finely roughly coarsely
+    thinly fresh freshly cold chilled warm hot room temperature unsalted salted
+    large small medium extra virgin light dark pure plain whole organic raw
+    toasted roasted unsweetened optional plus more for to taste of and or about
+"""
+
+
+class ResolvedIngredient(NamedTuple):
+    """An ingredient name resolved against a density table."""
+    name: str
+    density: float
+
+
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def _words(name: str) -> tuple[str, ...]:
+    """Normalize a name to words: lowercase, no punctuation, no plural s."""
+    return tuple(
+        word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word
+        for word in _SEPARATORS.sub(" ", name.lower()).split()
+    )
+
+
+_MODIFIERS = frozenset(_words(_MODIFIER_WORDS))
+
+
+def _trigrams(words: tuple[str, ...]) -> set[str]:
+    grams = set()
+    for word in words:
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class DensityTable:
+    """
+    Indexed ingredient density table.
+
+    Names are indexed three ways when the table is built: by normalized
+    name for exact lookups, by word for names embedded in a longer
+    description, and by trigram for near misses. Resolution tries them in
+    that order and caches the result per raw name.
+    """
+
+    def __init__(self, densities: Mapping[str, float], cache_size: int | None = DEFAULT_CACHE_SIZE):
+        entries: dict[tuple[str, ...], ResolvedIngredient] = {}
+        for name, density in densities.items():
+            if isinstance(density, bool) or not isinstance(density, (int, float)) or density <= 0:
+                raise ValueError(f"Invalid density for {name!r}: must be a positive number")
+            entries[_words(name)] = ResolvedIngredient(name, float(density))
+        self.entries: Mapping[tuple[str, ...], ResolvedIngredient] = MappingProxyType(entries)
+
+        by_word: dict[str, list[tuple[str, ...]]] = {}
+        by_trigram: dict[str, list[tuple[str, ...]]] = {}
+        trigram_counts: dict[tuple[str, ...], int] = {}
+        for key in entries:
+            for word in set(key):
+                by_word.setdefault(word, []).append(key)
+            grams = _trigrams(key)
+            trigram_counts[key] = len(grams)
+            for gram in grams:
+                by_trigram.setdefault(gram, []).append(key)
+
+        # Indexes are frozen once built so lookups never need a lock
+        self._by_word = MappingProxyType({w: tuple(keys) for w, keys in by_word.items()})
+        self._by_trigram = MappingProxyType({g: tuple(keys) for g, keys in by_trigram.items()})
+        self._trigram_counts = MappingProxyType(trigram_counts)
+
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.match(name) is not None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _find(self, words: tuple[str, ...]) -> tuple[str, ...] | None:
+        if words in self.entries:
+            return words
+
+        # Known names whose words all appear in the query. Once any name is
+        # embedded in the query the fuzzy index is not consulted, so "sugar
+        # snap peas" is unknown rather than a near miss for something else.
+        present = set(words)
+        contained = {
+            key
+            for word in present
+            for key in self._by_word.get(word, ())
+            if present.issuperset(key)
+        }
+        if contained:
+            return self._best_contained(contained, words)
+
+        # A query that is part of several names ("coconut": coconut oil,
+        # coconut milk, shredded coconut) could mean any of them
+        if words:
+            extending = [key for key in self._by_word.get(words[0], ()) if present.issubset(key)]
+            if len(extending) > 1:
+                return None
+
+        # Closest name by trigram overlap, if clearly closer than the next
+        grams = _trigrams(words)
+        shared = Counter(key for gram in grams for key in self._by_trigram.get(gram, ()))
+        scores = sorted(
+            (
+                (2 * common / (len(grams) + self._trigram_counts[key]), key)
+                for key, common in shared.items()
+            ),
+            reverse=True,
+        )
+        if not scores or scores[0][0] < _SIMILARITY:
+            return None
+        if len(scores) > 1 and scores[0][0] - scores[1][0] < _SIMILARITY_MARGIN:
+            return None
+        return scores[0][1]
+
+    def _best_contained(
+        self, keys: set[tuple[str, ...]], words: tuple[str, ...]
+    ) -> tuple[str, ...] | None:
+        """
+        Pick the known name a longer description refers to, or None.
+
+        A name qualifies if the query's other words are numbers, modifiers
+        ("sifted", "unsalted") or fewer than the name's own. Qualifying names are
+        ranked by whether they contain the query's last non-modifier word,
+        which in English names the ingredient ("rice wine" is wine), then by
+        length. A tie between different names is ambiguous and matches
+        nothing, so the outcome never depends on set iteration order.
+        """
+        words = tuple(word for word in words if not word.isdigit())
+        head = next((word for word in reversed(words) if word not in _MODIFIERS), None)
+        ranked = []
+        for key in keys:
+            rest = [word for word in words if word not in key]
+            if len(rest) > len(words) - len(rest) and not _MODIFIERS.issuperset(rest):
+                continue
+            ranked.append(((head in key, len(key), sum(map(len, key))), key))
+        if not ranked:
+            return None
+        ranked.sort(reverse=True)
+        if len(ranked) > 1 and ranked[0][0] == ranked[1][0]:
+            return None
+        return ranked[0][1]
+
+    def _resolve(self, name: str) -> ResolvedIngredient:
+        key = self._find(_words(name))
+        if key is None:
+            raise ValueError(f"Unknown ingredient: {name}")
+        return self.entries[key]
+
+    def match(self, name: str) -> str | None:
+        """Return the table name an ingredient resolves to, or None."""
+        try:
+            return self.resolve(name).name
+        except ValueError:
+            return None
+
+    def density(self, name: str) -> float:
+        """
+        Return an ingredient's density in grams per milliliter.
+
+        Raises:
+            ValueError: If no table entry matches the name
+        """
+        return self.resolve(name).density
+
+    def cache_info(self):
+        """Return hits, misses, maxsize and currsize of the lookup cache."""
+        return self.resolve.cache_info()
+
+
+_table: DensityTable | None = None
+_custom_densities: dict[str, float] = {}
+_table_lock = threading.Lock()
+
+
+def get_density_table() -> DensityTable:
+    """Return the active density table, building it on first use."""
+    global _table
+    table = _table
+    if table is None:
+        with _table_lock:
+            if _table is None:
+                _table = DensityTable({**DENSITIES, **_custom_densities})
+            table = _table
+    return table
+
+
+def register_densities(densities: Mapping[str, float], *, replace: bool = False) -> DensityTable:
+    """
+    Add or override ingredient densities, in grams per milliliter.
+
+    As with register_units, a new table is built and swapped in atomically.
+
+    Args:
+        densities: Ingredient name -> density
+        replace: Drop previously registered densities first
+
+    Raises:
+        ValueError: If a density is not a positive number
+    """
+    global _table, _custom_densities
+    with _table_lock:
+        custom = {**({} if replace else _custom_densities), **densities}
+        table = DensityTable({**DENSITIES, **custom})
+        _table, _custom_densities = table, custom
+    return table
+
+
+def ingredient_density(name: str) -> float:
+    """Return an ingredient's density in grams per milliliter."""
+    return get_density_table().density(name)
+
+
+def crossing_scale(
+    ingredient: str, source: ResolvedUnit, target: ResolvedUnit, exact: bool = False
+) -> float:
+    """
+    Return the factor converting ``source`` to ``target`` through density.
+
+    With ``exact`` the factor is a Fraction (see lethimcook.exact).
+
+    Raises:
+        ValueError: If the units are not one volume and one weight unit, or
+            the ingredient is unknown
+    """
+    if source.unit_type == UnitType.VOLUME and target.unit_type == UnitType.WEIGHT:
+        to_weight = True
+    elif source.unit_type == UnitType.WEIGHT and target.unit_type == UnitType.VOLUME:
+        to_weight = False
+    else:
+        raise ValueError(f"Cannot convert between {source.unit_type} and {target.unit_type}")
+
+    density = get_density_table().density(ingredient)
+    if exact:
+        from lethimcook.exact import as_fraction
+
+        source_scale, density, target_scale = map(as_fraction, (source.scale, density, target.scale))
+    else:
+        source_scale, target_scale = source.scale, target.scale
+    if to_weight:
+        return source_scale * density / target_scale
+    return source_scale / density / target_scale
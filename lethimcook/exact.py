@@ -0,0 +1,45 @@
+"""
+Exact rational amounts for drift-free conversion and scaling.
+
+Floats are turned into Fractions the way a cook would read them: a value
+that is exactly the float of a simple fraction (such as ``1 / 3``, which
+the ingredient parser produces for "1/3") becomes that fraction, and any
+other value becomes the decimal it prints as, so ``0.1`` is 1/10 rather
+than the binary approximation. Conversions are memoized, so the common
+cooking amounts cost a cache lookup.
+
+The unit registry also folds its float conversion factors through
+as_fraction, so they are rounded once rather than at every step.
+"""
+
+from fractions import Fraction
+from functools import lru_cache
+
+from lethimcook.units import DEFAULT_CACHE_SIZE
+
+# Largest denominator recognized as a cooking fraction (1/16 tsp)
+MAX_DENOMINATOR = 16
+
+
+@lru_cache(maxsize=DEFAULT_CACHE_SIZE)
+def _float_fraction(value: float) -> Fraction:
+    simple = Fraction(value).limit_denominator(MAX_DENOMINATOR)
+    if float(simple) == value:
+        return simple
+    return Fraction(repr(value))
+
+
+def as_fraction(value: float | Fraction) -> Fraction:
+    """
+    Return a number as an exact Fraction.
+
+    Example:
+        as_fraction(1 / 3)   # Fraction(1, 3)
+        as_fraction(0.1)     # Fraction(1, 10)
+        as_fraction(4.92892) # Fraction(123223, 25000)
+    """
+    if isinstance(value, Fraction):
+        return value
+    if isinstance(value, int):
+        return Fraction(value)
+    return _float_fraction(float(value))
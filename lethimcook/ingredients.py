@@ -0,0 +1,143 @@
+"""
+Parser for free-text ingredient lines.
+
+Turns lines such as "1 1/2 cups all-purpose flour, sifted" into
+IngredientRecords. Amounts may be integers, decimals, fractions, mixed
+numbers, unicode vulgar fractions ("1½", "¾") and ranges ("2-3", "1 to 2");
+a range keeps its lower bound as the amount and its upper bound as the
+``amount_max`` extra field. Units are any alias known to the active unit
+registry, including units added with register_units. Text after the first
+comma, and anything in parentheses, becomes the note.
+
+Example:
+    parse_ingredient("1 1/2 cups all-purpose flour, sifted")
+    # IngredientRecord(amount=1.5, unit='cups', name='all-purpose flour', note='sifted')
+"""
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+from lethimcook.records import IngredientRecord
+from lethimcook.units import UnitType, get_registry
+
+# Vulgar fractions become " n/d" so "1½" reads as the mixed number "1 1/2";
+# dashes and the fraction slash are folded to ASCII
+_TRANSLATION = str.maketrans({
+    "½": " 1/2", "⅓": " 1/3", "⅔": " 2/3", "¼": " 1/4", "¾": " 3/4",
+    "⅕": " 1/5", "⅖": " 2/5", "⅗": " 3/5", "⅘": " 4/5", "⅙": " 1/6",
+    "⅚": " 5/6", "⅛": " 1/8", "⅜": " 3/8", "⅝": " 5/8", "⅞": " 7/8",
+    "⁄": "/", "–": "-", "—": "-",
+})
+
+_NUMBER = r"\d+\s+\d+/\d+|\d+/\d+|\d*\.\d+|\d+"
+
+_LINE = re.compile(
+    rf"\s*(?:(?P<low>{_NUMBER})(?:\s*(?:-|to|or)\s*(?P<high>{_NUMBER}))?\s*)?"
+    r"(?P<rest>.*)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+_PARENTHESES = re.compile(r"\s*\(([^)]*)\)")
+
+# Longest unit alias tried, in words ("fluid ounces" is two)
+_MAX_UNIT_WORDS = 3
+
+# Unit used when a line has an amount but no unit ("3 eggs")
+COUNT_UNIT = "count"
+
+
+def _number(text: str) -> float:
+    """Evaluate an integer, decimal, fraction or mixed number."""
+    whole, _, fraction = text.rpartition(" ")
+    if "/" in fraction:
+        numerator, denominator = fraction.split("/")
+        value = int(numerator) / int(denominator)
+        return value + int(whole) if whole else value
+    return float(text)
+
+
+def parse_ingredient(line: str) -> IngredientRecord:
+    """
+    Parse one ingredient line.
+
+    Lines without an amount ("salt to taste") get amount None and an empty
+    unit; lines with an amount but no known unit ("3 eggs") get the
+    ``count`` unit. Temperature aliases such as "c" are never taken as units.
+
+    Raises:
+        ValueError: If the line is empty, has no ingredient name, or has a
+            zero denominator
+    """
+    match = _LINE.match(line.translate(_TRANSLATION))
+    low, high, rest = match.group("low", "high", "rest")
+
+    notes = []
+    if "(" in rest:
+        notes = _PARENTHESES.findall(rest)
+        rest = _PARENTHESES.sub("", rest)
+    name, comma, note = rest.partition(",")
+    if comma:
+        notes.append(note)
+
+    words = name.split()
+    unit = ""
+    if low is not None:
+        unit = COUNT_UNIT
+        registry = get_registry()
+        ids, types = registry.ids, registry.types
+        for end in range(min(_MAX_UNIT_WORDS, len(words)), 0, -1):
+            candidate = " ".join(words[:end]).rstrip(".")
+            unit_id = ids.get(candidate.lower())
+            if unit_id is not None and types[unit_id] != UnitType.TEMPERATURE:
+                unit = candidate
+                words = words[end:]
+                if len(words) > 1 and words[0].lower() == "of":
+                    words = words[1:]
+                break
+
+    if not words:
+        if not line.strip():
+            raise ValueError("Empty ingredient line")
+        raise ValueError(f"No ingredient name in: {line.strip()}")
+
+    try:
+        amount = None if low is None else _number(low)
+        extra = None if high is None else {"amount_max": _number(high)}
+    except ZeroDivisionError:
+        raise ValueError(f"Invalid amount in: {line.strip()}") from None
+
+    note = ", ".join(n.strip() for n in notes if n.strip()) or None
+    return IngredientRecord(amount, unit, " ".join(words), note, extra)
+
+
+class UnparsedLine(NamedTuple):
+    """A line parse_ingredients could not parse, with its 1-based line number."""
+    number: int
+    line: str
+    error: str
+
+    def __str__(self) -> str:
+        return f"Line {self.number}: {self.error}"
+
+
+def parse_ingredients(lines: Iterable[str]) -> Iterator[IngredientRecord | UnparsedLine]:
+    """
+    Parse ingredient lines lazily, skipping blank lines.
+
+    A line that cannot be parsed yields an UnparsedLine in its place instead
+    of stopping the stream, so one bad line in a large feed costs only that
+    line.
+
+    Example:
+        for result in parse_ingredients(f):
+            if isinstance(result, UnparsedLine):
+                log.warning("%s", result)
+    """
+    for number, line in enumerate(lines, 1):
+        if not line or line.isspace():
+            continue
+        try:
+            yield parse_ingredient(line)
+        except ValueError as e:
+            yield UnparsedLine(number, line.rstrip("\n"), str(e))
@@ -0,0 +1,164 @@
+"""
+Opt-in instrumentation for the conversion hot paths.
+
+Instrumented code checks the module-level ``recorder`` and only times a
+stage when it is set, so the cost while disabled is one attribute read and
+a ``None`` check per call. Recorded stages:
+
+    natural.parse    matching a convert_natural query against the grammar
+    units.resolve    resolving raw unit strings in convert, convert_natural
+                     and get_unit_type
+    recipe.scale     a whole scale_recipe() call
+
+Example:
+    from lethimcook import metrics
+
+    registry = metrics.enable()
+    ...
+    print(registry.to_prometheus())
+    metrics.disable()
+"""
+
+import threading
+from bisect import bisect_left
+from collections.abc import Callable
+from time import perf_counter
+
+# Histogram bucket upper bounds, in seconds
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 0.1, 1.0,
+)
+
+Listener = Callable[[str, float, bool], None]
+
+
+class _Stage:
+    """Counters and latency histogram for one stage."""
+
+    __slots__ = ("count", "failures", "total", "buckets")
+
+    def __init__(self, bucket_count: int):
+        self.count = 0
+        self.failures = 0
+        self.total = 0.0
+        # One slot per bucket plus an overflow slot for +Inf
+        self.buckets = [0] * (bucket_count + 1)
+
+
+class _Timer:
+    """Context manager that records the duration of a block."""
+
+    __slots__ = ("_registry", "_stage", "_start")
+
+    def __init__(self, registry: "MetricsRegistry", stage: str):
+        self._registry = registry
+        self._stage = stage
+
+    def __enter__(self) -> "_Timer":
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self._registry.observe(self._stage, perf_counter() - self._start, exc_type is not None)
+
+
+class MetricsRegistry:
+    """Call counts, failure counts and latency histograms per stage."""
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._stages: dict[str, _Stage] = {}
+        self._listeners: list[Listener] = []
+        self._lock = threading.Lock()
+
+    def timer(self, stage: str) -> _Timer:
+        """Time a block as one call of ``stage``; an exception counts as a failure."""
+        return _Timer(self, stage)
+
+    def observe(self, stage: str, seconds: float, failed: bool = False) -> None:
+        """Record one call of ``stage`` and notify listeners."""
+        with self._lock:
+            metrics = self._stages.get(stage)
+            if metrics is None:
+                metrics = self._stages[stage] = _Stage(len(self.buckets))
+            metrics.count += 1
+            metrics.failures += failed
+            metrics.total += seconds
+            metrics.buckets[bisect_left(self.buckets, seconds)] += 1
+            listeners = tuple(self._listeners)
+        for listener in listeners:
+            listener(stage, seconds, failed)
+
+    def add_listener(self, listener: Listener) -> None:
+        """Call ``listener(stage, seconds, failed)`` after every observation."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        with self._lock:
+            self._listeners.remove(listener)
+
+    def reset(self) -> None:
+        """Forget all recorded observations."""
+        with self._lock:
+            self._stages.clear()
+
+    def to_dict(self) -> dict[str, dict]:
+        """
+        Export as plain data.
+
+        Returns:
+            Per stage: count, failures, total_seconds and a histogram mapping
+            each bucket upper bound (and "+Inf") to its cumulative count
+        """
+        with self._lock:
+            exported = {}
+            for stage, metrics in self._stages.items():
+                cumulative = 0
+                histogram = {}
+                for bound, count in zip((*self.buckets, "+Inf"), metrics.buckets):
+                    cumulative += count
+                    histogram[bound] = cumulative
+                exported[stage] = {
+                    "count": metrics.count,
+                    "failures": metrics.failures,
+                    "total_seconds": metrics.total,
+                    "histogram": histogram,
+                }
+            return exported
+
+    def to_prometheus(self, prefix: str = "lethimcook") -> str:
+        """Export in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per call of each stage.",
+            f"# TYPE {prefix}_stage_seconds histogram",
+        ]
+        stages = self.to_dict()
+        for stage, metrics in stages.items():
+            for bound, count in metrics["histogram"].items():
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {metrics["total_seconds"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{stage}"}} {metrics["count"]}')
+        lines.append(f"# HELP {prefix}_stage_failures_total Calls of each stage that raised.")
+        lines.append(f"# TYPE {prefix}_stage_failures_total counter")
+        for stage, metrics in stages.items():
+            lines.append(f'{prefix}_stage_failures_total{{stage="{stage}"}} {metrics["failures"]}')
+        return "\n".join(lines) + "\n"
+
+
+# The active registry, or None while instrumentation is disabled
+recorder: MetricsRegistry | None = None
+
+
+def enable(registry: MetricsRegistry | None = None) -> MetricsRegistry:
+    """Start recording into ``registry`` (a new one by default) and return it."""
+    global recorder
+    recorder = registry or MetricsRegistry()
+    return recorder
+
+
+def disable() -> None:
+    """Stop recording. Already-recorded data stays in the registry."""
+    global recorder
+    recorder = None
@@ -1,7 +1,160 @@
 """Natural language conversion utility using regex and string matching."""
 
 import re
-from lethimcook.converter import convert
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from math import isfinite
+from time import monotonic, perf_counter
+from typing import NamedTuple
+
+from lethimcook import metrics
+from lethimcook.density import crossing_scale, get_density_table
+from lethimcook.units import DEFAULT_CACHE_SIZE, ResolvedUnit, UnitRegistry, get_registry
+
+_NUMBER = r"\d+\.?\d*"
+
+# All supported phrasings in one grammar, tried left to right in a single scan.
+# Each alternative has its own named groups; the last group of the matching
+# alternative identifies which one it was.
+_QUERY = re.compile(
+    # "X unit to unit" or "X unit in unit"
+    rf"(?P<value>{_NUMBER})\s+(?P<from_unit>[a-z\s]+?)\s+(?:to|in)\s+(?P<to_unit>[a-z\s]+)"
+    # "convert X unit to unit"
+    rf"|convert\s+(?P<convert_value>{_NUMBER})\s+(?P<convert_from>[a-z\s]+?)"
+    rf"\s+to\s+(?P<convert_to>[a-z\s]+)"
+    # "how many unit in X unit"
+    rf"|how\s+many\s+(?P<how_many_to>[a-z\s]+?)\s+in\s+(?P<how_many_value>{_NUMBER})"
+    rf"\s+(?P<how_many_from>[a-z\s]+)"
+)
+
+# Last group of each alternative -> (value, from unit, to unit) group names
+_PHRASINGS = {
+    "to_unit": ("value", "from_unit", "to_unit"),
+    "convert_to": ("convert_value", "convert_from", "convert_to"),
+    "how_many_from": ("how_many_value", "how_many_from", "how_many_to"),
+}
+
+
+class ResultCacheInfo(NamedTuple):
+    """Statistics of a ResultCache."""
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    ttl: float | None
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of convert_natural results, with optional expiry.
+
+    Failures are cached too, as their error message, so repeated malformed
+    queries are rejected without being parsed again. Entries remember the
+    unit registry and density table they were computed against and are
+    ignored once either has been replaced by register_units or
+    register_densities.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        ttl: float | None = None,
+        clock: Callable[[], float] = monotonic,
+    ):
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Cache TTL must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # query -> (expiry time or None, tables, result, error message)
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def get(
+        self, query: str, tables: tuple
+    ) -> "tuple[NaturalConversion | None, str | None] | None":
+        """Return the cached (result, error) for a query, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(query)
+            if entry is not None:
+                expires, cached_tables, result, error = entry
+                if cached_tables == tables and (expires is None or self._clock() < expires):
+                    self._entries.move_to_end(query)
+                    self._hits += 1
+                    return result, error
+                del self._entries[query]
+                if cached_tables == tables:
+                    self._expirations += 1
+            self._misses += 1
+            return None
+
+    def put(
+        self, query: str, tables: tuple, result: "NaturalConversion | None", error: str | None
+    ) -> None:
+        """Store a result or an error message, evicting the oldest entry if full."""
+        expires = None if self.ttl is None else self._clock() + self.ttl
+        with self._lock:
+            self._entries[query] = (expires, tables, result, error)
+            self._entries.move_to_end(query)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def info(self) -> ResultCacheInfo:
+        with self._lock:
+            return ResultCacheInfo(
+                self._hits, self._misses, self.maxsize, len(self._entries),
+                self.ttl, self._evictions, self._expirations,
+            )
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+
+# The active result cache, or None while caching is disabled
+_result_cache: ResultCache | None = None
+
+
+def enable_result_cache(maxsize: int = DEFAULT_CACHE_SIZE, ttl: float | None = None) -> ResultCache:
+    """
+    Cache convert_natural results by normalized query text.
+
+    Args:
+        maxsize: Number of distinct queries kept; least recently used go first
+        ttl: Seconds an entry stays valid; None keeps entries until evicted
+
+    Returns:
+        The new cache, which replaces any previous one
+    """
+    global _result_cache
+    _result_cache = ResultCache(maxsize, ttl)
+    return _result_cache
+
+
+def disable_result_cache() -> None:
+    """Stop caching convert_natural results and drop the cache."""
+    global _result_cache
+    _result_cache = None
+
+
+def result_cache_info() -> ResultCacheInfo | None:
+    """Return statistics for the active result cache, or None if disabled."""
+    cache = _result_cache
+    return None if cache is None else cache.info()
 
 
 def _format_number(value: float) -> str:
@@ -11,6 +164,46 @@ def _format_number(value: float) -> str:
     return str(value)
 
 
+class NaturalConversion(NamedTuple):
+    """
+    A parsed and converted natural language query.
+
+    ``from_unit`` and ``to_unit`` are spelled as in the query, ``ingredient``
+    is set for queries such as "2 cups of flour to grams", and ``text`` is
+    the formatted answer that convert_natural returns.
+    """
+    value: float
+    from_unit: str
+    to_unit: str
+    result: float
+    ingredient: str | None
+    text: str
+
+
+def _resolve_with_ingredient(
+    registry: UnitRegistry, phrase: str
+) -> tuple[ResolvedUnit, str, str | None]:
+    """
+    Resolve "cups" or "cups of flour" to a unit, its spelling and an
+    optional ingredient.
+
+    The longest leading run of words that names a unit wins, so multi-word
+    units such as "fl oz" are kept together.
+    """
+    try:
+        return registry.resolve(phrase), phrase, None
+    except ValueError as e:
+        words = phrase.split()
+        for end in range(len(words) - 1, 0, -1):
+            unit = " ".join(words[:end])
+            if unit in registry:
+                rest = words[end:]
+                if rest[0] == "of" and len(rest) > 1:
+                    rest = rest[1:]
+                return registry.resolve(unit), unit, " ".join(rest)
+        raise e
+
+
 def convert_natural(text: str) -> str:
     """
     Convert using natural language input.
@@ -20,6 +213,10 @@ def convert_natural(text: str) -> str:
     - "convert 1.5 pounds to grams"
     - "how many ml in 3 teaspoons"
     - "5 fahrenheit to celsius"
+    - "2 cups of flour to grams" (volume <-> weight via ingredient density)
+
+    Case and runs of whitespace are ignored. Results are cached per
+    normalized query while enable_result_cache is active.
 
     Args:
         text: Natural language conversion request
@@ -30,39 +227,116 @@ def convert_natural(text: str) -> str:
     Raises:
         ValueError: If the input cannot be parsed
     """
-    text = text.lower().strip()
-
-    # Pattern 1: "X unit to unit" or "X unit in unit"
-    pattern1 = r"(\d+\.?\d*)\s+([a-z\s]+?)\s+(?:to|in)\s+([a-z\s]+)"
-    match = re.match(pattern1, text)
-    if match:
-        value = float(match.group(1))
-        from_unit = match.group(2).strip()
-        to_unit = match.group(3).strip()
-        result = convert(value, from_unit, to_unit)
-        return f"{_format_number(value)} {from_unit} = {result:.2f} {to_unit}"
-
-    # Pattern 2: "convert X unit to unit"
-    pattern2 = r"convert\s+(\d+\.?\d*)\s+([a-z\s]+?)\s+to\s+([a-z\s]+)"
-    match = re.match(pattern2, text)
-    if match:
-        value = float(match.group(1))
-        from_unit = match.group(2).strip()
-        to_unit = match.group(3).strip()
-        result = convert(value, from_unit, to_unit)
-        return f"{_format_number(value)} {from_unit} = {result:.2f} {to_unit}"
-
-    # Pattern 3: "how many unit in X unit"
-    pattern3 = r"how\s+many\s+([a-z\s]+?)\s+in\s+(\d+\.?\d*)\s+([a-z\s]+)"
-    match = re.match(pattern3, text)
-    if match:
-        to_unit = match.group(1).strip()
-        value = float(match.group(2))
-        from_unit = match.group(3).strip()
-        result = convert(value, from_unit, to_unit)
-        return f"{_format_number(value)} {from_unit} = {result:.2f} {to_unit}"
-
-    raise ValueError(
-        f"Could not parse conversion request: {text}\n"
-        "Try formats like: '2 cups to ml' or 'convert 1 pound to grams'"
+    return convert_natural_result(text).text
+
+
+def convert_natural_result(text: str) -> NaturalConversion:
+    """
+    Convert using natural language input, returning the parts of the answer.
+
+    Accepts the same queries as convert_natural and shares its cache.
+
+    Raises:
+        ValueError: If the input cannot be parsed
+
+    Example:
+        convert_natural_result("2 cups to ml").result  # 473.176
+    """
+    text = " ".join(text.lower().split())
+
+    cache = _result_cache
+    if cache is None:
+        return _convert_query(text)
+
+    tables = (get_registry(), get_density_table())
+    cached = cache.get(text, tables)
+    if cached is not None:
+        result, error = cached
+        if error is not None:
+            raise ValueError(error)
+        return result
+    try:
+        result = _convert_query(text)
+    except ValueError as e:
+        cache.put(text, tables, None, str(e))
+        raise
+    cache.put(text, tables, result, None)
+    return result
+
+
+def _convert_query(text: str) -> NaturalConversion:
+    """Parse and convert an already-normalized query."""
+    recorder = metrics.recorder
+    if recorder is None:
+        match = _QUERY.match(text)
+    else:
+        start = perf_counter()
+        match = _QUERY.match(text)
+        recorder.observe("natural.parse", perf_counter() - start, match is None)
+
+    if match is None:
+        raise ValueError(
+            f"Could not parse conversion request: {text}\n"
+            "Try formats like: '2 cups to ml' or 'convert 1 pound to grams'"
+        )
+
+    value_group, from_group, to_group = _PHRASINGS[match.lastgroup]
+    value = float(match[value_group])
+    if not isfinite(value):
+        raise ValueError(f"Number out of range: {match[value_group][:20]}...")
+    from_unit = match[from_group].strip()
+    to_unit = match[to_group].strip()
+
+    # Validate both units against the registry before converting
+    registry = get_registry()
+    if recorder is None:
+        source, unit, ingredient = _resolve_with_ingredient(registry, from_unit)
+        target = registry.resolve(to_unit)
+    else:
+        with recorder.timer("units.resolve"):
+            source, unit, ingredient = _resolve_with_ingredient(registry, from_unit)
+            target = registry.resolve(to_unit)
+    if ingredient is not None and source.unit_type != target.unit_type:
+        result = value * crossing_scale(ingredient, source, target)
+    else:
+        result = registry.convert(value, source.unit_id, target.unit_id)
+    if not isfinite(result):
+        raise ValueError(f"Result out of range converting {from_unit} to {to_unit}")
+
+    return NaturalConversion(
+        value,
+        unit,
+        to_unit,
+        result,
+        ingredient,
+        f"{_format_number(value)} {from_unit} = {result:.2f} {to_unit}",
     )
+
+
+def convert_natural_stream(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Convert line-delimited queries lazily, one result per query.
+
+    Lines are consumed one at a time, so memory use is constant regardless
+    of input size. Blank lines are skipped. A query that fails yields an
+    ``"Error: ..."`` line in its place instead of stopping the stream.
+
+    Args:
+        lines: Iterable of queries, e.g. an open file or ``sys.stdin``
+
+    Yields:
+        Formatted conversion results, in input order
+
+    Example:
+        with open("queries.txt") as f:
+            for result in convert_natural_stream(f):
+                print(result)
+    """
+    for line in lines:
+        query = line.strip()
+        if not query:
+            continue
+        try:
+            yield convert_natural(query)
+        except ValueError as e:
+            yield f"Error: {str(e).splitlines()[0]}"
@@ -0,0 +1,237 @@
+"""
+Multi-process recipe scaling for large JSONL catalogs.
+
+Streams a file with one recipe per line, fans chunks of lines out to a
+process pool that validates and scales them with the recipe models, and
+writes the results back in input order. At most ``max_in_flight`` chunks
+are pending at once, so memory stays bounded regardless of catalog size.
+
+Run with:
+    python -m lethimcook.pipeline recipes.jsonl scaled.jsonl --servings 8
+    python cli.py scale recipes.jsonl scaled.jsonl --servings 8
+"""
+
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from time import perf_counter
+from typing import BinaryIO
+
+from pydantic import ValidationError
+
+from lethimcook.recipe import Recipe, scale_recipe
+from lethimcook.records import _check_servings
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+@dataclass
+class PipelineStats:
+    """Record counts and per-stage timings of a pipeline run, in seconds.
+
+    Worker stages (validate, scale, serialize) are summed across processes,
+    so with several workers they can exceed the wall-clock time.
+    """
+    records: int = 0
+    errors: int = 0
+    chunks: int = 0
+    read: float = 0.0
+    validate: float = 0.0
+    scale: float = 0.0
+    serialize: float = 0.0
+    write: float = 0.0
+    wall: float = 0.0
+    workers: int = 0
+
+    def summary(self) -> str:
+        rate = self.records / self.wall if self.wall else 0.0
+        return (
+            f"{self.records} recipes ({self.errors} errors) in {self.wall:.2f}s "
+            f"with {self.workers or 'no'} workers, {rate:.0f} recipes/s\n"
+            f"  read {self.read:.2f}s  validate {self.validate:.2f}s  "
+            f"scale {self.scale:.2f}s  serialize {self.serialize:.2f}s  "
+            f"write {self.write:.2f}s"
+        )
+
+
+def scale_chunk(
+    lines: list[bytes], servings: int, normalize_units: bool = False, first_line: int = 1
+) -> tuple[bytes, int, int, tuple[float, float, float]]:
+    """
+    Validate, scale and serialize a chunk of JSONL recipe lines.
+
+    Blank lines are skipped and produce no output. Every other line produces
+    exactly one output line, in order; lines that fail to validate become an
+    ``{"error": ..., "line": n}`` object carrying the input line number.
+
+    Returns:
+        The output lines joined, the number of records and of errors, and
+        the time spent validating, scaling and serializing
+    """
+    output = []
+    records = errors = 0
+    validate = scale = serialize = 0.0
+    for number, line in enumerate(lines, first_line):
+        if not line.strip():
+            continue
+        records += 1
+        start = perf_counter()
+        try:
+            recipe = Recipe.model_validate_json(line)
+        except ValidationError as e:
+            validate += perf_counter() - start
+            errors += 1
+            message = "; ".join(
+                f"{'.'.join(map(str, error['loc'])) or 'recipe'}: {error['msg']}"
+                for error in e.errors(include_url=False)
+            )
+            error = {"error": message, "line": number}
+            output.append(json.dumps(error).encode())
+            continue
+        validated = perf_counter()
+        scaled = scale_recipe(recipe, servings, normalize_units=normalize_units)
+        scaled_at = perf_counter()
+        output.append(scaled.model_dump_json().encode())
+        done = perf_counter()
+
+        validate += validated - start
+        scale += scaled_at - validated
+        serialize += done - scaled_at
+
+    output.append(b"")
+    return b"\n".join(output), records, errors, (validate, scale, serialize)
+
+
+def _chunks(source: BinaryIO, chunk_size: int, stats: PipelineStats) -> Iterator[tuple[int, list[bytes]]]:
+    """Yield (first line number, lines) chunks from a binary stream."""
+    number = 1
+    while True:
+        start = perf_counter()
+        lines = list(islice(source, chunk_size))
+        stats.read += perf_counter() - start
+        if not lines:
+            return
+        yield number, lines
+        number += len(lines)
+
+
+def scale_jsonl(
+    source: BinaryIO,
+    destination: BinaryIO,
+    servings: int,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_in_flight: int | None = None,
+    normalize_units: bool = False,
+    executor: Executor | None = None,
+) -> PipelineStats:
+    """
+    Scale every recipe in a JSONL stream and write them in input order.
+
+    Args:
+        source: Binary stream with one JSON recipe per line
+        destination: Binary stream the scaled recipes are written to
+        servings: Target number of servings
+        workers: Worker processes; defaults to the CPU count, 0 runs in-process
+        chunk_size: Lines sent to a worker at a time
+        max_in_flight: Chunks pending at once; defaults to twice the workers
+        normalize_units: Passed through to scale_recipe
+        executor: Use this executor instead of creating a process pool
+
+    Returns:
+        Record counts and per-stage timings
+
+    Raises:
+        ValueError: If servings is not a positive whole number
+    """
+    # Checked here so a bad value fails before any chunk reaches a worker
+    servings = _check_servings(servings)
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    stats = PipelineStats(workers=workers)
+    started = perf_counter()
+    chunks = _chunks(source, chunk_size, stats)
+
+    def collect(result: tuple[bytes, int, int, tuple[float, float, float]]) -> None:
+        output, records, errors, (validate, scale, serialize) = result
+        start = perf_counter()
+        destination.write(output)
+        stats.write += perf_counter() - start
+        stats.records += records
+        stats.errors += errors
+        stats.chunks += 1
+        stats.validate += validate
+        stats.scale += scale
+        stats.serialize += serialize
+
+    if workers == 0 and executor is None:
+        for first_line, lines in chunks:
+            collect(scale_chunk(lines, servings, normalize_units, first_line))
+    else:
+        owned = executor is None
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        limit = max_in_flight or 2 * max(workers, 1)
+        pending: deque[Future] = deque()
+        try:
+            for first_line, lines in chunks:
+                if len(pending) >= limit:
+                    collect(pending.popleft().result())
+                pending.append(
+                    pool.submit(scale_chunk, lines, servings, normalize_units, first_line)
+                )
+            while pending:
+                collect(pending.popleft().result())
+        finally:
+            if owned:
+                pool.shutdown(cancel_futures=True)
+
+    stats.wall = perf_counter() - started
+    return stats
+
+
+def main(argv: Iterable[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Scale a JSONL recipe catalog")
+    parser.add_argument("input", help="JSONL file, or - for stdin")
+    parser.add_argument("output", help="JSONL file, or - for stdout")
+    parser.add_argument("--servings", type=int, required=True)
+    parser.add_argument("--workers", type=int, default=None, help="default: CPU count")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--normalize-units", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+        destination = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        stats = scale_jsonl(
+            source,
+            destination,
+            args.servings,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            normalize_units=args.normalize_units,
+        )
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if source is not sys.stdin.buffer:
+            source.close()
+        if destination is not sys.stdout.buffer:
+            destination.close()
+    print(stats.summary(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
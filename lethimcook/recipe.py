@@ -1,7 +1,21 @@
 """Recipe scaling utility."""
 
+from collections.abc import Iterable, Mapping
+from fractions import Fraction
+
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+from lethimcook import metrics
+from lethimcook.converter import _display_targets, _scale_exact, _to_display_unit
+from lethimcook.records import RecipeRecord, _check_servings, _copy_extra
+from lethimcook.units import (
+    BASE_UNITS,
+    UnitType,
+    get_registry,
+    normalize_unit,
+    readable_unit,
+)
+
 
 class Ingredient(BaseModel):
     """A recipe ingredient."""
@@ -30,17 +44,115 @@ class Recipe(BaseModel):
         return v
 
 
-def scale_recipe(recipe: Recipe, new_servings: int) -> Recipe:
+class ExactIngredient(Ingredient):
+    """An ingredient with an exact amount, as returned by exact scaling."""
+    amount: Fraction | None = None
+
+
+class ExactRecipe(Recipe):
+    """A recipe of ExactIngredients, as returned by scale_recipe(exact=True)."""
+    ingredients: list[ExactIngredient]
+
+
+# BaseModel's instance slots, set directly by _construct
+_new = object.__new__
+_set_dict = object.__setattr__
+_set_extra = BaseModel.__dict__["__pydantic_extra__"].__set__
+_set_fields_set = BaseModel.__dict__["__pydantic_fields_set__"].__set__
+_set_private = BaseModel.__dict__["__pydantic_private__"].__set__
+
+
+def _construct(model: type[BaseModel], values: dict, fields_set: set[str], extra: dict | None):
+    """
+    Build a model instance from already-validated state, without validation.
+
+    Sets the same instance attributes as ``BaseModel.__copy__``; much
+    cheaper than model_construct, which re-applies defaults and sorts out
+    extras field by field.
+    """
+    instance = _new(model)
+    _set_dict(instance, "__dict__", values)
+    _set_extra(instance, extra)
+    _set_fields_set(instance, fields_set)
+    _set_private(instance, None)
+    return instance
+
+
+def _with_amount(
+    ingredient: Ingredient,
+    amount: float | Fraction | None,
+    unit: str | None = None,
+    model: type[Ingredient] = Ingredient,
+) -> Ingredient:
+    """
+    Copy an already-validated ingredient with a new amount (and unit).
+
+    Nothing is re-validated. Extra fields are copied as in _copy_extra, so
+    the copy shares no mutable state with the source.
+    """
+    values = ingredient.__dict__.copy()
+    values["amount"] = amount
+    if unit is not None:
+        values["unit"] = unit
+    return _construct(
+        model,
+        values,
+        set(ingredient.__pydantic_fields_set__),
+        _copy_extra(ingredient.__pydantic_extra__) or {},
+    )
+
+
+def _with_ingredients(
+    recipe: Recipe,
+    servings: int,
+    ingredients: list[Ingredient],
+    model: type[Recipe] = Recipe,
+) -> Recipe:
+    """Copy an already-validated recipe with new servings and ingredients, as _with_amount."""
+    values = recipe.__dict__.copy()
+    values["servings"] = servings
+    values["ingredients"] = ingredients
+    return _construct(
+        model,
+        values,
+        set(recipe.__pydantic_fields_set__),
+        _copy_extra(recipe.__pydantic_extra__) or {},
+    )
+
+
+def scale_recipe(
+    recipe: Recipe | RecipeRecord,
+    new_servings: int,
+    normalize_units: bool = False,
+    display_units: Mapping[UnitType, str] | None = None,
+    exact: bool = False,
+) -> Recipe | RecipeRecord:
     """
     Scale a recipe to a different number of servings.
 
     Args:
-        recipe: Recipe object with servings and ingredients
+        recipe: Recipe object with servings and ingredients. A RecipeRecord
+            is scaled directly and a RecipeRecord is returned.
         new_servings: Target number of servings
+        normalize_units: Also express each scaled amount in the most readable
+            unit of its type (e.g. 48 tsp -> 1 cup, 1500 g -> 1.5 kg). Units
+            that are unknown or have no readable ladder are left unchanged.
+        display_units: Unit to express each unit type in, applied before
+            normalize_units. A weight unit for UnitType.VOLUME (or a volume
+            unit for UnitType.WEIGHT) converts through the ingredient's
+            density; ingredients with no known density keep their unit.
+        exact: Return an ExactRecipe whose amounts are Fractions, scaled
+            and converted without rounding, so chained scaling (4 -> 7 -> 3
+            -> 12 servings) ends exactly where a single scale would. Slower
+            than floats.
 
     Returns:
         New Recipe object with scaled ingredient amounts
 
+    Raises:
+        ValueError: If new_servings is not a positive whole number, or a
+            display unit is unknown or of an unrelated type
+
     Example:
         from lethimcook.recipe import Recipe, Ingredient
 
@@ -52,23 +164,169 @@ def scale_recipe(recipe: Recipe, new_servings: int) -> Recipe:
             ]
         )
         scaled = scale_recipe(recipe, 8)
+        by_weight = scale_recipe(recipe, 8, display_units={UnitType.VOLUME: "g"})
     """
-    if new_servings <= 0:
-        raise ValueError("New servings must be positive")
+    recorder = metrics.recorder
+    if recorder is not None:
+        with recorder.timer("recipe.scale"):
+            return _scale_recipe(recipe, new_servings, normalize_units, display_units, exact)
+    return _scale_recipe(recipe, new_servings, normalize_units, display_units, exact)
+
+
+def _scale_recipe(
+    recipe: Recipe | RecipeRecord,
+    new_servings: int,
+    normalize_units: bool,
+    display_units: Mapping[UnitType, str] | None,
+    exact: bool,
+) -> Recipe | RecipeRecord:
+    if isinstance(recipe, RecipeRecord):
+        return recipe.scale(new_servings, normalize_units, display_units, exact)
+
+    # The result is built without validation, so check servings here
+    new_servings = _check_servings(new_servings)
 
     scale_factor = new_servings / recipe.servings
 
-    # Scale each ingredient
-    scaled_ingredients = []
-    for ingredient in recipe.ingredients:
-        ingredient_dict = ingredient.model_dump()
-        if ingredient.amount is not None:
-            ingredient_dict["amount"] = ingredient.amount * scale_factor
-        scaled_ingredients.append(Ingredient(**ingredient_dict))
+    # Ingredients and recipe are already validated, so copy them with the
+    # updated fields instead of dumping and re-validating
+    if exact:
+        registry = get_registry()
+        targets = _display_targets(registry, display_units) if display_units else None
+        factor = Fraction(new_servings, recipe.servings)
+        scaled_ingredients = []
+        for ingredient in recipe.ingredients:
+            if ingredient.amount is None:
+                scaled_ingredients.append(_with_amount(ingredient, None, model=ExactIngredient))
+                continue
+            amount, unit = _scale_exact(
+                ingredient.amount,
+                factor,
+                ingredient.unit,
+                ingredient.name,
+                targets,
+                normalize_units,
+                registry,
+            )
+            scaled_ingredients.append(_with_amount(
+                ingredient, amount, None if unit == ingredient.unit else unit, ExactIngredient
+            ))
+        return _with_ingredients(recipe, new_servings, scaled_ingredients, ExactRecipe)
+
+    if display_units:
+        registry = get_registry()
+        targets = _display_targets(registry, display_units)
+        scaled_ingredients = []
+        for ingredient in recipe.ingredients:
+            if ingredient.amount is None:
+                scaled_ingredients.append(_with_amount(ingredient, None))
+                continue
+            amount, unit = _to_display_unit(
+                registry,
+                ingredient.amount * scale_factor,
+                ingredient.unit,
+                ingredient.name,
+                targets,
+            )
+            if normalize_units:
+                amount, unit = readable_unit(amount, unit)
+            scaled_ingredients.append(
+                _with_amount(ingredient, amount, None if unit == ingredient.unit else unit)
+            )
+    elif normalize_units:
+        scaled_ingredients = [
+            _with_amount(ingredient, None)
+            if ingredient.amount is None
+            else _with_amount(
+                ingredient,
+                *readable_unit(ingredient.amount * scale_factor, ingredient.unit),
+            )
+            for ingredient in recipe.ingredients
+        ]
+    else:
+        scaled_ingredients = [
+            _with_amount(
+                ingredient,
+                None if ingredient.amount is None else ingredient.amount * scale_factor,
+            )
+            for ingredient in recipe.ingredients
+        ]
+
+    return _with_ingredients(recipe, new_servings, scaled_ingredients)
+
+
+def aggregate_ingredients(
+    recipes: Iterable[Recipe | RecipeRecord],
+    display_units: Mapping[UnitType, str] | None = None,
+    normalize_units: bool = False,
+) -> list[Ingredient]:
+    """
+    Combine the ingredients of many recipes into a shopping list.
+
+    Ingredients are grouped by normalized name (case and whitespace
+    insensitive) and unit type, and their amounts are summed in base units
+    in a single pass. Ingredients with unknown or temperature units are
+    grouped by name and unit spelling instead and summed as-is.
+
+    Args:
+        recipes: Recipes or RecipeRecords to combine; consumed once
+        display_units: Unit to report each unit type in; defaults to
+            BASE_UNITS (ml, g, count)
+        normalize_units: Express each total in the most readable unit of
+            its type instead, as in scale_recipe
+
+    Returns:
+        One Ingredient per group, in order of first appearance. The amount
+        is None if no ingredient in the group had one.
+
+    Raises:
+        ValueError: If a display unit is unknown or of the wrong type
+
+    Example:
+        totals = aggregate_ingredients(
+            [pancakes, waffles], display_units={UnitType.VOLUME: "cup"}
+        )
+    """
+    registry = get_registry()
+    targets = {}
+    for unit_type, unit in {**BASE_UNITS, **(display_units or {})}.items():
+        target = registry.resolve(unit)
+        if target.unit_type != unit_type:
+            raise ValueError(f"Display unit {unit} is not a {unit_type} unit")
+        targets[unit_type] = (unit, target)
+
+    # (normalized name, unit type, unit spelling) -> [name, unit, total]
+    # Convertible units group by type; others group by their own spelling.
+    totals: dict[tuple[str, UnitType | None, str], list] = {}
+    for recipe in recipes:
+        for ingredient in recipe.ingredients:
+            try:
+                resolved = registry.resolve(ingredient.unit)
+            except ValueError:
+                resolved = None
+
+            amount = ingredient.amount
+            name = " ".join(ingredient.name.lower().split())
+            if resolved is None or resolved.unit_type == UnitType.TEMPERATURE:
+                key = (name, None, normalize_unit(ingredient.unit))
+            else:
+                key = (name, resolved.unit_type, "")
+                if amount is not None:
+                    amount *= resolved.scale
 
-    # Create new recipe with scaled ingredients
-    recipe_dict = recipe.model_dump(exclude={"servings", "ingredients"})
-    recipe_dict["servings"] = new_servings
-    recipe_dict["ingredients"] = scaled_ingredients
+            entry = totals.get(key)
+            if entry is None:
+                totals[key] = [ingredient.name, ingredient.unit, amount]
+            elif amount is not None:
+                entry[2] = amount if entry[2] is None else entry[2] + amount
 
-    return Recipe(**recipe_dict)
+    aggregated = []
+    for (_, unit_type, _), (name, unit, total) in totals.items():
+        if unit_type is not None:
+            unit, target = targets[unit_type]
+            if total is not None:
+                total /= target.scale
+                if normalize_units:
+                    total, unit = readable_unit(total, unit)
+        aggregated.append(Ingredient(amount=total, unit=unit, name=name))
+    return aggregated
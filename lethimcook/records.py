@@ -0,0 +1,192 @@
+"""
+Lightweight immutable recipe records.
+
+IngredientRecord and RecipeRecord hold the same data as the pydantic
+Ingredient and Recipe models as plain named tuples: no validation
+machinery, no per-instance ``__dict__``. They are meant for holding and
+scaling large numbers of already-valid ingredients; convert to the models
+at the API boundary with ``from_model`` and ``to_model``.
+
+This module does not import pydantic until ``to_model`` is called.
+"""
+
+from collections.abc import Mapping
+from operator import index
+from typing import TYPE_CHECKING, NamedTuple
+
+from lethimcook.converter import _display_targets, _scale_exact, _to_display_unit, convert
+from lethimcook.units import UnitType, get_registry, readable_unit
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+    from lethimcook.recipe import Ingredient, Recipe
+
+
+# Extra field values that can be shared between copies as they are
+_IMMUTABLE = frozenset({str, int, float, bool, type(None)})
+
+
+def _copy_extra(extra: dict | None) -> dict | None:
+    """
+    Copy a model's extra fields so the copy shares no mutable state with it.
+
+    Extras holding only strings and numbers get a plain dict copy; anything
+    else (lists, dicts, objects) is deep-copied.
+    """
+    if not extra:
+        return None
+    for value in extra.values():
+        if type(value) not in _IMMUTABLE:
+            from copy import deepcopy
+
+            return deepcopy(extra)
+    return extra.copy()
+
+
+def _check_servings(servings: int) -> int:
+    """
+    Return a serving count as an int, as Recipe validation would accept it.
+
+    Raises:
+        ValueError: If servings is not a positive whole number
+    """
+    if isinstance(servings, float) and servings.is_integer():
+        servings = int(servings)
+    if isinstance(servings, bool):
+        raise ValueError(f"New servings must be a whole number, got {servings!r}")
+    try:
+        # Also accepts integer types such as numpy.int64
+        servings = index(servings)
+    except TypeError:
+        raise ValueError(f"New servings must be a whole number, got {servings!r}") from None
+    if servings <= 0:
+        raise ValueError("New servings must be positive")
+    return servings
+
+
+class IngredientRecord(NamedTuple):
+    """An immutable ingredient; ``extra`` holds any additional fields."""
+    amount: "float | Fraction | None"
+    unit: str
+    name: str
+    note: str | None = None
+    extra: Mapping | None = None
+
+    @classmethod
+    def from_model(cls, ingredient: "Ingredient") -> "IngredientRecord":
+        return cls(
+            ingredient.amount,
+            ingredient.unit,
+            ingredient.name,
+            ingredient.note,
+            _copy_extra(ingredient.model_extra),
+        )
+
+    def to_model(self) -> "Ingredient":
+        """Validate into an Ingredient, or an ExactIngredient for a Fraction amount."""
+        from fractions import Fraction
+
+        from lethimcook.recipe import ExactIngredient, Ingredient
+
+        model = ExactIngredient if isinstance(self.amount, Fraction) else Ingredient
+        return model(**self._field_values())
+
+    def _field_values(self) -> dict:
+        return {
+            **(self.extra or {}),
+            "amount": self.amount,
+            "unit": self.unit,
+            "name": self.name,
+            "note": self.note,
+        }
+
+    def convert_to(self, unit: str) -> "IngredientRecord":
+        """
+        Return this ingredient with its amount converted to another unit.
+
+        Volume and weight convert into each other through the density of
+        the ingredient's name.
+
+        Raises:
+            ValueError: If the units are incompatible or unknown
+        """
+        amount = (
+            None if self.amount is None
+            else convert(self.amount, self.unit, unit, ingredient=self.name)
+        )
+        return IngredientRecord(amount, unit, self.name, self.note, self.extra)
+
+
+class RecipeRecord(NamedTuple):
+    """An immutable recipe; ``extra`` holds any additional fields."""
+    servings: int
+    ingredients: tuple[IngredientRecord, ...]
+    name: str | None = None
+    prep_time: str | None = None
+    extra: Mapping | None = None
+
+    @classmethod
+    def from_model(cls, recipe: "Recipe") -> "RecipeRecord":
+        return cls(
+            recipe.servings,
+            tuple(IngredientRecord.from_model(i) for i in recipe.ingredients),
+            recipe.name,
+            recipe.prep_time,
+            _copy_extra(recipe.model_extra),
+        )
+
+    def to_model(self) -> "Recipe":
+        """Validate into a Recipe, or an ExactRecipe if any amount is a Fraction."""
+        from fractions import Fraction
+
+        from lethimcook.recipe import ExactRecipe, Recipe
+
+        exact = any(isinstance(i.amount, Fraction) for i in self.ingredients)
+        return (ExactRecipe if exact else Recipe)(
+            **(self.extra or {}),
+            servings=self.servings,
+            ingredients=[i._field_values() for i in self.ingredients],
+            name=self.name,
+            prep_time=self.prep_time,
+        )
+
+    def scale(
+        self,
+        new_servings: int,
+        normalize_units: bool = False,
+        display_units: Mapping[UnitType, str] | None = None,
+        exact: bool = False,
+    ) -> "RecipeRecord":
+        """
+        Scale to a different number of servings; see scale_recipe.
+
+        Raises:
+            ValueError: If new_servings is not a positive whole number, or a
+                display unit is unknown or of an unrelated type
+        """
+        new_servings = _check_servings(new_servings)
+
+        registry = get_registry()
+        targets = _display_targets(registry, display_units) if display_units else None
+        if exact:
+            from fractions import Fraction
+
+            factor = Fraction(new_servings, self.servings)
+        scale_factor = new_servings / self.servings
+        ingredients = []
+        for ingredient in self.ingredients:
+            amount, unit, name, note, extra = ingredient
+            if amount is not None and exact:
+                amount, unit = _scale_exact(
+                    amount, factor, unit, name, targets, normalize_units, registry
+                )
+            elif amount is not None:
+                amount *= scale_factor
+                if targets:
+                    amount, unit = _to_display_unit(registry, amount, unit, name, targets)
+                if normalize_units:
+                    amount, unit = readable_unit(amount, unit)
+            ingredients.append(IngredientRecord(amount, unit, name, note, extra))
+
+        return self._replace(servings=new_servings, ingredients=tuple(ingredients))
@@ -0,0 +1,145 @@
+"""Repeated scaling of one recipe, e.g. behind a servings slider."""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+from lethimcook.converter import _display_targets, _to_display_unit
+from lethimcook.recipe import Ingredient, Recipe, _construct, _with_ingredients
+from lethimcook.records import _check_servings, _copy_extra
+from lethimcook.units import UnitType, get_registry
+
+# Scaled recipes kept per ScalableRecipe by default
+DEFAULT_SIZES_KEPT = 8
+
+
+class ScalableRecipe:
+    """
+    A recipe prepared for scaling to many serving sizes.
+
+    Everything that does not depend on the serving size is done once, up
+    front: amounts are divided down to one serving, display units are
+    applied, and units are resolved. ``at(servings)`` then only multiplies
+    and, with ``normalize_units``, walks the readable-unit ladder.
+
+    Scaled ingredients are built from templates prepared here, so only
+    their amount and unit are new; extra fields are copied once and shared
+    by every result, and ingredients without an amount are reused as-is
+    from the source recipe. Treat returned recipes as read-only. The last
+    ``sizes_kept`` results are memoized, so moving a slider back and forth
+    over recent values allocates nothing.
+
+    Example:
+        scalable = ScalableRecipe(recipe, normalize_units=True)
+        for servings in range(1, 13):
+            render(scalable.at(servings))
+    """
+
+    def __init__(
+        self,
+        recipe: Recipe,
+        normalize_units: bool = False,
+        display_units: Mapping[UnitType, str] | None = None,
+        sizes_kept: int = DEFAULT_SIZES_KEPT,
+    ):
+        """
+        Raises:
+            ValueError: If a display unit is unknown or of an unrelated type
+        """
+        self.recipe = recipe
+        self.normalize_units = normalize_units
+        self.sizes_kept = sizes_kept
+
+        # Units resolve against one registry snapshot so IDs stay consistent
+        self._registry = registry = get_registry()
+        targets = _display_targets(registry, display_units) if display_units else None
+
+        # Per ingredient: (source, template field values, fields set,
+        # extras, amount per serving, unit ID or None). Templates are copied
+        # once here; at() only fills in amount and unit.
+        plans = []
+        for ingredient in recipe.ingredients:
+            if ingredient.amount is None:
+                plans.append((ingredient, None, None, None, None, None))
+                continue
+            amount, unit = ingredient.amount / recipe.servings, ingredient.unit
+            if targets:
+                amount, unit = _to_display_unit(registry, amount, unit, ingredient.name, targets)
+            unit_id = None
+            if normalize_units:
+                try:
+                    unit_id = registry.resolve(unit).unit_id
+                except ValueError:
+                    pass
+            plans.append((
+                ingredient,
+                dict(ingredient.__dict__, unit=unit),
+                set(ingredient.__pydantic_fields_set__),
+                _copy_extra(ingredient.__pydantic_extra__) or {},
+                amount,
+                unit_id,
+            ))
+        self._plans = tuple(plans)
+
+        self._results: OrderedDict[int, Recipe] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def amounts(self, servings: int) -> list[float | None]:
+        """
+        Return just the scaled amounts, in ingredient order.
+
+        Cheaper than ``at`` when only the numbers are redrawn; units can
+        still change with ``normalize_units``, so use ``at`` for those.
+        """
+        servings = _check_servings(servings)
+        if self.normalize_units:
+            return [i.amount for i in self.at(servings).ingredients]
+        return [
+            None if amount is None else amount * servings
+            for _, _, _, _, amount, _ in self._plans
+        ]
+
+    def _ingredients(self, servings: int) -> list[Ingredient]:
+        registry = self._registry
+        ingredients = []
+        for source, template, fields_set, extra, amount, unit_id in self._plans:
+            if template is None:
+                ingredients.append(source)
+                continue
+            values = template.copy()
+            amount *= servings
+            if unit_id is not None:
+                amount, target = registry.readable(amount, unit_id)
+                if target != unit_id:
+                    values["unit"] = registry.name(target)
+            values["amount"] = amount
+            ingredients.append(_construct(Ingredient, values, fields_set, extra))
+        return ingredients
+
+    def at(self, servings: int) -> Recipe:
+        """
+        Return the recipe scaled to ``servings``.
+
+        Equivalent to ``scale_recipe(recipe, servings, normalize_units,
+        display_units)``, up to float rounding.
+
+        Raises:
+            ValueError: If servings is not a positive whole number
+        """
+        servings = _check_servings(servings)
+        with self._lock:
+            cached = self._results.get(servings)
+            if cached is not None:
+                self._results.move_to_end(servings)
+                return cached
+
+        scaled = _with_ingredients(self.recipe, servings, self._ingredients(servings))
+        if self.sizes_kept > 0:
+            with self._lock:
+                self._results[servings] = scaled
+                if len(self._results) > self.sizes_kept:
+                    self._results.popitem(last=False)
+        return scaled
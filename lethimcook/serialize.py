@@ -0,0 +1,118 @@
+"""
+Bulk JSON serialization for recipes and natural conversion results.
+
+Serialization runs in pydantic-core: recipes are dumped a chunk at a time
+through a ``TypeAdapter`` and joined into one JSON array, so a catalog of any
+size can be streamed to a file or socket while only one chunk is held in
+memory. The output matches ``json.dumps([r.model_dump(mode="json") ...])``
+up to whitespace.
+
+Example:
+    with open("scaled.json", "wb") as fp:
+        dump_recipes((scale_recipe(r, 8) for r in catalog), fp)
+"""
+
+import io
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+
+from pydantic import TypeAdapter
+
+from lethimcook.natural import NaturalConversion
+from lethimcook.recipe import Recipe
+from lethimcook.records import RecipeRecord
+
+# Items serialized per pydantic-core call, and per write
+DEFAULT_CHUNK_SIZE = 256
+
+# Adapters serialize with serialize_as_any, so subclasses such as ExactRecipe
+# keep their own field types (Fraction amounts as "1/2")
+_RECIPES = TypeAdapter(list[Recipe])
+_CONVERSIONS = TypeAdapter(list[dict[str, Any]])
+
+
+def _iter_array(adapter: TypeAdapter, items: Iterable, chunk_size: int, convert) -> Iterator[bytes]:
+    """Return pieces of a JSON array of ``items``, up to ``chunk_size`` items each."""
+    # Checked here rather than in the generator so bad arguments fail on the call
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    return _pieces(adapter, items, chunk_size, convert)
+
+
+def _pieces(adapter: TypeAdapter, items: Iterable, chunk_size: int, convert) -> Iterator[bytes]:
+    yield b"["
+    chunk = []
+    separator = b""
+    for item in items:
+        chunk.append(convert(item))
+        if len(chunk) == chunk_size:
+            # Strip the brackets of each chunk's array and join with commas
+            yield separator + adapter.dump_json(chunk, serialize_as_any=True)[1:-1]
+            separator = b","
+            chunk.clear()
+    if chunk:
+        yield separator + adapter.dump_json(chunk, serialize_as_any=True)[1:-1]
+    yield b"]"
+
+
+def _write(pieces: Iterator[bytes], fp: IO) -> None:
+    if isinstance(fp, io.TextIOBase):
+        for piece in pieces:
+            fp.write(piece.decode())
+    else:
+        for piece in pieces:
+            fp.write(piece)
+
+
+def _as_model(recipe: Recipe | RecipeRecord) -> Recipe:
+    return recipe.to_model() if isinstance(recipe, RecipeRecord) else recipe
+
+
+def iter_recipes_json(
+    recipes: Iterable[Recipe | RecipeRecord], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yield a JSON array of recipes as UTF-8 pieces, consuming ``recipes`` lazily.
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    return _iter_array(_RECIPES, recipes, chunk_size, _as_model)
+
+
+def dump_recipes(
+    recipes: Iterable[Recipe | RecipeRecord], fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """
+    Write recipes to a binary or text file as one JSON array.
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    _write(iter_recipes_json(recipes, chunk_size), fp)
+
+
+def iter_conversions_json(
+    conversions: Iterable[NaturalConversion], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yield a JSON array of natural conversion results as UTF-8 pieces.
+
+    Each result becomes an object with the NaturalConversion field names.
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    return _iter_array(_CONVERSIONS, conversions, chunk_size, NaturalConversion._asdict)
+
+
+def dump_conversions(
+    conversions: Iterable[NaturalConversion], fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """
+    Write natural conversion results to a binary or text file as one JSON array.
+
+    Raises:
+        ValueError: If chunk_size is not positive
+    """
+    _write(iter_conversions_json(conversions, chunk_size), fp)
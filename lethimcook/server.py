@@ -0,0 +1,324 @@
+"""
+Long-running conversion server.
+
+Serves convert, convert_natural and scale_recipe as JSON over HTTP/1.1 on a
+TCP port or a Unix socket, so callers pay process startup once instead of
+per call. Concurrent scalar convert requests are coalesced into micro-batches
+and run through convert_many.
+
+Run with:
+    python -m lethimcook.server --port 8765
+    python -m lethimcook.server --unix /tmp/lethimcook.sock
+
+Endpoints:
+    POST /convert          {"value": 2, "from": "cups", "to": "ml"}
+                           {"values": [1, 2], "from": "cups", "to": "ml"}
+    POST /convert_natural  {"query": "2 cups to ml"}
+                           (the answer text, plus its parts under "conversion")
+    POST /scale_recipe     {"recipe": {...}, "servings": 8, "normalize_units": false}
+    GET  /stats            request counts, p50/p99 latency, batching and cache stats
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from collections import deque
+from time import perf_counter
+
+from lethimcook.converter import convert_many
+from lethimcook.natural import convert_natural_result
+from lethimcook.units import get_registry
+
+# Largest request body accepted, in bytes
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+
+class LatencyStats:
+    """Rolling latency samples per endpoint."""
+
+    def __init__(self, window: int = 10_000):
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=self._window)
+        samples.append(seconds)
+        self._counts[endpoint] = self._counts.get(endpoint, 0) + 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return count, p50 and p99 (in milliseconds) per endpoint."""
+        summary = {}
+        for endpoint, samples in self._samples.items():
+            ordered = sorted(samples)
+            summary[endpoint] = {
+                "count": self._counts[endpoint],
+                "p50_ms": _percentile(ordered, 0.50) * 1000,
+                "p99_ms": _percentile(ordered, 0.99) * 1000,
+            }
+        return summary
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ConvertBatcher:
+    """
+    Coalesces concurrent scalar convert requests into convert_many calls.
+
+    Requests are queued until ``max_batch`` are pending or ``max_delay``
+    seconds have passed since the first one, then converted with one
+    vectorized call per distinct unit pair. With the default ``max_delay``
+    of 0 a batch holds every request that arrived in the same event loop
+    iteration.
+    """
+
+    def __init__(self, max_batch: int = 1024, max_delay: float = 0.0):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.batches = 0
+        self.requests = 0
+        self._pending: list[tuple[float, str, str, asyncio.Future]] = []
+        self._timer: asyncio.Handle | None = None
+
+    async def convert(self, value: float, from_unit: str, to_unit: str) -> float:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((value, from_unit, to_unit, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            if self.max_delay > 0:
+                self._timer = loop.call_later(self.max_delay, self.flush)
+            else:
+                self._timer = loop.call_soon(self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Convert every pending request now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self.batches += 1
+        self.requests += len(pending)
+
+        groups: dict[tuple[str, str], list[tuple[float, asyncio.Future]]] = {}
+        for value, from_unit, to_unit, future in pending:
+            groups.setdefault((from_unit, to_unit), []).append((value, future))
+
+        for (from_unit, to_unit), items in groups.items():
+            # Any error fails only this unit pair; raising here would leave
+            # the other groups' futures unresolved
+            try:
+                results = convert_many([value for value, _ in items], from_unit, to_unit).tolist()
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class ConversionServer:
+    """Request dispatch and shared state for the conversion server."""
+
+    def __init__(self, batcher: ConvertBatcher | None = None):
+        self.batcher = batcher or ConvertBatcher()
+        self.latency = LatencyStats()
+        self._routes = {
+            "/convert": self._convert,
+            "/convert_natural": self._convert_natural,
+            "/scale_recipe": self._scale_recipe,
+        }
+
+    def warm(self) -> None:
+        """Resolve every known unit and load the recipe models up front."""
+        registry = get_registry()
+        for alias in registry.ids:
+            registry.resolve(alias)
+        import lethimcook.recipe  # noqa: F401
+
+    def stats(self) -> dict:
+        cache = get_registry().cache_info()
+        return {
+            "latency": self.latency.summary(),
+            "batching": {
+                "batches": self.batcher.batches,
+                "requests": self.batcher.requests,
+            },
+            "unit_cache": cache._asdict(),
+        }
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> tuple[int, dict]:
+        """Handle one request and return (status, JSON payload)."""
+        if path == "/stats":
+            return 200, self.stats()
+        route = self._routes.get(path)
+        if route is None:
+            return 404, {"error": f"Unknown endpoint: {path}"}
+        if method != "POST":
+            return 405, {"error": f"{path} expects POST"}
+        try:
+            payload = json.loads(body)
+            if not isinstance(payload, dict):
+                raise ValueError("Request body must be a JSON object")
+            return 200, await route(payload)
+        except (KeyError, TypeError) as e:
+            return 400, {"error": f"Invalid request: {e}"}
+        except ValueError as e:
+            return 400, {"error": str(e)}
+        except ArithmeticError as e:
+            return 400, {"error": f"Number out of range: {e}"}
+
+    async def _convert(self, payload: dict) -> dict:
+        from_unit, to_unit = payload["from"], payload["to"]
+        if not isinstance(from_unit, str) or not isinstance(to_unit, str):
+            raise TypeError("'from' and 'to' must be strings")
+        if "values" in payload:
+            return {"results": convert_many(payload["values"], from_unit, to_unit).tolist()}
+        value = payload["value"]
+        if not isinstance(value, int | float):
+            raise TypeError("'value' must be a number")
+        return {"result": await self.batcher.convert(value, from_unit, to_unit)}
+
+    async def _convert_natural(self, payload: dict) -> dict:
+        query = payload["query"]
+        if not isinstance(query, str):
+            raise TypeError("'query' must be a string")
+        conversion = convert_natural_result(query)
+        return {"result": conversion.text, "conversion": conversion._asdict()}
+
+    async def _scale_recipe(self, payload: dict) -> dict:
+        from lethimcook.recipe import Recipe, scale_recipe
+
+        recipe = Recipe.model_validate(payload["recipe"])
+        scaled = scale_recipe(
+            recipe, payload["servings"], normalize_units=payload.get("normalize_units", False)
+        )
+        return {"recipe": scaled.model_dump(mode="json")}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve requests on one connection until the client closes it."""
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except ValueError as e:
+                    _write_response(writer, 400, {"error": str(e)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+
+                start = perf_counter()
+                status, payload = await self.dispatch(method, path, body)
+                self.latency.record(path, perf_counter() - start)
+
+                _write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, bytes, bool] | None:
+    """Read one HTTP/1.x request; returns None at end of stream."""
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, target, version = request_line.decode("latin-1").split()
+    except ValueError:
+        raise ValueError("Malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise ValueError("Invalid Content-Length") from None
+    if length > MAX_BODY_SIZE:
+        raise ValueError("Request body too large")
+    body = await reader.readexactly(length) if length else b""
+
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.0":
+        keep_alive = connection == "keep-alive"
+    else:
+        keep_alive = connection != "close"
+    return method.upper(), target.split("?", 1)[0], body, keep_alive
+
+
+def _write_response(writer: asyncio.StreamWriter, status: int, payload: dict, keep_alive: bool) -> None:
+    body = json.dumps(payload).encode()
+    writer.write(
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n".encode()
+        + body
+    )
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_path: str | None = None,
+    server: ConversionServer | None = None,
+) -> None:
+    """Run the conversion server until cancelled."""
+    server = server or ConversionServer()
+    server.warm()
+    if unix_path is not None:
+        listener = await asyncio.start_unix_server(server.handle, path=unix_path)
+        address = unix_path
+    else:
+        listener = await asyncio.start_server(server.handle, host, port)
+        bound_host, bound_port = listener.sockets[0].getsockname()[:2]
+        address = f"{bound_host}:{bound_port}"
+    print(f"Serving on {address}", flush=True)
+
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        print(json.dumps(server.stats()["latency"], indent=2), file=sys.stderr)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="LetHimCook conversion server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="0 picks a free port")
+    parser.add_argument("--unix", metavar="PATH", help="listen on a Unix socket instead")
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
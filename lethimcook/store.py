@@ -0,0 +1,270 @@
+"""
+Compact binary recipe store readable through mmap.
+
+A store file holds every recipe as fixed-width records, so a process can
+open a large catalog instantly and read or scale any single recipe without
+deserializing the others. Layout (little-endian)::
+
+    header        magic, version, counts and section offsets
+    ingredients   one 24-byte record per ingredient:
+                  amount f64 (NaN if missing), unit code u32,
+                  name, note and extra-fields string offsets u32
+    index         one 24-byte record per recipe:
+                  first ingredient u64, ingredient count u32, servings u32,
+                  name and other-fields string offsets u32
+    units         u32 string offset per unit code
+    strings       deduplicated UTF-8 strings, each prefixed by a u32 length
+
+String offsets are relative to the strings section; 0xFFFFFFFF means None.
+Extra fields are stored as JSON strings.
+
+Example:
+    write_store("catalog.lhc", recipes)
+    with RecipeStore("catalog.lhc") as store:
+        scaled = store[1234].scale(8)
+"""
+
+import json
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from math import isnan, nan
+from os import PathLike
+
+from lethimcook.recipe import Ingredient, Recipe, scale_recipe
+
+MAGIC = b"LHCSTORE"
+VERSION = 1
+NONE = 0xFFFFFFFF
+
+# magic, version, recipe count, ingredient count, and the offsets of the
+# ingredient, index, units and strings sections
+_HEADER = struct.Struct("<8sIIQQQQQ")
+_INGREDIENT = struct.Struct("<dIIII")
+_RECIPE = struct.Struct("<QIIII")
+_LENGTH = struct.Struct("<I")
+_OFFSET = struct.Struct("<I")
+
+
+class _StringTable:
+    """Deduplicating string table builder."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self._offsets: dict[str, int] = {}
+
+    def add(self, value: str | None) -> int:
+        if value is None:
+            return NONE
+        offset = self._offsets.get(value)
+        if offset is None:
+            offset = len(self.data)
+            if offset >= NONE:
+                raise ValueError("String table exceeds 4 GiB")
+            encoded = value.encode()
+            self.data += _LENGTH.pack(len(encoded))
+            self.data += encoded
+            self._offsets[value] = offset
+        return offset
+
+
+def _extra_json(model: Ingredient | Recipe) -> str | None:
+    extra = model.model_extra
+    return json.dumps(extra) if extra else None
+
+
+def write_store(path: str | PathLike, recipes: Iterable[Recipe]) -> int:
+    """
+    Write recipes to a binary store file.
+
+    Ingredient records are streamed to disk; the recipe index and the
+    deduplicated string table are kept in memory until the end.
+
+    Returns:
+        The number of recipes written
+    """
+    strings = _StringTable()
+    units: dict[str, int] = {}
+    index = bytearray()
+    ingredient_count = 0
+
+    with open(path, "wb") as f:
+        f.write(bytes(_HEADER.size))
+        ingredients_offset = f.tell()
+
+        for recipe in recipes:
+            first = ingredient_count
+            for ingredient in recipe.ingredients:
+                unit_code = units.setdefault(ingredient.unit, len(units))
+                f.write(_INGREDIENT.pack(
+                    nan if ingredient.amount is None else ingredient.amount,
+                    unit_code,
+                    strings.add(ingredient.name),
+                    strings.add(ingredient.note),
+                    strings.add(_extra_json(ingredient)),
+                ))
+            ingredient_count += len(recipe.ingredients)
+
+            other = {"prep_time": recipe.prep_time} if recipe.prep_time is not None else {}
+            other.update(recipe.model_extra or {})
+            index += _RECIPE.pack(
+                first,
+                len(recipe.ingredients),
+                recipe.servings,
+                strings.add(recipe.name),
+                strings.add(json.dumps(other) if other else None),
+            )
+
+        index_offset = f.tell()
+        f.write(index)
+        units_offset = f.tell()
+        for unit in units:
+            f.write(_OFFSET.pack(strings.add(unit)))
+        strings_offset = f.tell()
+        f.write(strings.data)
+
+        recipe_count = len(index) // _RECIPE.size
+        f.seek(0)
+        f.write(_HEADER.pack(
+            MAGIC, VERSION, recipe_count, ingredient_count,
+            ingredients_offset, index_offset, units_offset, strings_offset,
+        ))
+    return recipe_count
+
+
+class RecipeStore:
+    """
+    Read-only, memory-mapped view of a store file.
+
+    Opening a store only reads the header and the unit table; recipes are
+    decoded on access through RecipeView.
+    """
+
+    def __init__(self, path: str | PathLike):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._buffer = memoryview(self._mmap)
+
+        try:
+            (
+                magic, version, self._recipe_count, self._ingredient_count,
+                self._ingredients_offset, self._index_offset, units_offset, self._strings_offset,
+            ) = _HEADER.unpack_from(self._buffer, 0)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Not a recipe store: {path}") from None
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Not a recipe store: {path}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported recipe store version: {version}")
+
+        unit_count = (self._strings_offset - units_offset) // _OFFSET.size
+        self.units: tuple[str, ...] = tuple(
+            self._string(_OFFSET.unpack_from(self._buffer, units_offset + i * _OFFSET.size)[0])
+            for i in range(unit_count)
+        )
+
+    def __enter__(self) -> "RecipeStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._buffer.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._recipe_count
+
+    def __getitem__(self, index: int) -> "RecipeView":
+        if index < 0:
+            index += self._recipe_count
+        if not 0 <= index < self._recipe_count:
+            raise IndexError("recipe index out of range")
+        return RecipeView(self, index)
+
+    def __iter__(self) -> Iterator["RecipeView"]:
+        for index in range(self._recipe_count):
+            yield RecipeView(self, index)
+
+    def recipes(self) -> Iterator[Recipe]:
+        """Decode every recipe into a Recipe model, lazily."""
+        for view in self:
+            yield view.to_recipe()
+
+    def _string(self, offset: int) -> str | None:
+        if offset == NONE:
+            return None
+        start = self._strings_offset + offset
+        (length,) = _LENGTH.unpack_from(self._buffer, start)
+        start += _LENGTH.size
+        return str(self._buffer[start:start + length], "utf-8")
+
+    def _recipe_record(self, index: int) -> tuple[int, int, int, int, int]:
+        return _RECIPE.unpack_from(self._buffer, self._index_offset + index * _RECIPE.size)
+
+    def _ingredient_record(self, index: int) -> tuple[float, int, int, int, int]:
+        return _INGREDIENT.unpack_from(
+            self._buffer, self._ingredients_offset + index * _INGREDIENT.size
+        )
+
+
+class RecipeView:
+    """A lazily decoded recipe inside a RecipeStore."""
+
+    __slots__ = ("_store", "index", "_first", "_count", "servings", "_name", "_other")
+
+    def __init__(self, store: RecipeStore, index: int):
+        self._store = store
+        self.index = index
+        self._first, self._count, self.servings, self._name, self._other = (
+            store._recipe_record(index)
+        )
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def name(self) -> str | None:
+        return self._store._string(self._name)
+
+    def amounts(self) -> list[float | None]:
+        """Return the ingredient amounts without decoding any strings."""
+        store = self._store
+        return [
+            None if isnan(amount) else amount
+            for amount, *_ in (
+                store._ingredient_record(i) for i in range(self._first, self._first + self._count)
+            )
+        ]
+
+    def ingredients(self) -> Iterator[Ingredient]:
+        """Decode this recipe's ingredients into Ingredient models."""
+        store = self._store
+        for i in range(self._first, self._first + self._count):
+            amount, unit_code, name, note, extra = store._ingredient_record(i)
+            fields = json.loads(store._string(extra)) if extra != NONE else {}
+            yield Ingredient(
+                **fields,
+                amount=None if isnan(amount) else amount,
+                unit=store.units[unit_code],
+                name=store._string(name),
+                note=store._string(note),
+            )
+
+    def to_recipe(self) -> Recipe:
+        """Decode this recipe into a Recipe model."""
+        other = self._store._string(self._other)
+        return Recipe(
+            **(json.loads(other) if other is not None else {}),
+            servings=self.servings,
+            name=self.name,
+            ingredients=list(self.ingredients()),
+        )
+
+    def scale(self, new_servings: int, normalize_units: bool = False) -> Recipe:
+        """Decode this recipe and scale it; see scale_recipe."""
+        return scale_recipe(self.to_recipe(), new_servings, normalize_units=normalize_units)
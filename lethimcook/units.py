@@ -1,6 +1,18 @@
 """Unit conversion definitions and constants."""
 
+import threading
+from collections.abc import Iterable, Iterator, Mapping
 from enum import StrEnum
+from functools import lru_cache
+from math import isfinite
+from os import PathLike
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+from lethimcook import metrics
+
+if TYPE_CHECKING:
+    from fractions import Fraction
 
 
 class UnitType(StrEnum):
@@ -10,6 +22,30 @@ class UnitType(StrEnum):
     COUNT = "count"
 
 
+class UnitDefinition(NamedTuple):
+    """A unit and its relation to the base unit of its type.
+
+    A value in this unit is converted to the base unit as
+    ``value * scale + offset``; ``offset`` is only used for temperature.
+    """
+    name: str
+    unit_type: UnitType
+    scale: float
+    offset: float = 0.0
+    aliases: tuple[str, ...] = ()
+
+
+class ResolvedUnit(NamedTuple):
+    """A raw unit string resolved against a registry."""
+    unit_id: int
+    name: str
+    unit_type: UnitType
+    scale: float
+
+
+# Default bound on the number of raw unit spellings kept by a registry
+DEFAULT_CACHE_SIZE = 1024
+
 # Base units for each type
 BASE_UNITS = {
     UnitType.VOLUME: "ml",
@@ -18,118 +54,283 @@ BASE_UNITS = {
     UnitType.COUNT: "count",
 }
 
-# Conversion factors to base units
-# For volume and weight: multiply by this to get base unit
-CONVERSIONS = {
+# Built-in units. For volume and weight the scale converts to milliliters and
+# grams; temperatures convert to Celsius.
+BUILTIN_UNITS = (
     # Volume (to milliliters)
-    "tsp": 4.92892,
-    "teaspoon": 4.92892,
-    "teaspoons": 4.92892,
-    "tbsp": 14.7868,
-    "tablespoon": 14.7868,
-    "tablespoons": 14.7868,
-    "floz": 29.5735,
-    "fl oz": 29.5735,
-    "fluid ounce": 29.5735,
-    "fluid ounces": 29.5735,
-    "cup": 236.588,
-    "cups": 236.588,
-    "pint": 473.176,
-    "pints": 473.176,
-    "quart": 946.353,
-    "quarts": 946.353,
-    "gallon": 3785.41,
-    "gallons": 3785.41,
-    "ml": 1.0,
-    "milliliter": 1.0,
-    "milliliters": 1.0,
-    "l": 1000.0,
-    "liter": 1000.0,
-    "liters": 1000.0,
+    UnitDefinition("tsp", UnitType.VOLUME, 4.92892, aliases=("teaspoon", "teaspoons")),
+    UnitDefinition("tbsp", UnitType.VOLUME, 14.7868, aliases=("tablespoon", "tablespoons")),
+    UnitDefinition("floz", UnitType.VOLUME, 29.5735, aliases=("fl oz", "fluid ounce", "fluid ounces")),
+    UnitDefinition("cup", UnitType.VOLUME, 236.588, aliases=("cups",)),
+    UnitDefinition("pint", UnitType.VOLUME, 473.176, aliases=("pints",)),
+    UnitDefinition("quart", UnitType.VOLUME, 946.353, aliases=("quarts",)),
+    UnitDefinition("gallon", UnitType.VOLUME, 3785.41, aliases=("gallons",)),
+    UnitDefinition("ml", UnitType.VOLUME, 1.0, aliases=("milliliter", "milliliters")),
+    UnitDefinition("l", UnitType.VOLUME, 1000.0, aliases=("liter", "liters")),
 
     # Weight (to grams)
-    "oz": 28.3495,
-    "ounce": 28.3495,
-    "ounces": 28.3495,
-    "lb": 453.592,
-    "lbs": 453.592,
-    "pound": 453.592,
-    "pounds": 453.592,
-    "g": 1.0,
-    "gram": 1.0,
-    "grams": 1.0,
-    "kg": 1000.0,
-    "kilogram": 1000.0,
-    "kilograms": 1000.0,
+    UnitDefinition("oz", UnitType.WEIGHT, 28.3495, aliases=("ounce", "ounces")),
+    UnitDefinition("lb", UnitType.WEIGHT, 453.592, aliases=("lbs", "pound", "pounds")),
+    UnitDefinition("g", UnitType.WEIGHT, 1.0, aliases=("gram", "grams")),
+    UnitDefinition("kg", UnitType.WEIGHT, 1000.0, aliases=("kilogram", "kilograms")),
+
+    # Temperature (to Celsius)
+    UnitDefinition("fahrenheit", UnitType.TEMPERATURE, 5 / 9, -32 * 5 / 9, aliases=("f",)),
+    UnitDefinition("celsius", UnitType.TEMPERATURE, 1.0, aliases=("c",)),
+    UnitDefinition("kelvin", UnitType.TEMPERATURE, 1.0, -273.15, aliases=("k",)),
 
     # Count (dimensionless)
-    "count": 1.0,
-    "item": 1.0,
-    "items": 1.0,
-    "piece": 1.0,
-    "pieces": 1.0,
-    "whole": 1.0,
-}
+    UnitDefinition("count", UnitType.COUNT, 1.0, aliases=("item", "items", "piece", "pieces", "whole")),
+)
 
-# Unit type mapping
-UNIT_TYPES = {
-    # Volume
-    "tsp": UnitType.VOLUME,
-    "teaspoon": UnitType.VOLUME,
-    "teaspoons": UnitType.VOLUME,
-    "tbsp": UnitType.VOLUME,
-    "tablespoon": UnitType.VOLUME,
-    "tablespoons": UnitType.VOLUME,
-    "floz": UnitType.VOLUME,
-    "fl oz": UnitType.VOLUME,
-    "fluid ounce": UnitType.VOLUME,
-    "fluid ounces": UnitType.VOLUME,
-    "cup": UnitType.VOLUME,
-    "cups": UnitType.VOLUME,
-    "pint": UnitType.VOLUME,
-    "pints": UnitType.VOLUME,
-    "quart": UnitType.VOLUME,
-    "quarts": UnitType.VOLUME,
-    "gallon": UnitType.VOLUME,
-    "gallons": UnitType.VOLUME,
-    "ml": UnitType.VOLUME,
-    "milliliter": UnitType.VOLUME,
-    "milliliters": UnitType.VOLUME,
-    "l": UnitType.VOLUME,
-    "liter": UnitType.VOLUME,
-    "liters": UnitType.VOLUME,
-
-    # Weight
-    "oz": UnitType.WEIGHT,
-    "ounce": UnitType.WEIGHT,
-    "ounces": UnitType.WEIGHT,
-    "lb": UnitType.WEIGHT,
-    "lbs": UnitType.WEIGHT,
-    "pound": UnitType.WEIGHT,
-    "pounds": UnitType.WEIGHT,
-    "g": UnitType.WEIGHT,
-    "gram": UnitType.WEIGHT,
-    "grams": UnitType.WEIGHT,
-    "kg": UnitType.WEIGHT,
-    "kilogram": UnitType.WEIGHT,
-    "kilograms": UnitType.WEIGHT,
-
-    # Temperature
-    "fahrenheit": UnitType.TEMPERATURE,
-    "f": UnitType.TEMPERATURE,
-    "celsius": UnitType.TEMPERATURE,
-    "c": UnitType.TEMPERATURE,
-    "kelvin": UnitType.TEMPERATURE,
-    "k": UnitType.TEMPERATURE,
-
-    # Count
-    "count": UnitType.COUNT,
-    "item": UnitType.COUNT,
-    "items": UnitType.COUNT,
-    "piece": UnitType.COUNT,
-    "pieces": UnitType.COUNT,
-    "whole": UnitType.COUNT,
-}
+# Readable unit ladders, smallest unit first. An amount in any unit of a
+# ladder is expressed in the largest unit of that ladder it reaches at least
+# one of, e.g. 48 tsp -> 1 cup and 0.5 kg -> 500 g.
+UNIT_LADDERS = (
+    ("tsp", "tbsp", "cup", "quart", "gallon"),
+    ("ml", "l"),
+    ("oz", "lb"),
+    ("g", "kg"),
+)
+
+# Relative slack when comparing against a ladder threshold. The factors above
+# are rounded, so e.g. 3 tsp comes to 0.99997 tbsp and should still reach it.
+_LADDER_TOLERANCE = 1e-4
+
+
+class UnitRegistry:
+    """
+    Compiled unit tables.
+
+    Every alias is interned to an integer unit ID when the registry is built,
+    and for each unit type a dense from -> to matrix of ``(scale, offset)``
+    pairs is precomputed. Converting between two resolved IDs is then a
+    single indexed lookup followed by ``value * scale + offset``.
+
+    Raw unit strings are resolved through a bounded LRU cache, so repeated
+    spellings such as ``"Cups "`` skip normalization entirely. Apart from
+    that cache and the memoized exact transforms, registries are immutable
+    once built: every table is a tuple or a read-only mapping, so any number
+    of threads can convert through a registry without locking. The cache is
+    ``functools.lru_cache``, which is thread-safe with and without the GIL;
+    resizing it swaps in a new cache with a single attribute assignment.
+    Exact transforms are derived deterministically and stored with
+    ``dict.setdefault``, so concurrent first uses agree on one value.
+    """
+
+    def __init__(
+        self,
+        definitions: Iterable[UnitDefinition],
+        cache_size: int | None = DEFAULT_CACHE_SIZE,
+        ladders: Iterable[Iterable[str]] = UNIT_LADDERS,
+    ):
+        self.units: tuple[UnitDefinition, ...] = tuple(definitions)
+
+        ids: dict[str, int] = {}
+        for unit_id, unit in enumerate(self.units):
+            for alias in (unit.name, *unit.aliases):
+                alias = normalize_unit(alias)
+                if alias in ids:
+                    raise ValueError(f"Duplicate unit alias: {alias}")
+                ids[alias] = unit_id
+        self.ids: Mapping[str, int] = MappingProxyType(ids)
+
+        self.types: tuple[UnitType, ...] = tuple(u.unit_type for u in self.units)
+
+        # Per-type matrices; _rows[id] is the row of id's type matrix and
+        # _columns[id] is the position of id within that type.
+        columns = [0] * len(self.units)
+        members: dict[UnitType, list[int]] = {}
+        for unit_id, unit_type in enumerate(self.types):
+            group = members.setdefault(unit_type, [])
+            columns[unit_id] = len(group)
+            group.append(unit_id)
+        self._columns = tuple(columns)
+
+        rows: list[tuple[tuple[float, float], ...]] = [()] * len(self.units)
+        for group in members.values():
+            for from_id in group:
+                rows[from_id] = tuple(
+                    self._compile(self.units[from_id], self.units[to_id])
+                    for to_id in group
+                )
+        self._rows = tuple(rows)
+
+        # Alias views kept for the module-level CONVERSIONS/UNIT_TYPES mappings
+        self.factors: Mapping[str, float] = MappingProxyType({
+            alias: self.units[unit_id].scale
+            for alias, unit_id in ids.items()
+            if self.types[unit_id] != UnitType.TEMPERATURE
+        })
+        self.alias_types: Mapping[str, UnitType] = MappingProxyType({
+            alias: self.types[unit_id] for alias, unit_id in ids.items()
+        })
+
+        # For each unit on a ladder: (threshold in base units, target ID,
+        # 1 / target scale) for every rung, largest first. Rungs this
+        # registry does not define are skipped, so a registry without the
+        # built-in units simply has shorter (or no) ladders.
+        steps: list[tuple[tuple[float, int, float], ...]] = [()] * len(self.units)
+        for ladder in ladders:
+            rungs = [ids[alias] for alias in map(normalize_unit, ladder) if alias in ids]
+            compiled = tuple(
+                (self.units[rung].scale * (1 - _LADDER_TOLERANCE), rung, 1 / self.units[rung].scale)
+                for rung in reversed(rungs)
+            )
+            for rung in rungs:
+                steps[rung] = compiled
+        self._ladders = tuple(steps)
+
+        # Exact (Fraction) transforms, filled in on first use of each pair
+        self._exact: dict[tuple[int, int], tuple["Fraction", "Fraction"]] = {}
+
+        self.set_cache_size(cache_size)
+
+    @staticmethod
+    def _exact_pair(source: UnitDefinition, target: UnitDefinition) -> tuple["Fraction", "Fraction"]:
+        """Fold source -> base -> target into a single (scale, offset) pair of Fractions."""
+        from lethimcook.exact import as_fraction
+
+        scale = as_fraction(source.scale) / as_fraction(target.scale)
+        offset = (as_fraction(source.offset) - as_fraction(target.offset)) / as_fraction(target.scale)
+        return scale, offset
+
+    @classmethod
+    def _compile(cls, source: UnitDefinition, target: UnitDefinition) -> tuple[float, float]:
+        """
+        Fold source -> base -> target into a single (scale, offset) pair.
+
+        Folded in exact arithmetic and rounded once, so pairs such as
+        celsius -> fahrenheit get exactly 1.8 and 32.0 and 100 C is 212.0 F.
+        """
+        if source is target:
+            return 1.0, 0.0
+        scale, offset = cls._exact_pair(source, target)
+        return float(scale), float(offset)
+
+    def __contains__(self, unit: object) -> bool:
+        return isinstance(unit, str) and normalize_unit(unit) in self.ids
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def lookup(self, unit: str) -> int:
+        """Resolve a unit name or alias to its unit ID."""
+        try:
+            return self.ids[normalize_unit(unit)]
+        except KeyError:
+            raise ValueError(f"Unknown unit: {unit}") from None
+
+    def _resolve(self, unit: str) -> ResolvedUnit:
+        """Resolve a raw unit string (uncached)."""
+        unit_id = self.lookup(unit)
+        definition = self.units[unit_id]
+        return ResolvedUnit(unit_id, definition.name, definition.unit_type, definition.scale)
+
+    def set_cache_size(self, maxsize: int | None) -> None:
+        """
+        Rebuild the resolution cache with a new size bound.
+
+        The least recently used spelling is evicted once ``maxsize`` entries
+        are held; ``None`` disables the bound and ``0`` disables caching.
+        Statistics are reset.
+        """
+        self.resolve = lru_cache(maxsize=maxsize)(self._resolve)
+
+    def cache_info(self):
+        """Return hits, misses, maxsize and currsize of the resolution cache."""
+        return self.resolve.cache_info()
+
+    def cache_clear(self) -> None:
+        """Empty the resolution cache and reset its statistics."""
+        self.resolve.cache_clear()
+
+    def name(self, unit_id: int) -> str:
+        """Return the canonical name of a unit ID."""
+        return self.units[unit_id].name
+
+    def transform(self, from_id: int, to_id: int) -> tuple[float, float]:
+        """
+        Return the precomputed (scale, offset) pair between two unit IDs.
+
+        Raises:
+            ValueError: If the units are of different types
+        """
+        if self.types[from_id] != self.types[to_id]:
+            raise ValueError(
+                f"Cannot convert between {self.types[from_id]} and {self.types[to_id]}"
+            )
+        return self._rows[from_id][self._columns[to_id]]
+
+    def _exact_transform(self, from_id: int, to_id: int) -> tuple["Fraction", "Fraction"]:
+        self.transform(from_id, to_id)  # type check
+        return self._exact_pair(self.units[from_id], self.units[to_id])
+
+    def exact_transform(self, from_id: int, to_id: int) -> tuple["Fraction", "Fraction"]:
+        """
+        Return the (scale, offset) pair between two unit IDs as Fractions.
+
+        Computed on first use for each pair and memoized.
+
+        Raises:
+            ValueError: If the units are of different types
+        """
+        key = (from_id, to_id)
+        pair = self._exact.get(key)
+        if pair is None:
+            pair = self._exact.setdefault(key, self._exact_transform(from_id, to_id))
+        return pair
+
+    def convert(self, value: float, from_id: int, to_id: int) -> float:
+        """Convert a value between two resolved unit IDs."""
+        scale, offset = self.transform(from_id, to_id)
+        return value * scale + offset
+
+    def readable(self, value: float, unit_id: int) -> tuple[float, int]:
+        """
+        Express a value in the most readable unit of its ladder.
+
+        Picks the largest unit of the ladder (see UNIT_LADDERS) that the value
+        reaches at least one of, falling back to the smallest. Units that are
+        not on a ladder are returned unchanged.
+
+        Returns:
+            The converted value and its unit ID
+        """
+        steps = self._ladders[unit_id]
+        if not steps:
+            return value, unit_id
+        base = value * self.units[unit_id].scale
+        magnitude = abs(base)
+        for threshold, target, inverse in steps:
+            if magnitude >= threshold:
+                break
+        return base * inverse, target
+
+
+class _RegistryView(Mapping):
+    """Read-only alias mapping backed by the active registry."""
+
+    def __init__(self, attribute: str):
+        self._attribute = attribute
+
+    def _mapping(self) -> Mapping:
+        return getattr(_registry, self._attribute)
+
+    def __getitem__(self, key):
+        return self._mapping()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._mapping())
+
+    def __len__(self) -> int:
+        return len(self._mapping())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._mapping()
+
+    def __repr__(self) -> str:
+        return repr(dict(self._mapping()))
 
 
 def normalize_unit(unit: str) -> str:
@@ -137,9 +338,282 @@ def normalize_unit(unit: str) -> str:
     return unit.lower().strip()
 
 
+_registry = UnitRegistry(BUILTIN_UNITS)
+
+# Units added with register_units, in registration order
+_custom_units: tuple[UnitDefinition, ...] = ()
+
+# Serializes registry rebuilds; readers never take it and instead read
+# _registry once per call, so they always see one complete registry
+_registry_lock = threading.Lock()
+
+# Conversion factors to base units, keyed by every alias
+# For volume and weight: multiply by this to get base unit
+CONVERSIONS: Mapping[str, float] = _RegistryView("factors")
+
+# Unit type mapping, keyed by every alias
+UNIT_TYPES: Mapping[str, UnitType] = _RegistryView("alias_types")
+
+
+def get_registry() -> UnitRegistry:
+    """Return the active unit registry."""
+    return _registry
+
+
+def resolve_unit(unit: str) -> ResolvedUnit:
+    """Resolve a raw unit string through the active registry's cache."""
+    return _registry.resolve(unit)
+
+
+def resolution_cache_info():
+    """Return statistics for the active registry's resolution cache."""
+    return _registry.cache_info()
+
+
+def set_resolution_cache_size(maxsize: int | None) -> None:
+    """Set the size bound of the active registry's resolution cache."""
+    with _registry_lock:
+        _registry.set_cache_size(maxsize)
+
+
+_SPEC_KEYS = frozenset({"type", "scale", "offset", "amount", "unit", "aliases"})
+
+
+def _number(name: str, key: str, value: object) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Invalid unit definition {name!r}: {key} must be a number")
+    return float(value)
+
+
+def _check_definition(definition: UnitDefinition) -> UnitDefinition:
+    """
+    Validate a UnitDefinition as parse_units validates a spec.
+
+    Raises:
+        ValueError: If the name, type, scale, offset or aliases are invalid
+    """
+    name = definition.name
+    if not isinstance(name, str) or not name.strip():
+        raise ValueError(f"Invalid unit name: {name!r}")
+    try:
+        unit_type = UnitType(definition.unit_type)
+    except ValueError:
+        raise ValueError(
+            f"Invalid unit definition {name!r}: type must be one of {', '.join(UnitType)}"
+        ) from None
+    scale = _number(name, "scale", definition.scale)
+    offset = _number(name, "offset", definition.offset)
+    if not (isfinite(scale) and scale > 0):
+        raise ValueError(f"Invalid unit definition {name!r}: scale must be positive and finite")
+    if not isfinite(offset):
+        raise ValueError(f"Invalid unit definition {name!r}: offset must be finite")
+    if offset and unit_type != UnitType.TEMPERATURE:
+        raise ValueError(
+            f"Invalid unit definition {name!r}: offset is only allowed for temperature"
+        )
+    aliases = definition.aliases
+    if isinstance(aliases, str) or not all(isinstance(a, str) for a in aliases):
+        raise ValueError(f"Invalid unit definition {name!r}: aliases must be a list of strings")
+    return UnitDefinition(name, unit_type, scale, offset, tuple(aliases))
+
+
+def parse_units(
+    specs: Mapping[str, Mapping], registry: "UnitRegistry | None" = None
+) -> list[UnitDefinition]:
+    """
+    Validate unit specs and turn them into UnitDefinitions.
+
+    Each spec maps a unit name to either an absolute definition relative to
+    the base unit of its type::
+
+        {"metric cup": {"type": "volume", "scale": 250, "aliases": ["metric cups"]}}
+
+    or a relative one in terms of a unit that is already known, either in
+    ``registry`` (the active registry by default) or earlier in ``specs``::
+
+        {"dessertspoon": {"amount": 2, "unit": "tsp", "aliases": ["dsp"]}}
+
+    Temperatures are affine, so they can only be defined absolutely;
+    ``offset`` is only allowed there.
+
+    Raises:
+        ValueError: If a spec is malformed, refers to an unknown unit, or
+            reuses a name or alias of another spec
+    """
+    registry = registry or _registry
+    parsed: dict[str, UnitDefinition] = {}
+    for name, spec in specs.items():
+        if not isinstance(name, str) or not name.strip():
+            raise ValueError(f"Invalid unit name: {name!r}")
+        if not isinstance(spec, Mapping):
+            raise ValueError(f"Invalid unit definition {name!r}: expected a table")
+        unknown = set(spec) - _SPEC_KEYS
+        if unknown:
+            raise ValueError(
+                f"Invalid unit definition {name!r}: unknown keys {', '.join(sorted(unknown))}"
+            )
+
+        aliases = spec.get("aliases", ())
+        if isinstance(aliases, str) or not all(isinstance(a, str) for a in aliases):
+            raise ValueError(f"Invalid unit definition {name!r}: aliases must be a list of strings")
+
+        if "scale" in spec:
+            if "amount" in spec or "unit" in spec:
+                raise ValueError(
+                    f"Invalid unit definition {name!r}: give either scale or amount and unit"
+                )
+            try:
+                unit_type = UnitType(spec.get("type"))
+            except ValueError:
+                raise ValueError(
+                    f"Invalid unit definition {name!r}: type must be one of "
+                    f"{', '.join(UnitType)}"
+                ) from None
+            scale = _number(name, "scale", spec["scale"])
+            offset = _number(name, "offset", spec.get("offset", 0.0))
+            if offset and unit_type != UnitType.TEMPERATURE:
+                raise ValueError(
+                    f"Invalid unit definition {name!r}: offset is only allowed for temperature"
+                )
+        elif "amount" in spec and "unit" in spec:
+            if "offset" in spec:
+                raise ValueError(
+                    f"Invalid unit definition {name!r}: offset needs an absolute scale"
+                )
+            reference = parsed.get(normalize_unit(str(spec["unit"])))
+            if reference is None:
+                try:
+                    reference = registry.units[registry.lookup(str(spec["unit"]))]
+                except ValueError:
+                    raise ValueError(
+                        f"Invalid unit definition {name!r}: unknown unit {spec['unit']!r}"
+                    ) from None
+            if reference.unit_type == UnitType.TEMPERATURE:
+                raise ValueError(
+                    f"Invalid unit definition {name!r}: cannot define a unit relative "
+                    f"to {reference.name}"
+                )
+            if "type" in spec and spec["type"] != reference.unit_type:
+                raise ValueError(
+                    f"Invalid unit definition {name!r}: {reference.name} is not a "
+                    f"{spec['type']} unit"
+                )
+            unit_type = reference.unit_type
+            scale = _number(name, "amount", spec["amount"]) * reference.scale
+            offset = 0.0
+        else:
+            raise ValueError(f"Invalid unit definition {name!r}: give either scale or amount and unit")
+
+        definition = _check_definition(
+            UnitDefinition(name, unit_type, scale, offset, tuple(aliases))
+        )
+        for alias in (name, *definition.aliases):
+            alias = normalize_unit(alias)
+            if alias in parsed:
+                raise ValueError(f"Duplicate unit alias: {alias}")
+            parsed[alias] = definition
+    return list(dict.fromkeys(parsed.values()))
+
+
+def register_units(
+    units: Iterable[UnitDefinition] | Mapping[str, Mapping], *, replace: bool = False
+) -> UnitRegistry:
+    """
+    Add units and atomically swap in a recompiled registry.
+
+    Custom units are compiled into the same ID and matrix tables as the
+    built-in ones, so they convert just as fast. The new registry is built
+    off to the side and published with a single assignment; concurrent
+    conversions keep using the registry they started with. If validation
+    fails the active registry is left untouched.
+
+    Args:
+        units: UnitDefinitions, or specs in the format accepted by parse_units
+        replace: Drop previously registered custom units first (for reloads)
+
+    Returns:
+        The new active registry
+
+    Raises:
+        ValueError: If a spec or UnitDefinition is invalid, or an alias is
+            already taken
+    """
+    global _registry, _custom_units
+    with _registry_lock:
+        base = _custom_units if not replace else ()
+        if isinstance(units, Mapping):
+            context = _registry if not replace else UnitRegistry(BUILTIN_UNITS, cache_size=0)
+            units = parse_units(units, context)
+        else:
+            units = [_check_definition(unit) for unit in units]
+        custom = (*base, *units)
+        registry = UnitRegistry(
+            (*BUILTIN_UNITS, *custom), cache_size=_registry.cache_info().maxsize
+        )
+        _registry, _custom_units = registry, custom
+    return registry
+
+
+def load_units(path: str | PathLike, *, replace: bool = False) -> UnitRegistry:
+    """
+    Register the units defined in a TOML or JSON file.
+
+    The file holds a ``units`` table of specs as accepted by parse_units::
+
+        [units.dessertspoon]
+        amount = 2
+        unit = "tsp"
+        aliases = ["dsp", "dessertspoons"]
+
+    Raises:
+        ValueError: If the file cannot be parsed or a spec is invalid
+    """
+    import json
+    import tomllib
+    from pathlib import Path
+
+    path = Path(path)
+    try:
+        if path.suffix == ".json":
+            data = json.loads(path.read_text())
+        else:
+            data = tomllib.loads(path.read_text())
+    except (json.JSONDecodeError, tomllib.TOMLDecodeError) as e:
+        raise ValueError(f"Could not parse unit file {path}: {e}") from None
+    units = data.get("units") if isinstance(data, dict) else None
+    if not isinstance(units, Mapping):
+        raise ValueError(f"Unit file {path} has no units table")
+    return register_units(units, replace=replace)
+
+
+def reset_units() -> UnitRegistry:
+    """Drop every registered custom unit, keeping only the built-in ones."""
+    return register_units((), replace=True)
+
+
+def readable_unit(value: float, unit: str) -> tuple[float, str]:
+    """
+    Express a value in the most readable unit of its ladder.
+
+    Unknown units and units off any ladder pass through unchanged, and the
+    original spelling is kept when the unit does not change.
+
+    Example:
+        readable_unit(48, "tsp")  # (1.0000007, "cup")
+    """
+    registry = _registry
+    try:
+        unit_id = registry.resolve(unit).unit_id
+    except ValueError:
+        return value, unit
+    value, target = registry.readable(value, unit_id)
+    return value, unit if target == unit_id else registry.name(target)
+
+
 def get_unit_type(unit: str) -> UnitType:
     """Get the type of a unit."""
-    normalized = normalize_unit(unit)
-    if normalized not in UNIT_TYPES:
-        raise ValueError(f"Unknown unit: {unit}")
-    return UNIT_TYPES[normalized]
+    recorder = metrics.recorder
+    if recorder is None:
+        return _registry.resolve(unit).unit_type
+    with recorder.timer("units.resolve"):
+        return _registry.resolve(unit).unit_type
@@ -11,6 +11,9 @@ setup(
     python_requires=">=3.11",
     install_requires=["pydantic>=2.0.0"],
     extras_require={
+        "numpy": [
+            "numpy>=1.22",
+        ],
         "dev": [
             "pytest>=7.0.0",
         ],
@@ -0,0 +1,22 @@
+"""Fixtures shared across the test modules."""
+
+import pytest
+from lethimcook import Ingredient, Recipe
+
+
+@pytest.fixture
+def recipe():
+    """A small recipe with notes, extra fields, no-amount and unknown-unit ingredients."""
+    return Recipe(
+        servings=4,
+        name="Pancakes",
+        prep_time="10 minutes",
+        cuisine="american",
+        ingredients=[
+            Ingredient(amount=2, unit="cups", name="flour", note="sifted"),
+            Ingredient(amount=1, unit="tsp", name="salt", brand="Maldon"),
+            Ingredient(amount=3, unit="whole", name="eggs"),
+            Ingredient(unit="pinch", name="nutmeg"),
+            Ingredient(amount=1, unit="smidgen", name="love"),
+        ],
+    )
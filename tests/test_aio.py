@@ -0,0 +1,169 @@
+"""Tests for the asyncio API."""
+
+import asyncio
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from lethimcook import Ingredient, Recipe, aio, convert_many, convert_natural_stream, scale_recipe
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def _collect(iterator):
+    return [item async for item in iterator]
+
+
+@pytest.fixture
+def recipes():
+    return [
+        Recipe(servings=4, name=f"Recipe {i}", ingredients=[
+            Ingredient(amount=i + 1, unit="cups", name="flour"),
+            Ingredient(unit="pinch", name="salt"),
+        ])
+        for i in range(10)
+    ]
+
+
+class TestConvertMany:
+    """Test chunked convert_many."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 100])
+    def test_matches_sync(self, chunk_size):
+        values = list(range(10))
+        result = _run(aio.convert_many(values, "cups", "ml", chunk_size=chunk_size))
+        assert list(result) == pytest.approx(list(convert_many(values, "cups", "ml")))
+
+    def test_per_row_units(self):
+        result = _run(aio.convert_many([1, 350, 2], ["cup", "f", "cup"], "ml c ml".split(), chunk_size=2))
+        assert list(result) == pytest.approx([236.588, 176.667, 473.176], rel=1e-4)
+
+    def test_python_fallback_result_type(self, monkeypatch):
+        monkeypatch.setattr(aio, "_convert_many", lambda values, *args: array("d", values))
+        result = _run(aio.convert_many([1, 2, 3], "cups", "ml", chunk_size=2))
+        assert result == array("d", [1, 2, 3])
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="Unknown unit"):
+            _run(aio.convert_many([], "cups", "smidgen"))
+        with pytest.raises(ValueError, match="Expected 2 units, got 1"):
+            _run(aio.convert_many([1, 2], ["cup"], "ml"))
+        with pytest.raises(ValueError, match="Chunk size must be positive"):
+            _run(aio.convert_many([1], "cup", "ml", chunk_size=0))
+
+    def test_process_pool(self):
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result = _run(aio.convert_many([1, 2, 3], "cups", "ml", executor=executor, chunk_size=2))
+        assert list(result) == pytest.approx([236.588, 473.176, 709.764])
+
+
+class TestScaleRecipes:
+    """Test chunked scale_recipes."""
+
+    def test_matches_sync(self, recipes):
+        scaled = _run(_collect(aio.scale_recipes(recipes, 8, chunk_size=3)))
+        assert scaled == [scale_recipe(recipe, 8) for recipe in recipes]
+
+    def test_async_input(self, recipes):
+        async def source():
+            for recipe in recipes:
+                await asyncio.sleep(0)
+                yield recipe
+
+        scaled = _run(_collect(aio.scale_recipes(source(), 2, normalize_units=True)))
+        assert scaled == [scale_recipe(recipe, 2, normalize_units=True) for recipe in recipes]
+
+    def test_invalid_servings(self, recipes):
+        with pytest.raises(ValueError, match="New servings must be positive"):
+            _run(_collect(aio.scale_recipes(recipes, 0)))
+        with pytest.raises(ValueError, match="whole number"):
+            _run(_collect(aio.scale_recipes(recipes, 2.5)))
+
+    def test_backpressure(self, recipes):
+        consumed = []
+
+        def source():
+            for recipe in recipes:
+                consumed.append(recipe)
+                yield recipe
+
+        async def first():
+            async for scaled in aio.scale_recipes(source(), 8, chunk_size=2, max_pending=2):
+                return scaled
+
+        _run(first())
+        # Only the chunks submitted ahead of the consumer were read
+        assert len(consumed) == 4
+
+    def test_event_loop_runs_between_chunks(self, recipes):
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def scenario():
+            task = asyncio.create_task(ticker())
+            await _collect(aio.scale_recipes(recipes, 8, chunk_size=1))
+            task.cancel()
+
+        _run(scenario())
+        assert len(ticks) >= len(recipes)
+
+    def test_cancellation_skips_queued_chunks(self, recipes):
+        started = []
+        release = threading.Event()
+
+        def blocking_scale(chunk, *args):
+            started.append(chunk)
+            release.wait(5)
+            return chunk
+
+        async def scenario(executor):
+            task = asyncio.create_task(
+                _collect(aio.scale_recipes(recipes, 8, executor=executor, chunk_size=1, max_pending=3))
+            )
+            while not started:
+                await asyncio.sleep(0.001)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with pytest.MonkeyPatch.context() as monkeypatch, ThreadPoolExecutor(max_workers=1) as executor:
+            monkeypatch.setattr(aio, "_scale_chunk", blocking_scale)
+            _run(scenario(executor))
+            release.set()
+        assert len(started) == 1
+
+    def test_default_executor(self, recipes):
+        calls = []
+
+        class Recording(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                calls.append(args)
+                return super().submit(*args, **kwargs)
+
+        with Recording(max_workers=1) as executor:
+            aio.set_default_executor(executor)
+            try:
+                _run(_collect(aio.scale_recipes(recipes, 8, chunk_size=5)))
+            finally:
+                aio.set_default_executor(None)
+        assert len(calls) == 2
+
+
+class TestConvertNaturalStream:
+    """Test chunked convert_natural_stream."""
+
+    def test_matches_sync(self):
+        lines = ["2 cups to ml", "", "gibberish", "350 f to c"] * 3
+        results = _run(_collect(aio.convert_natural_stream(lines, chunk_size=5)))
+        assert results == list(convert_natural_stream(lines))
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError, match="Max pending chunks must be positive"):
+            _run(_collect(aio.convert_natural_stream(["1 cup to ml"], max_pending=0)))
@@ -0,0 +1,105 @@
+"""Tests for columnar recipe batches."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lethimcook import Ingredient, Recipe, RecipeBatch, scale_recipe
+
+
+@pytest.fixture
+def recipes():
+    return [
+        Recipe(
+            servings=4,
+            name="Pancakes",
+            ingredients=[
+                Ingredient(amount=2, unit="cups", name="flour"),
+                Ingredient(amount=1, unit="tsp", name="salt", note="fine"),
+                Ingredient(unit="pinch", name="nutmeg"),
+            ],
+        ),
+        Recipe(servings=2, ingredients=[]),
+        Recipe(
+            servings=1,
+            ingredients=[Ingredient(amount=3, unit="cups", name="milk", brand="x")],
+        ),
+    ]
+
+
+class TestRecipeBatch:
+    """Test packing recipes into columns."""
+
+    def test_columns(self, recipes):
+        batch = RecipeBatch.from_recipes(recipes)
+
+        assert len(batch) == 3
+        assert batch.offsets.tolist() == [0, 3, 3, 4]
+        assert batch.servings.tolist() == [4, 2, 1]
+        assert batch.amounts[:2].tolist() == [2, 1]
+        assert batch.recipe_index.tolist() == [0, 0, 0, 2]
+
+    def test_interned_codes(self, recipes):
+        batch = RecipeBatch.from_recipes(recipes)
+
+        assert batch.units == ["cups", "tsp", "pinch"]
+        assert batch.unit_codes.tolist() == [0, 1, 2, 0]
+        assert [batch.names[code] for code in batch.name_codes] == [
+            "flour", "salt", "nutmeg", "milk",
+        ]
+
+
+class TestRecipeBatchScaling:
+    """Test vectorized scaling and materialization."""
+
+    def test_scale_matrix(self, recipes):
+        scaled = RecipeBatch.from_recipes(recipes).scale([2, 8])
+
+        assert scaled.amounts.shape == (2, 4)
+        assert scaled.amounts[0, :2].tolist() == [1, 0.5]
+        assert scaled.amounts[1, 3] == 24
+
+    def test_materialized_recipe_matches_scale_recipe(self, recipes):
+        scaled = RecipeBatch.from_recipes(recipes).scale(range(1, 11))
+
+        for index, recipe in enumerate(recipes):
+            assert scaled.recipe(index, 6) == scale_recipe(recipe, 6)
+
+    def test_materialized_recipe_keeps_fields(self, recipes):
+        recipe = RecipeBatch.from_recipes(recipes).scale([8]).recipe(0, 8)
+
+        assert recipe.name == "Pancakes"
+        assert recipe.servings == 8
+        assert recipe.ingredients[1].note == "fine"
+        assert recipe.ingredients[2].amount is None
+
+    def test_recipes_for_target(self, recipes):
+        scaled = RecipeBatch.from_recipes(recipes).scale([3])
+
+        assert [r.servings for r in scaled.recipes(3)] == [3, 3, 3]
+
+    def test_unscaled_target(self, recipes):
+        scaled = RecipeBatch.from_recipes(recipes).scale([2])
+        with pytest.raises(KeyError):
+            scaled.recipe(0, 5)
+
+    def test_non_positive_target(self, recipes):
+        with pytest.raises(ValueError, match="positive"):
+            RecipeBatch.from_recipes(recipes).scale([4, 0])
+
+    @pytest.mark.parametrize("target", [2.5, True, "4"])
+    def test_non_integer_target(self, recipes, target):
+        with pytest.raises(ValueError, match="whole number"):
+            RecipeBatch.from_recipes(recipes).scale([4, target])
+
+    def test_numpy_targets(self, recipes):
+        scaled = RecipeBatch.from_recipes(recipes).scale(np.arange(1, 4))
+        assert scaled.targets.tolist() == [1, 2, 3]
+
+    def test_materialized_servings_are_ints(self, recipes):
+        scaled = RecipeBatch.from_recipes(recipes).scale([2, 4.0])
+        recipe = scaled.recipe(0, 2.0)
+        assert recipe.servings == 2 and type(recipe.servings) is int
+        assert scaled.recipe(0, 4).servings == 4
+        with pytest.raises(ValueError, match="whole number"):
+            scaled.recipe(0, 2.5)
@@ -1,7 +1,10 @@
 """Tests for core conversion functionality."""
 
+from array import array
+
 import pytest
-from lethimcook import convert
+from lethimcook import convert, convert_many
+from lethimcook.converter import _convert_many_python
 
 
 class TestVolumeConversions:
@@ -68,6 +71,14 @@ class TestTemperatureConversions:
         result = convert(100, "c", "f")
         assert abs(result - 212) < 0.01
 
+    @pytest.mark.parametrize("celsius, fahrenheit", [(0, 32), (100, 212), (180, 356), (200, 392)])
+    def test_celsius_to_fahrenheit_is_exact(self, celsius, fahrenheit):
+        assert convert(celsius, "c", "f") == fahrenheit
+
+    def test_fahrenheit_to_celsius_is_exact(self):
+        assert convert(32, "f", "c") == 0
+        assert convert(212, "f", "c") == 100
+
     def test_celsius_to_kelvin(self):
         result = convert(0, "celsius", "kelvin")
         assert abs(result - 273.15) < 0.01
@@ -120,3 +131,54 @@ class TestUnitVariations:
         result1 = convert(1, "CUP", "ML")
         result2 = convert(1, "cup", "ml")
         assert abs(result1 - result2) < 0.001
+
+
+class TestConvertMany:
+    """Test batch conversion."""
+
+    def test_single_unit_pair(self):
+        np = pytest.importorskip("numpy")
+        result = convert_many(np.array([1.0, 2.0, 4.0]), "cups", "ml")
+        assert isinstance(result, np.ndarray)
+        assert result.tolist() == pytest.approx([236.588, 473.176, 946.352])
+
+    def test_accepts_sequences_and_arrays(self):
+        pytest.importorskip("numpy")
+        expected = [convert(v, "lb", "g") for v in (1, 2.5)]
+        assert convert_many([1, 2.5], "lb", "g").tolist() == pytest.approx(expected)
+        assert convert_many(array("d", [1, 2.5]), "lb", "g").tolist() == pytest.approx(expected)
+
+    def test_temperature_is_affine(self):
+        pytest.importorskip("numpy")
+        result = convert_many([32, 212, 350], "f", "c")
+        assert result.tolist() == pytest.approx([0, 100, 176.6667], abs=0.001)
+
+    def test_per_row_units(self):
+        pytest.importorskip("numpy")
+        values = [1, 350, 1, 2]
+        from_units = ["cup", "f", "kg", "cup"]
+        to_units = ["ml", "c", "lb", "tbsp"]
+        result = convert_many(values, from_units, to_units)
+        expected = [convert(*row) for row in zip(values, from_units, to_units)]
+        assert result.tolist() == pytest.approx(expected)
+
+    def test_per_row_from_units_single_target(self):
+        pytest.importorskip("numpy")
+        result = convert_many([1, 1], ["tsp", "tbsp"], "ml")
+        assert result.tolist() == pytest.approx([4.92892, 14.7868])
+
+    def test_incompatible_units(self):
+        with pytest.raises(ValueError, match="Cannot convert between"):
+            convert_many([1, 2], ["cup", "cup"], ["ml", "g"])
+
+    def test_unit_length_mismatch(self):
+        with pytest.raises(ValueError, match="Expected 2 units"):
+            convert_many([1, 2], ["cup"], "ml")
+
+    def test_python_fallback(self):
+        result = _convert_many_python([1, 350], ["cup", "f"], ["ml", "c"])
+        assert isinstance(result, array)
+        assert list(result) == pytest.approx([236.588, 176.6667], abs=0.001)
+
+        result = _convert_many_python([2], "cups", "ml")
+        assert list(result) == pytest.approx([473.176])
@@ -0,0 +1,217 @@
+"""Tests for ingredient densities and volume/weight conversion."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from lethimcook import (
+    Ingredient,
+    IngredientRecord,
+    Recipe,
+    RecipeRecord,
+    convert,
+    convert_many,
+    convert_natural,
+    scale_recipe,
+)
+from lethimcook.density import (
+    DENSITIES,
+    DensityTable,
+    get_density_table,
+    ingredient_density,
+    register_densities,
+)
+from lethimcook.units import UnitType
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestDensityTable:
+    """Test ingredient name matching."""
+
+    @pytest.mark.parametrize("query, expected", [
+        ("flour", "flour"),
+        ("All-Purpose Flour", "all-purpose flour"),
+        ("all purpose flour", "all-purpose flour"),
+        ("eggs", "egg"),
+        ("sifted cake flour", "cake flour"),
+        ("packed brown sugar", "brown sugar"),
+        ("butter, softened", "butter"),
+        ("finely chopped walnuts", "chopped walnuts"),
+        ("granulated sugars", "granulated sugar"),
+        ("mozarella shredded", "shredded mozzarella"),
+        ("2 large eggs, beaten", "egg"),
+        ("cold unsalted butter", "butter"),
+        ("rice wine", "wine"),
+        ("brown rice flour", "rice flour"),
+    ])
+    def test_match(self, query, expected):
+        assert get_density_table().match(query) == expected
+
+    def test_no_match(self):
+        table = get_density_table()
+        assert table.match("chicken") is None
+        assert "chicken" not in table
+        with pytest.raises(ValueError, match="Unknown ingredient: chicken"):
+            table.density("chicken")
+
+    @pytest.mark.parametrize("query", ["sugar snap peas", "king arthur flour"])
+    def test_loose_word_matches_are_rejected(self, query):
+        assert get_density_table().match(query) is None
+
+    @pytest.mark.parametrize("query", ["coconut", "coconut oyl"])
+    def test_near_ties_are_ambiguous(self, query):
+        assert get_density_table().match(query) is None
+
+    @pytest.mark.parametrize("query, expected", [
+        ("choclate chips", "chocolate chips"),
+        ("heavy creem", "heavy cream"),
+        ("mapel syrup", "maple syrup"),
+    ])
+    def test_clear_misspellings_match(self, query, expected):
+        assert get_density_table().match(query) == expected
+
+    def test_ties_are_ambiguous(self):
+        table = DensityTable({"white bean": 0.8, "black bean": 0.7})
+        assert table.match("white black bean") is None
+
+    def test_matches_do_not_depend_on_hash_seed(self):
+        script = (
+            "from lethimcook.density import get_density_table\n"
+            "table = get_density_table()\n"
+            "for query in ['rice wine', 'brown rice flour', 'mozarella shredded', 'pecan nuts']:\n"
+            "    print(table.match(query))\n"
+        )
+        outputs = {
+            subprocess.run(
+                [sys.executable, "-c", script], capture_output=True, text=True, check=True,
+                cwd=ROOT, env={**os.environ, "PYTHONHASHSEED": str(seed)},
+            ).stdout
+            for seed in range(4)
+        }
+        assert len(outputs) == 1
+
+    def test_lookups_are_cached(self):
+        table = DensityTable(DENSITIES)
+        table.density("sifted cake flour")
+        table.density("sifted cake flour")
+        info = table.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_invalid_density(self):
+        with pytest.raises(ValueError, match="Invalid density for 'dust'"):
+            DensityTable({"dust": 0})
+
+    def test_register_densities(self):
+        try:
+            register_densities({"matcha powder": 0.4})
+            assert ingredient_density("matcha") == 0.4
+            register_densities({"flour": 0.6})
+            assert ingredient_density("flour") == 0.6
+            assert ingredient_density("matcha powder") == 0.4
+        finally:
+            register_densities({}, replace=True)
+        assert ingredient_density("flour") == DENSITIES["flour"]
+        assert get_density_table().match("matcha") is None
+
+
+class TestConvertWithIngredient:
+    """Test crossing between volume and weight."""
+
+    def test_volume_to_weight(self):
+        assert convert(1, "cup", "g", ingredient="water") == pytest.approx(236.588)
+        assert convert(2, "cups", "g", ingredient="flour") == pytest.approx(250.31, rel=1e-3)
+
+    def test_weight_to_volume(self):
+        assert convert(250.31, "g", "cups", ingredient="flour") == pytest.approx(2, rel=1e-3)
+
+    def test_round_trip(self):
+        grams = convert(3, "tbsp", "oz", ingredient="honey")
+        assert convert(grams, "oz", "tbsp", ingredient="honey") == pytest.approx(3)
+
+    def test_same_type_ignores_ingredient(self):
+        assert convert(1, "cup", "ml", ingredient="chicken") == pytest.approx(236.588)
+
+    def test_without_ingredient(self):
+        with pytest.raises(ValueError, match="Cannot convert between volume and weight"):
+            convert(1, "cup", "g")
+
+    def test_unknown_ingredient(self):
+        with pytest.raises(ValueError, match="Unknown ingredient"):
+            convert(1, "cup", "g", ingredient="chicken")
+
+    def test_other_types_cannot_cross(self):
+        with pytest.raises(ValueError, match="Cannot convert between temperature and weight"):
+            convert(1, "celsius", "g", ingredient="water")
+
+    def test_convert_many(self):
+        result = convert_many([1, 2], "cup", "g", ingredient="water")
+        assert list(result) == pytest.approx([236.588, 473.176])
+        result = convert_many([1, 1], ["cup", "g"], ["g", "g"], ingredient="water")
+        assert list(result) == pytest.approx([236.588, 1])
+
+    def test_record_convert_to(self):
+        record = IngredientRecord(2, "cups", "flour").convert_to("g")
+        assert record.amount == pytest.approx(250.31, rel=1e-3)
+
+
+class TestNaturalWithIngredient:
+    """Test natural language queries naming an ingredient."""
+
+    @pytest.mark.parametrize("query, expected", [
+        ("2 cups flour to grams", "2 cups flour = 250.31 grams"),
+        ("convert 2 cups of flour to g", "2 cups of flour = 250.31 g"),
+        ("how many grams in 1 cup of water", "1 cup of water = 236.59 grams"),
+        ("8 fl oz water in ml", "8 fl oz water = 236.59 ml"),
+    ])
+    def test_queries(self, query, expected):
+        assert convert_natural(query) == expected
+
+    def test_unknown_ingredient(self):
+        with pytest.raises(ValueError, match="Unknown ingredient: chicken"):
+            convert_natural("2 cups chicken to grams")
+
+    def test_unknown_unit(self):
+        with pytest.raises(ValueError, match="Unknown unit: smidgens flour"):
+            convert_natural("2 smidgens flour to grams")
+
+
+class TestScaleByWeight:
+    """Test displaying scaled recipes in another unit type."""
+
+    @pytest.fixture
+    def recipe(self):
+        return Recipe(
+            servings=2,
+            ingredients=[
+                Ingredient(amount=1, unit="cup", name="flour"),
+                Ingredient(amount=1, unit="cup", name="mystery powder"),
+                Ingredient(amount=2, unit="whole", name="eggs"),
+                Ingredient(unit="pinch", name="salt"),
+            ],
+        )
+
+    def test_volume_in_grams(self, recipe):
+        scaled = scale_recipe(recipe, 4, display_units={UnitType.VOLUME: "g"})
+        flour, mystery, eggs, salt = scaled.ingredients
+        assert (flour.unit, flour.amount) == ("g", pytest.approx(250.31, rel=1e-3))
+        assert (mystery.unit, mystery.amount) == ("cup", 2)
+        assert (eggs.unit, eggs.amount) == ("whole", 4)
+        assert salt.amount is None
+
+    def test_normalize_after_display(self, recipe):
+        scaled = scale_recipe(
+            recipe, 20, normalize_units=True, display_units={UnitType.VOLUME: "g"}
+        )
+        assert scaled.ingredients[0].unit == "kg"
+
+    def test_record_matches_model(self, recipe):
+        display = {UnitType.VOLUME: "oz"}
+        scaled = scale_recipe(RecipeRecord.from_model(recipe), 4, display_units=display)
+        assert scaled.to_model() == scale_recipe(recipe, 4, display_units=display)
+
+    def test_invalid_display_unit(self, recipe):
+        with pytest.raises(ValueError, match="Display unit celsius is not a volume unit"):
+            scale_recipe(recipe, 4, display_units={UnitType.VOLUME: "celsius"})
@@ -0,0 +1,142 @@
+"""Tests for exact rational conversion and scaling."""
+
+from fractions import Fraction
+
+import pytest
+from lethimcook import (
+    ExactIngredient,
+    ExactRecipe,
+    Ingredient,
+    Recipe,
+    RecipeRecord,
+    scale_recipe,
+)
+from lethimcook.converter import convert_exact
+from lethimcook.exact import as_fraction
+from lethimcook.units import UnitType
+
+
+@pytest.fixture
+def recipe():
+    return Recipe(
+        servings=4,
+        ingredients=[
+            Ingredient(amount=1 / 3, unit="cup", name="sugar"),
+            Ingredient(amount=0.1, unit="tsp", name="salt"),
+            Ingredient(amount=3, unit="whole", name="eggs"),
+            Ingredient(unit="pinch", name="nutmeg"),
+        ],
+    )
+
+
+class TestAsFraction:
+    """Test reading floats as exact fractions."""
+
+    @pytest.mark.parametrize("value, expected", [
+        (1 / 3, Fraction(1, 3)),
+        (2 / 3, Fraction(2, 3)),
+        (1.5, Fraction(3, 2)),
+        (1 / 16, Fraction(1, 16)),
+        (0.1, Fraction(1, 10)),
+        (4.92892, Fraction(123223, 25000)),
+        (5 / 9, Fraction(5, 9)),
+        (3, Fraction(3)),
+        (Fraction(7, 5), Fraction(7, 5)),
+    ])
+    def test_as_fraction(self, value, expected):
+        assert as_fraction(value) == expected
+
+
+class TestConvertExact:
+    """Test exact unit conversion."""
+
+    def test_returns_fraction(self):
+        result = convert_exact(2, "cups", "ml")
+        assert isinstance(result, Fraction)
+        assert result == Fraction("473.176")
+
+    def test_temperature(self):
+        assert convert_exact(212, "f", "c") == 100
+        assert convert_exact(0, "c", "k") == Fraction("273.15")
+
+    def test_round_trip_is_exact(self):
+        tbsp = convert_exact(1 / 3, "cup", "tbsp")
+        assert convert_exact(tbsp, "tbsp", "cup") == Fraction(1, 3)
+
+    def test_density(self):
+        grams = convert_exact(2, "cups", "g", ingredient="flour")
+        assert grams == 2 * Fraction("236.588") * Fraction("0.529")
+        assert convert_exact(grams, "g", "cups", ingredient="flour") == 2
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="Cannot convert between volume and weight"):
+            convert_exact(1, "cup", "g")
+        with pytest.raises(ValueError, match="Unknown unit"):
+            convert_exact(1, "cup", "blorg")
+
+
+class TestScaleExact:
+    """Test exact recipe scaling."""
+
+    def test_amounts_are_fractions(self, recipe):
+        scaled = scale_recipe(recipe, 6, exact=True)
+        sugar, salt, eggs, nutmeg = scaled.ingredients
+        assert sugar.amount == Fraction(1, 2)
+        assert salt.amount == Fraction(3, 20)
+        assert eggs.amount == Fraction(9, 2)
+        assert nutmeg.amount is None
+
+    def test_chained_scaling_does_not_drift(self, recipe):
+        scaled = recipe
+        for servings in (7, 3, 12, 4):
+            scaled = scale_recipe(scaled, servings, exact=True)
+        assert [i.amount for i in scaled.ingredients[:3]] == [Fraction(1, 3), Fraction(1, 10), 3]
+
+    def test_normalize_units(self, recipe):
+        scaled = scale_recipe(recipe, 12, normalize_units=True, exact=True)
+        assert (scaled.ingredients[0].unit, scaled.ingredients[0].amount) == ("cup", 1)
+        scaled = scale_recipe(recipe, 4 * 48, normalize_units=True, exact=True)
+        salt = scaled.ingredients[1]
+        assert salt.unit == "tbsp"
+        assert salt.amount == Fraction(48, 10) * Fraction("4.92892") / Fraction("14.7868")
+
+    def test_display_units(self, recipe):
+        scaled = scale_recipe(recipe, 4, display_units={UnitType.VOLUME: "g"}, exact=True)
+        sugar = scaled.ingredients[0]
+        assert sugar.unit == "g"
+        assert sugar.amount == Fraction(1, 3) * Fraction("236.588") * Fraction("0.845")
+
+    @pytest.mark.parametrize("ingredient, display_units", [
+        (Ingredient(amount=10, unit="cups", name="water"), {UnitType.VOLUME: "ml"}),
+        (Ingredient(amount=10, unit="cups", name="water"), {UnitType.VOLUME: "g"}),
+        (Ingredient(amount=43, unit="lb", name="flour"), {UnitType.WEIGHT: "g"}),
+    ])
+    def test_display_and_normalize_pick_float_units(self, ingredient, display_units):
+        recipe = Recipe(servings=2, ingredients=[ingredient])
+        options = {"normalize_units": True, "display_units": display_units}
+        exact = scale_recipe(recipe, 2, exact=True, **options).ingredients[0]
+        approximate = scale_recipe(recipe, 2, **options).ingredients[0]
+        assert exact.unit == approximate.unit
+        assert exact.unit in ("l", "kg")
+        assert float(exact.amount) == pytest.approx(approximate.amount)
+
+    def test_record_matches_model(self, recipe):
+        record = scale_recipe(RecipeRecord.from_model(recipe), 6, exact=True)
+        assert record.to_model() == scale_recipe(recipe, 6, exact=True)
+
+    def test_serializes_as_fraction_string(self, recipe):
+        scaled = scale_recipe(recipe, 6, exact=True)
+        dumped = scaled.model_dump_json()
+        assert '"amount":"1/2"' in dumped
+        assert ExactRecipe.model_validate_json(dumped) == scaled
+
+    def test_default_models_stay_float(self, recipe):
+        scaled = scale_recipe(recipe, 6, exact=True)
+        assert isinstance(scaled, ExactRecipe)
+        assert isinstance(scaled.ingredients[0], ExactIngredient)
+        assert type(scale_recipe(scaled, 4)) is Recipe
+        assert type(scale_recipe(scaled, 4).ingredients[0].amount) is float
+        with pytest.raises(ValueError):
+            Ingredient(amount="1/2", unit="cup", name="sugar")
+        schema = Ingredient.model_json_schema()["properties"]["amount"]
+        assert schema["anyOf"][0] == {"type": "number"}
@@ -0,0 +1,77 @@
+"""Tests for package import cost."""
+
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import lethimcook
+
+# Cumulative import time allowed for `import lethimcook`, in microseconds.
+# Importing pydantic alone takes well over this on typical hardware.
+IMPORT_BUDGET_US = 75_000
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _run(statement: str, *options: str) -> subprocess.CompletedProcess:
+    """Run a statement in a fresh interpreter."""
+    return subprocess.run(
+        [sys.executable, *options, "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    )
+
+
+def _importtime(statement: str) -> dict[str, int]:
+    """Return cumulative import time per module, in microseconds."""
+    cumulative = {}
+    for line in _run(statement, "-X", "importtime").stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$", line)
+        if match:
+            cumulative[match.group(2)] = int(match.group(1))
+    return cumulative
+
+
+def _loaded_modules(statement: str) -> set[str]:
+    """Return the modules loaded after running a statement."""
+    output = _run(f"{statement}\nimport sys\nprint(*sys.modules)").stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    """Test that conversion-only users never load pydantic."""
+
+    def test_conversion_does_not_import_pydantic(self):
+        modules = _loaded_modules(
+            "import lethimcook; lethimcook.convert(1, 'cup', 'ml');"
+            "lethimcook.convert_natural('2 cups to ml')"
+        )
+        assert "lethimcook.recipe" not in modules
+        assert "pydantic" not in modules
+        assert "numpy" not in modules
+
+    def test_recipe_exports_load_on_access(self):
+        modules = _loaded_modules("from lethimcook import Recipe")
+        assert "lethimcook.recipe" in modules
+
+    def test_cold_start_budget(self):
+        # Best of three runs to absorb scheduler noise
+        timings = [_importtime("import lethimcook")["lethimcook"] for _ in range(3)]
+        assert min(timings) < IMPORT_BUDGET_US
+
+    def test_lazy_exports(self):
+        from lethimcook.recipe import Ingredient, Recipe, scale_recipe
+
+        assert lethimcook.Recipe is Recipe
+        assert lethimcook.Ingredient is Ingredient
+        assert lethimcook.scale_recipe is scale_recipe
+        assert "Recipe" in dir(lethimcook)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            lethimcook.not_an_export
@@ -0,0 +1,109 @@
+"""Tests for the ingredient line parser."""
+
+import pytest
+from lethimcook import IngredientRecord, UnparsedLine, parse_ingredient, parse_ingredients
+from lethimcook.units import register_units, reset_units
+
+
+class TestAmounts:
+    """Test the number forms accepted as amounts."""
+
+    @pytest.mark.parametrize("line, amount", [
+        ("2 cups flour", 2),
+        ("1.25 cups flour", 1.25),
+        (".5 cups flour", 0.5),
+        ("1/3 cup flour", 1 / 3),
+        ("1 1/2 cups flour", 1.5),
+        ("½ cup flour", 0.5),
+        ("1½ cups flour", 1.5),
+        ("2 ¾ cups flour", 2.75),
+        ("1⁄4 cup flour", 0.25),
+    ])
+    def test_amount(self, line, amount):
+        assert parse_ingredient(line).amount == pytest.approx(amount)
+
+    @pytest.mark.parametrize("line", [
+        "2-3 cups flour", "2 - 3 cups flour", "2–3 cups flour", "2 to 3 cups flour", "2 or 3 cups flour",
+    ])
+    def test_range(self, line):
+        record = parse_ingredient(line)
+        assert (record.amount, record.unit, record.name) == (2, "cups", "flour")
+        assert record.extra == {"amount_max": 3}
+
+    def test_no_amount(self):
+        assert parse_ingredient("salt to taste") == IngredientRecord(None, "", "salt to taste")
+
+    def test_zero_denominator(self):
+        with pytest.raises(ValueError, match="Invalid amount"):
+            parse_ingredient("1/0 cup flour")
+
+
+class TestUnitsAndNames:
+    """Test unit detection, names and notes."""
+
+    def test_full_line(self):
+        assert parse_ingredient("1 1/2 cups all-purpose flour, sifted") == IngredientRecord(
+            1.5, "cups", "all-purpose flour", "sifted"
+        )
+
+    @pytest.mark.parametrize("line, unit, name", [
+        ("2 fl oz vanilla extract", "fl oz", "vanilla extract"),
+        ("1 Tbsp. olive oil", "Tbsp", "olive oil"),
+        ("2 cups of milk", "cups", "milk"),
+        ("3 eggs", "count", "eggs"),
+        ("1 whole chicken", "whole", "chicken"),
+        ("1 c sugar", "count", "c sugar"),
+    ])
+    def test_units(self, line, unit, name):
+        record = parse_ingredient(line)
+        assert (record.unit, record.name) == (unit, name)
+
+    def test_custom_units(self):
+        try:
+            register_units({"stick": {"type": "weight", "scale": 113.4, "aliases": ["sticks"]}})
+            assert parse_ingredient("2 sticks butter").unit == "sticks"
+        finally:
+            reset_units()
+
+    def test_notes(self):
+        record = parse_ingredient("2 (14 oz) cans tomatoes, drained, rinsed")
+        assert record.name == "cans tomatoes"
+        assert record.note == "14 oz, drained, rinsed"
+
+    def test_to_model(self):
+        model = parse_ingredient("1-2 tsp salt (optional)").to_model()
+        assert model.amount == 1
+        assert model.amount_max == 2
+        assert model.note == "optional"
+
+    @pytest.mark.parametrize("line, message", [
+        ("", "Empty ingredient line"),
+        ("2 cups", "No ingredient name in: 2 cups"),
+        ("3", "No ingredient name in: 3"),
+    ])
+    def test_invalid(self, line, message):
+        with pytest.raises(ValueError, match=message):
+            parse_ingredient(line)
+
+
+class TestParseIngredients:
+    """Test bulk parsing."""
+
+    def test_skips_blank_lines(self):
+        lines = ["1 cup sugar\n", "\n", "  ", "2 eggs\n"]
+        assert [r.name for r in parse_ingredients(lines)] == ["sugar", "eggs"]
+
+    def test_is_lazy(self):
+        def lines():
+            yield "1 cup sugar"
+            raise AssertionError("consumed too far")
+
+        assert next(parse_ingredients(lines())).name == "sugar"
+
+    def test_errors_are_inline(self):
+        lines = ["1 cup sugar\n", "2 cups\n", "\n", "1/0 cup milk\n", "2 eggs\n"]
+        results = list(parse_ingredients(lines))
+
+        assert [r.name for r in results if isinstance(r, IngredientRecord)] == ["sugar", "eggs"]
+        assert results[1] == UnparsedLine(2, "2 cups", "No ingredient name in: 2 cups")
+        assert str(results[2]) == "Line 4: Invalid amount in: 1/0 cup milk"
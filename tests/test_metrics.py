@@ -0,0 +1,96 @@
+"""Tests for opt-in stage metrics."""
+
+import pytest
+from lethimcook import Ingredient, Recipe, convert, convert_natural, metrics, scale_recipe
+from lethimcook.metrics import MetricsRegistry
+from lethimcook.units import get_unit_type
+
+
+@pytest.fixture
+def registry():
+    registry = metrics.enable()
+    yield registry
+    metrics.disable()
+
+
+class TestRecording:
+    """Test that instrumented stages are recorded."""
+
+    def test_disabled_by_default(self):
+        assert metrics.recorder is None
+
+    def test_convert_records_resolution(self, registry):
+        convert(1, "cup", "ml")
+        convert(1, "lb", "g")
+        assert registry.to_dict()["units.resolve"]["count"] == 2
+
+    def test_resolution_failure_is_counted(self, registry):
+        with pytest.raises(ValueError):
+            convert(1, "cup", "smidgen")
+        assert registry.to_dict()["units.resolve"]["failures"] == 1
+
+    def test_get_unit_type(self, registry):
+        get_unit_type("cup")
+        assert registry.to_dict()["units.resolve"]["count"] == 1
+
+    def test_natural_parse(self, registry):
+        convert_natural("2 cups to ml")
+        with pytest.raises(ValueError):
+            convert_natural("how much is a cup")
+        parse = registry.to_dict()["natural.parse"]
+        assert parse["count"] == 2
+        assert parse["failures"] == 1
+
+    def test_scale_recipe(self, registry):
+        recipe = Recipe(servings=2, ingredients=[Ingredient(amount=1, unit="cup", name="flour")])
+        scale_recipe(recipe, 4)
+        with pytest.raises(ValueError):
+            scale_recipe(recipe, 0)
+        scale = registry.to_dict()["recipe.scale"]
+        assert scale["count"] == 2
+        assert scale["failures"] == 1
+
+    def test_disable_stops_recording(self, registry):
+        metrics.disable()
+        convert(1, "cup", "ml")
+        assert registry.to_dict() == {}
+
+    def test_listener(self, registry):
+        calls = []
+        registry.add_listener(lambda *args: calls.append(args))
+        get_unit_type("cup")
+        stage, seconds, failed = calls[0]
+        assert stage == "units.resolve"
+        assert seconds >= 0
+        assert failed is False
+
+
+class TestExport:
+    """Test dict and Prometheus export."""
+
+    def test_cumulative_histogram(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.observe("stage", 0.05)
+        registry.observe("stage", 0.5)
+        registry.observe("stage", 5.0, failed=True)
+        exported = registry.to_dict()["stage"]
+        assert exported["histogram"] == {0.1: 1, 1.0: 2, "+Inf": 3}
+        assert exported["count"] == 3
+        assert exported["failures"] == 1
+        assert exported["total_seconds"] == pytest.approx(5.55)
+
+    def test_prometheus(self):
+        registry = MetricsRegistry(buckets=(0.1,))
+        registry.observe("convert", 0.05)
+        text = registry.to_prometheus()
+        assert "# TYPE lethimcook_stage_seconds histogram" in text
+        assert 'lethimcook_stage_seconds_bucket{stage="convert",le="0.1"} 1' in text
+        assert 'lethimcook_stage_seconds_bucket{stage="convert",le="+Inf"} 1' in text
+        assert 'lethimcook_stage_seconds_count{stage="convert"} 1' in text
+        assert 'lethimcook_stage_failures_total{stage="convert"} 0' in text
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.observe("stage", 0.001)
+        registry.reset()
+        assert registry.to_dict() == {}
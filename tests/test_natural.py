@@ -1,7 +1,9 @@
 """Tests for natural language conversion."""
 
 import pytest
-from lethimcook import convert_natural
+from lethimcook import convert_natural, convert_natural_result, convert_natural_stream, natural
+from lethimcook.natural import disable_result_cache, enable_result_cache, result_cache_info
+from lethimcook.units import register_units, reset_units
 
 
 class TestNaturalLanguagePatterns:
@@ -41,6 +43,14 @@ class TestNaturalLanguagePatterns:
         assert "473" in result1
         assert "473" in result2
 
+    def test_in_pattern(self):
+        result = convert_natural("1 pound in grams")
+        assert result == "1 pound = 453.59 grams"
+
+    def test_how_many_pattern_result(self):
+        result = convert_natural("how many cups in 2 liters")
+        assert result == "2 liters = 8.45 cups"
+
     def test_multi_word_units(self):
         result = convert_natural("5 fluid ounce to ml")
         assert "fluid ounce" in result.lower()
@@ -61,3 +71,140 @@ class TestNaturalLanguageErrors:
     def test_invalid_unit(self):
         with pytest.raises(ValueError):
             convert_natural("2 blorg to ml")
+
+    def test_invalid_unit_in_each_phrasing(self):
+        for query in ("convert 2 blorg to ml", "how many blorg in 2 ml"):
+            with pytest.raises(ValueError, match="Unknown unit: blorg"):
+                convert_natural(query)
+
+    def test_numbers_out_of_range(self):
+        with pytest.raises(ValueError, match="Number out of range"):
+            convert_natural("9" * 400 + " cups to ml")
+        with pytest.raises(ValueError, match="Result out of range"):
+            convert_natural("1" + "0" * 307 + " gallons to ml")
+
+
+class TestNaturalLanguageStream:
+    """Test streaming conversion of line-delimited queries."""
+
+    def test_results_in_order(self):
+        results = list(convert_natural_stream(["2 cups to ml\n", "convert 1 pound to grams\n"]))
+        assert results == ["2 cups = 473.18 ml", "1 pound = 453.59 grams"]
+
+    def test_errors_are_inline(self):
+        results = list(convert_natural_stream(["gibberish", "2 blorg to ml", "2 cups to ml"]))
+        assert results[0] == "Error: Could not parse conversion request: gibberish"
+        assert results[1] == "Error: Unknown unit: blorg"
+        assert results[2] == "2 cups = 473.18 ml"
+
+    def test_overflow_is_inline(self):
+        results = list(convert_natural_stream(["9" * 400 + " cups to ml", "2 cups to ml"]))
+        assert results[0].startswith("Error: Number out of range")
+        assert results[1] == "2 cups = 473.18 ml"
+
+    def test_blank_lines_skipped(self):
+        results = list(convert_natural_stream(["", "   \n", "1 cup to ml"]))
+        assert results == ["1 cup = 236.59 ml"]
+
+    def test_is_lazy(self):
+        def lines():
+            yield "1 cup to ml"
+            raise AssertionError("consumed too far")
+
+        stream = convert_natural_stream(lines())
+        assert next(stream) == "1 cup = 236.59 ml"
+
+
+class TestNaturalConversionResult:
+    """Test the structured result of convert_natural_result."""
+
+    def test_fields(self):
+        result = convert_natural_result("How many ml in 2 cups?")
+        assert result.value == 2
+        assert (result.from_unit, result.to_unit, result.ingredient) == ("cups", "ml", None)
+        assert result.result == pytest.approx(473.176)
+        assert result.text == convert_natural("How many ml in 2 cups?")
+
+    def test_ingredient_is_split_from_unit(self):
+        result = convert_natural_result("2 fl oz of milk to g")
+        assert (result.from_unit, result.ingredient) == ("fl oz", "milk")
+        assert result.text == "2 fl oz of milk = 60.92 g"
+
+    def test_errors(self):
+        with pytest.raises(ValueError, match="Could not parse"):
+            convert_natural_result("gibberish")
+
+
+class TestResultCache:
+    """Test the optional convert_natural result cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache(self):
+        cache = enable_result_cache(maxsize=2)
+        yield cache
+        disable_result_cache()
+        reset_units()
+
+    def test_disabled_by_default(self):
+        disable_result_cache()
+        assert result_cache_info() is None
+        assert convert_natural("2 cups to ml") == "2 cups = 473.18 ml"
+
+    def test_hits_are_keyed_by_normalized_query(self):
+        first = convert_natural("2 cups to ml")
+        assert convert_natural("  2   CUPS to ml ") == first
+        info = result_cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+        assert info.hit_rate == 0.5
+
+    def test_negative_results_are_cached(self, monkeypatch):
+        with pytest.raises(ValueError, match="Could not parse"):
+            convert_natural("this is gibberish")
+        monkeypatch.setattr(natural, "_convert_query", None)
+        with pytest.raises(ValueError, match="Could not parse"):
+            convert_natural("This is  gibberish")
+        assert result_cache_info().hits == 1
+
+    def test_size_eviction(self):
+        convert_natural("1 cup to ml")
+        convert_natural("2 cups to ml")
+        convert_natural("1 cup to ml")
+        convert_natural("3 cups to ml")
+        info = result_cache_info()
+        assert (info.currsize, info.evictions) == (2, 1)
+        convert_natural("1 cup to ml")
+        assert result_cache_info().hits == 2
+
+    def test_ttl_expiry(self):
+        now = [0.0]
+        cache = natural.ResultCache(maxsize=8, ttl=10, clock=lambda: now[0])
+        tables = (object(),)
+        cache.put("q", tables, "result", None)
+        now[0] = 5
+        assert cache.get("q", tables) == ("result", None)
+        now[0] = 11
+        assert cache.get("q", tables) is None
+        info = cache.info()
+        assert (info.hits, info.misses, info.expirations, info.currsize) == (1, 1, 1, 0)
+
+    def test_registry_reload_invalidates(self):
+        with pytest.raises(ValueError, match="Unknown unit"):
+            convert_natural("2 sticks to g")
+        register_units({"stick": {"type": "weight", "scale": 113.4, "aliases": ["sticks"]}})
+        assert convert_natural("2 sticks to g") == "2 sticks = 226.80 g"
+
+    def test_shared_with_structured_results(self):
+        text = convert_natural("2 cups to ml")
+        assert convert_natural_result("2 cups to ml").text == text
+        assert result_cache_info().hits == 1
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError, match="Cache size must be positive"):
+            enable_result_cache(maxsize=0)
+        with pytest.raises(ValueError, match="Cache TTL must be positive"):
+            enable_result_cache(ttl=0)
+
+    def test_clear(self, cache):
+        convert_natural("2 cups to ml")
+        cache.clear()
+        assert result_cache_info() == (0, 0, 2, 0, None, 0, 0)
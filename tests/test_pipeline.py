@@ -0,0 +1,95 @@
+"""Tests for the JSONL recipe scaling pipeline."""
+
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from lethimcook.pipeline import scale_chunk, scale_jsonl
+
+
+def _catalog(count: int) -> bytes:
+    lines = [
+        json.dumps({
+            "servings": 2,
+            "name": f"recipe {i}",
+            "ingredients": [{"amount": i, "unit": "g", "name": "rice"}],
+        })
+        for i in range(count)
+    ]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def _run(data: bytes, **kwargs):
+    output = io.BytesIO()
+    stats = scale_jsonl(io.BytesIO(data), output, 4, **kwargs)
+    return [json.loads(line) for line in output.getvalue().splitlines()], stats
+
+
+class TestScaleChunk:
+    """Test the per-worker chunk function."""
+
+    def test_scales_lines(self):
+        output, records, errors, timings = scale_chunk([b'{"servings": 1, "ingredients": []}', b"\n"], 3)
+
+        assert json.loads(output)["servings"] == 3
+        assert records == 1
+        assert errors == 0
+        assert len(timings) == 3
+
+    def test_errors_inline_with_line_numbers(self):
+        output, _, errors, _ = scale_chunk([b"not json", b'{"servings": 0, "ingredients": []}'], 3, first_line=7)
+        first, second = (json.loads(line) for line in output.splitlines())
+
+        assert errors == 2
+        assert first["line"] == 7
+        assert second["line"] == 8
+        assert "servings" in second["error"]
+
+
+class TestScaleJsonl:
+    """Test the streaming pipeline."""
+
+    def test_in_process(self):
+        results, stats = _run(_catalog(25), workers=0, chunk_size=4)
+
+        assert [r["name"] for r in results] == [f"recipe {i}" for i in range(25)]
+        assert [r["ingredients"][0]["amount"] for r in results] == [2 * i for i in range(25)]
+        assert stats.records == 25
+        assert stats.chunks == 7
+
+    def test_process_pool_keeps_input_order(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results, stats = _run(_catalog(50), executor=executor, workers=2, chunk_size=3, max_in_flight=2)
+
+        assert [r["name"] for r in results] == [f"recipe {i}" for i in range(50)]
+        assert stats.records == 50
+        assert stats.validate > 0
+
+    def test_bad_lines_do_not_abort(self):
+        data = _catalog(2) + b"\n{broken\n" + _catalog(1)
+        results, stats = _run(data, workers=0)
+
+        assert stats.errors == 1
+        assert results[2] == {"error": results[2]["error"], "line": 4}
+        assert results[3]["name"] == "recipe 0"
+
+    def test_normalize_units(self):
+        data = b'{"servings": 1, "ingredients": [{"amount": 500, "unit": "g", "name": "rice"}]}\n'
+        [result], _ = _run(data, workers=0, normalize_units=True)
+
+        assert result["ingredients"][0] == {"amount": 2.0, "unit": "kg", "name": "rice", "note": None}
+
+    def test_invalid_servings(self):
+        with pytest.raises(ValueError, match="positive"):
+            scale_jsonl(io.BytesIO(b""), io.BytesIO(), 0)
+
+    @pytest.mark.parametrize("servings", [2.5, True])
+    def test_non_integer_servings_fail_before_submitting(self, servings):
+        class NoSubmit(ThreadPoolExecutor):
+            def submit(self, *args, **kwargs):
+                raise AssertionError("chunk submitted")
+
+        data = b'{"servings": 1, "ingredients": []}\n'
+        with NoSubmit(max_workers=1) as executor, pytest.raises(ValueError, match="whole number"):
+            scale_jsonl(io.BytesIO(data), io.BytesIO(), servings, executor=executor)
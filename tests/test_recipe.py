@@ -3,6 +3,8 @@
 import pytest
 from pydantic import ValidationError
 from lethimcook import Ingredient, Recipe, scale_recipe
+from lethimcook.recipe import aggregate_ingredients
+from lethimcook.units import UnitType
 
 
 class TestRecipeScaling:
@@ -101,6 +103,71 @@ class TestRecipeScaling:
         assert scaled.name == "Chocolate Chip Cookies"
         assert scaled.prep_time == "15 minutes"
 
+    def test_preserve_extra_fields(self):
+        recipe = Recipe(
+            servings=4,
+            cuisine="italian",
+            ingredients=[
+                Ingredient(amount=2, unit="cups", name="flour", brand="King Arthur"),
+            ]
+        )
+        scaled = scale_recipe(recipe, 8)
+
+        assert scaled.cuisine == "italian"
+        assert scaled.ingredients[0].brand == "King Arthur"
+        assert scaled.ingredients[0].amount == 4
+
+    def test_original_recipe_unchanged(self):
+        recipe = Recipe(
+            servings=4,
+            ingredients=[
+                Ingredient(amount=2, unit="cups", name="flour"),
+                Ingredient(unit="pinch", name="salt"),
+            ]
+        )
+        scaled = scale_recipe(recipe, 8)
+
+        assert recipe.servings == 4
+        assert recipe.ingredients[0].amount == 2
+        assert scaled.ingredients[1] is not recipe.ingredients[1]
+
+    def test_extra_fields_are_not_shared(self):
+        recipe = Recipe(
+            servings=4,
+            tags=["quick"],
+            ingredients=[Ingredient(amount=2, unit="cups", name="flour", brands=["King Arthur"])],
+        )
+        scaled = scale_recipe(recipe, 8)
+        scaled.tags.append("easy")
+        scaled.ingredients[0].brands.append("Bob's")
+
+        assert recipe.tags == ["quick"]
+        assert recipe.ingredients[0].brands == ["King Arthur"]
+
+    def test_scalar_extra_fields_are_copied(self):
+        recipe = Recipe(
+            servings=4,
+            ingredients=[Ingredient(amount=2, unit="cups", name="flour", brand="King Arthur")],
+        )
+        scaled = scale_recipe(recipe, 8)
+        scaled.ingredients[0].origin = "Vermont"
+
+        assert scaled.ingredients[0].brand == "King Arthur"
+        assert recipe.ingredients[0].model_extra == {"brand": "King Arthur"}
+
+    def test_scaled_ingredients_match_validated_models(self):
+        recipe = Recipe(
+            servings=2,
+            ingredients=[
+                Ingredient(amount=1, unit="cup", name="milk", note="warm", brand="x"),
+            ]
+        )
+        scaled = scale_recipe(recipe, 6)
+
+        expected = Ingredient(amount=3, unit="cup", name="milk", note="warm", brand="x")
+        assert scaled.ingredients[0] == expected
+        assert scaled.model_dump()["ingredients"][0] == expected.model_dump()
+
     def test_empty_ingredients_list(self):
         recipe = Recipe(
             servings=4,
@@ -112,6 +179,150 @@ class TestRecipeScaling:
         assert len(scaled.ingredients) == 0
 
 
+class TestUnitNormalization:
+    """Test scaling with readable unit normalization."""
+
+    def test_promotes_to_larger_unit(self):
+        recipe = Recipe(
+            servings=1,
+            ingredients=[Ingredient(amount=1, unit="tsp", name="salt")],
+        )
+        scaled = scale_recipe(recipe, 48, normalize_units=True)
+
+        assert scaled.ingredients[0].unit == "cup"
+        assert abs(scaled.ingredients[0].amount - 1) < 0.001
+
+    def test_demotes_to_smaller_unit(self):
+        recipe = Recipe(
+            servings=4,
+            ingredients=[Ingredient(amount=1, unit="kg", name="flour")],
+        )
+        scaled = scale_recipe(recipe, 2, normalize_units=True)
+
+        assert scaled.ingredients[0].unit == "g"
+        assert abs(scaled.ingredients[0].amount - 500) < 0.001
+
+    def test_keeps_spelling_when_unit_unchanged(self):
+        recipe = Recipe(
+            servings=4,
+            ingredients=[Ingredient(amount=1, unit="cups", name="milk")],
+        )
+        scaled = scale_recipe(recipe, 8, normalize_units=True)
+
+        assert scaled.ingredients[0].unit == "cups"
+        assert scaled.ingredients[0].amount == 2
+
+    def test_unknown_and_unladdered_units_pass_through(self):
+        recipe = Recipe(
+            servings=1,
+            ingredients=[
+                Ingredient(amount=1, unit="pinch", name="salt"),
+                Ingredient(amount=3, unit="whole", name="eggs"),
+                Ingredient(unit="tsp", name="pepper", note="to taste"),
+            ],
+        )
+        scaled = scale_recipe(recipe, 100, normalize_units=True)
+
+        assert [i.unit for i in scaled.ingredients] == ["pinch", "whole", "tsp"]
+        assert [i.amount for i in scaled.ingredients] == [100, 300, None]
+
+    def test_disabled_by_default(self):
+        recipe = Recipe(
+            servings=1,
+            ingredients=[Ingredient(amount=1, unit="tsp", name="salt")],
+        )
+        scaled = scale_recipe(recipe, 48)
+
+        assert scaled.ingredients[0].unit == "tsp"
+        assert scaled.ingredients[0].amount == 48
+
+
+class TestAggregateIngredients:
+    """Test shopping-list aggregation across recipes."""
+
+    def test_sums_across_units_in_base_units(self):
+        recipes = [
+            Recipe(servings=1, ingredients=[Ingredient(amount=1, unit="cup", name="Milk")]),
+            Recipe(servings=1, ingredients=[Ingredient(amount=100, unit="ml", name="milk ")]),
+        ]
+        [milk] = aggregate_ingredients(recipes)
+
+        assert milk.name == "Milk"
+        assert milk.unit == "ml"
+        assert abs(milk.amount - 336.588) < 0.001
+
+    def test_display_units(self):
+        recipes = [
+            Recipe(servings=1, ingredients=[Ingredient(amount=8, unit="oz", name="butter")]),
+            Recipe(servings=1, ingredients=[Ingredient(amount=0.5, unit="lb", name="butter")]),
+        ]
+        [butter] = aggregate_ingredients(recipes, display_units={UnitType.WEIGHT: "lb"})
+
+        assert butter.unit == "lb"
+        assert abs(butter.amount - 1) < 0.001
+
+    def test_normalize_units(self):
+        recipes = [
+            Recipe(servings=1, ingredients=[Ingredient(amount=24, unit="tsp", name="sugar")]),
+            Recipe(servings=1, ingredients=[Ingredient(amount=8, unit="tbsp", name="sugar")]),
+        ]
+        [sugar] = aggregate_ingredients(
+            recipes, display_units={UnitType.VOLUME: "tsp"}, normalize_units=True
+        )
+
+        assert sugar.unit == "cup"
+        assert abs(sugar.amount - 1) < 0.001
+
+        [sugar] = aggregate_ingredients(recipes * 5, normalize_units=True)
+
+        assert sugar.unit == "l"
+        assert abs(sugar.amount - 1.183) < 0.001
+
+    def test_groups_by_unit_type(self):
+        recipe = Recipe(
+            servings=1,
+            ingredients=[
+                Ingredient(amount=1, unit="cup", name="flour"),
+                Ingredient(amount=200, unit="g", name="flour"),
+                Ingredient(amount=2, unit="whole", name="eggs"),
+                Ingredient(amount=1, unit="item", name="eggs"),
+            ],
+        )
+        totals = aggregate_ingredients([recipe, recipe])
+
+        assert [(i.name, i.unit) for i in totals] == [
+            ("flour", "ml"), ("flour", "g"), ("eggs", "count"),
+        ]
+        assert totals[1].amount == 400
+        assert totals[2].amount == 6
+
+    def test_unknown_units_group_by_spelling(self):
+        recipe = Recipe(
+            servings=1,
+            ingredients=[
+                Ingredient(amount=1, unit="pinch", name="salt"),
+                Ingredient(amount=2, unit="Pinch", name="salt"),
+                Ingredient(unit="dash", name="salt"),
+            ],
+        )
+        totals = aggregate_ingredients([recipe])
+
+        assert [(i.unit, i.amount) for i in totals] == [("pinch", 3), ("dash", None)]
+
+    def test_accepts_generator(self):
+        recipes = (
+            Recipe(servings=1, ingredients=[Ingredient(amount=n, unit="g", name="rice")])
+            for n in range(1, 5)
+        )
+        [rice] = aggregate_ingredients(recipes)
+
+        assert rice.amount == 10
+
+    def test_invalid_display_unit(self):
+        with pytest.raises(ValueError, match="not a volume unit"):
+            aggregate_ingredients([], display_units={UnitType.VOLUME: "g"})
+
+
 class TestRecipeScalingErrors:
     """Test error handling in recipe scaling."""
 
@@ -143,3 +354,15 @@ class TestRecipeScalingErrors:
         )
         with pytest.raises(ValueError, match="positive"):
             scale_recipe(recipe, -2)
+
+    @pytest.mark.parametrize("servings", [2.5, "8", None, True])
+    def test_non_integer_servings(self, servings):
+        recipe = Recipe(servings=4, ingredients=[])
+        with pytest.raises(ValueError, match="whole number"):
+            scale_recipe(recipe, servings)
+
+    def test_whole_float_servings(self):
+        recipe = Recipe(servings=4, ingredients=[])
+        scaled = scale_recipe(recipe, 8.0)
+        assert scaled.servings == 8
+        assert type(scaled.servings) is int
@@ -0,0 +1,69 @@
+"""Tests for lightweight recipe records."""
+
+import pytest
+from lethimcook import IngredientRecord, RecipeRecord, scale_recipe
+from lethimcook.recipe import aggregate_ingredients
+
+
+class TestRecordConversion:
+    """Test conversion to and from the pydantic models."""
+
+    def test_round_trip(self, recipe):
+        record = RecipeRecord.from_model(recipe)
+
+        assert record.to_model() == recipe
+        assert record.extra == {"cuisine": "american"}
+        assert record.ingredients[0].extra is None
+        assert record.ingredients[1].extra == {"brand": "Maldon"}
+
+    def test_extra_is_copied(self, recipe):
+        record = RecipeRecord.from_model(recipe)
+        recipe.model_extra["cuisine"] = "french"
+        recipe.ingredients[1].model_extra["brand"] = "Morton"
+
+        assert record.extra == {"cuisine": "american"}
+        assert record.ingredients[1].extra == {"brand": "Maldon"}
+
+    def test_records_are_immutable(self):
+        record = IngredientRecord(1, "cup", "milk")
+        with pytest.raises(AttributeError):
+            record.amount = 2
+
+    def test_to_model_validates(self):
+        with pytest.raises(ValueError):
+            RecipeRecord(0, ()).to_model()
+
+    def test_convert_to(self):
+        converted = IngredientRecord(2, "cups", "milk").convert_to("ml")
+
+        assert converted.unit == "ml"
+        assert converted.amount == pytest.approx(473.176)
+        assert IngredientRecord(None, "cups", "milk").convert_to("ml").amount is None
+
+
+class TestRecordScaling:
+    """Test scaling records directly."""
+
+    def test_scale_matches_models(self, recipe):
+        record = RecipeRecord.from_model(recipe)
+        scaled = scale_recipe(record, 8)
+
+        assert isinstance(scaled, RecipeRecord)
+        assert scaled.to_model() == scale_recipe(recipe, 8)
+
+    def test_scale_normalize_units(self, recipe):
+        scaled = RecipeRecord.from_model(recipe).scale(48, normalize_units=True)
+
+        assert [i.unit for i in scaled.ingredients] == ["gallon", "tbsp", "whole", "pinch", "smidgen"]
+        assert scaled.to_model() == scale_recipe(recipe, 48, normalize_units=True)
+
+    def test_scale_negative(self, recipe):
+        with pytest.raises(ValueError, match="positive"):
+            RecipeRecord.from_model(recipe).scale(0)
+        with pytest.raises(ValueError, match="whole number"):
+            RecipeRecord.from_model(recipe).scale(2.5)
+
+    def test_aggregate_records(self, recipe):
+        record = RecipeRecord.from_model(recipe)
+
+        assert aggregate_ingredients([record, recipe]) == aggregate_ingredients([recipe, recipe])
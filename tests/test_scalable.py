@@ -0,0 +1,92 @@
+"""Tests for repeated scaling with ScalableRecipe."""
+
+import pytest
+from lethimcook import ScalableRecipe, scale_recipe
+from lethimcook.units import UnitType
+
+
+def _amounts(recipe):
+    return [(i.amount, i.unit) for i in recipe.ingredients]
+
+
+class TestScalableRecipe:
+    """Test that ScalableRecipe matches scale_recipe."""
+
+    @pytest.mark.parametrize("options", [
+        {},
+        {"normalize_units": True},
+        {"display_units": {UnitType.VOLUME: "g"}},
+        {"display_units": {UnitType.VOLUME: "g"}, "normalize_units": True},
+    ])
+    @pytest.mark.parametrize("servings", [1, 4, 7, 48])
+    def test_matches_scale_recipe(self, recipe, options, servings):
+        expected = scale_recipe(recipe, servings, **options)
+        scaled = ScalableRecipe(recipe, **options).at(servings)
+        assert scaled.servings == servings
+        assert scaled.name == "Pancakes"
+        assert scaled.cuisine == "american"
+        for got, want in zip(scaled.ingredients, expected.ingredients):
+            assert got.unit == want.unit
+            assert got.amount == (None if want.amount is None else pytest.approx(want.amount))
+            assert got.model_extra == want.model_extra
+
+    def test_normalizes_across_ladder(self, recipe):
+        scaled = ScalableRecipe(recipe, normalize_units=True).at(48)
+        flour, salt, _, _, love = scaled.ingredients
+        assert (flour.amount, flour.unit) == (pytest.approx(1.5), "gallon")
+        assert (salt.amount, salt.unit) == (pytest.approx(4, rel=1e-4), "tbsp")
+        assert love.unit == "smidgen"
+
+    def test_shares_unchanged_objects(self, recipe):
+        scaled = ScalableRecipe(recipe).at(8)
+        assert scaled.ingredients[3] is recipe.ingredients[3]
+        assert scaled.ingredients[0].name is recipe.ingredients[0].name
+        assert scaled.ingredients[0].note is recipe.ingredients[0].note
+
+    def test_results_share_templates_not_source(self, recipe):
+        scalable = ScalableRecipe(recipe, sizes_kept=0)
+        six, seven = scalable.at(6).ingredients[1], scalable.at(7).ingredients[1]
+        assert six.model_extra is seven.model_extra
+        assert six.model_extra is not recipe.ingredients[1].model_extra
+        assert six.model_extra == {"brand": "Maldon"}
+
+    def test_memoizes_recent_sizes(self, recipe):
+        scalable = ScalableRecipe(recipe, sizes_kept=2)
+        first = scalable.at(6)
+        assert scalable.at(6) is first
+        scalable.at(7)
+        scalable.at(8)
+        assert scalable.at(6) is not first
+
+    def test_no_memoization(self, recipe):
+        scalable = ScalableRecipe(recipe, sizes_kept=0)
+        assert scalable.at(6) is not scalable.at(6)
+
+    def test_source_is_untouched(self, recipe):
+        ScalableRecipe(recipe, normalize_units=True).at(12)
+        assert _amounts(recipe)[0] == (2, "cups")
+
+    def test_amounts(self, recipe):
+        scalable = ScalableRecipe(recipe)
+        assert scalable.amounts(8) == [4, 2, 6, None, 2]
+        assert len(scalable) == 5
+
+    def test_invalid_servings(self, recipe):
+        scalable = ScalableRecipe(recipe)
+        with pytest.raises(ValueError, match="New servings must be positive"):
+            scalable.at(0)
+        with pytest.raises(ValueError, match="New servings must be positive"):
+            scalable.amounts(-1)
+        with pytest.raises(ValueError, match="whole number"):
+            scalable.at(2.5)
+
+    def test_invalid_servings_skip_cache(self, recipe):
+        scalable = ScalableRecipe(recipe)
+        scalable.at(1)
+        with pytest.raises(ValueError, match="whole number"):
+            scalable.at(True)
+        assert scalable.at(1.0) is scalable.at(1)
+
+    def test_invalid_display_unit(self, recipe):
+        with pytest.raises(ValueError, match="Display unit celsius"):
+            ScalableRecipe(recipe, display_units={UnitType.VOLUME: "celsius"})
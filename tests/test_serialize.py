@@ -0,0 +1,69 @@
+"""Tests for bulk JSON serialization."""
+
+import io
+import json
+
+import pytest
+from lethimcook import RecipeRecord, convert_natural_result, scale_recipe
+from lethimcook.serialize import (
+    dump_conversions,
+    dump_recipes,
+    iter_conversions_json,
+    iter_recipes_json,
+)
+
+
+class TestRecipes:
+    """Test streaming recipes as a JSON array."""
+
+    @pytest.mark.parametrize("count", [0, 1, 2, 5, 6])
+    def test_matches_model_dump(self, recipe, count):
+        pieces = list(iter_recipes_json([recipe] * count, chunk_size=2))
+        assert json.loads(b"".join(pieces)) == [recipe.model_dump(mode="json")] * count
+        # Brackets plus one piece per chunk
+        assert len(pieces) == 2 + (count + 1) // 2
+
+    def test_exact_amounts(self, recipe):
+        scaled = scale_recipe(recipe, 6, exact=True)
+        (dumped,) = json.loads(b"".join(iter_recipes_json([scaled])))
+        assert dumped["ingredients"][0]["amount"] == "3"
+        assert dumped["ingredients"][1]["amount"] == "3/2"
+
+    def test_records(self, recipe):
+        record = RecipeRecord.from_model(recipe)
+        assert b"".join(iter_recipes_json([record])) == b"".join(iter_recipes_json([recipe]))
+
+    def test_is_lazy(self, recipe):
+        def recipes():
+            yield from [recipe] * 3
+            raise AssertionError("consumed too far")
+
+        pieces = iter_recipes_json(recipes(), chunk_size=3)
+        assert next(pieces) == b"["
+        assert json.loads(b"[" + next(pieces) + b"]") == [recipe.model_dump(mode="json")] * 3
+
+    @pytest.mark.parametrize("fp", [io.BytesIO(), io.StringIO()], ids=["binary", "text"])
+    def test_dump(self, recipe, fp):
+        dump_recipes((recipe for _ in range(300)), fp, chunk_size=64)
+        assert json.loads(fp.getvalue()) == [recipe.model_dump(mode="json")] * 300
+
+    def test_invalid_chunk_size(self, recipe):
+        with pytest.raises(ValueError, match="Chunk size must be positive"):
+            iter_recipes_json([recipe], chunk_size=0)
+
+
+class TestConversions:
+    """Test streaming natural conversion results as a JSON array."""
+
+    def test_fields(self):
+        results = [convert_natural_result("2 cups of flour to grams"),
+                   convert_natural_result("1 tsp to ml")]
+        dumped = json.loads(b"".join(iter_conversions_json(results, chunk_size=1)))
+        assert dumped == [result._asdict() for result in results]
+        assert dumped[0]["ingredient"] == "flour"
+        assert dumped[1]["ingredient"] is None
+
+    def test_dump(self):
+        fp = io.BytesIO()
+        dump_conversions([], fp)
+        assert fp.getvalue() == b"[]"
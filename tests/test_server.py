@@ -0,0 +1,179 @@
+"""Tests for the conversion server."""
+
+import asyncio
+import json
+
+import pytest
+from lethimcook.server import ConversionServer, ConvertBatcher
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestConvertBatcher:
+    """Test coalescing of concurrent convert requests."""
+
+    def test_concurrent_requests_share_a_batch(self):
+        batcher = ConvertBatcher()
+
+        async def scenario():
+            return await asyncio.gather(
+                batcher.convert(1, "cup", "ml"),
+                batcher.convert(2, "cup", "ml"),
+                batcher.convert(212, "f", "c"),
+            )
+
+        results = _run(scenario())
+        assert results == pytest.approx([236.588, 473.176, 100])
+        assert batcher.batches == 1
+        assert batcher.requests == 3
+
+    def test_errors_only_fail_their_unit_pair(self):
+        batcher = ConvertBatcher()
+
+        async def scenario():
+            return await asyncio.gather(
+                batcher.convert(1, "cup", "g"),
+                batcher.convert(1, "cup", "ml"),
+                return_exceptions=True,
+            )
+
+        error, result = _run(scenario())
+        assert isinstance(error, ValueError)
+        assert result == pytest.approx(236.588)
+
+    def test_unexpected_errors_only_fail_their_unit_pair(self):
+        batcher = ConvertBatcher()
+
+        async def scenario():
+            return await asyncio.gather(
+                batcher.convert(1, "cup", "ml"),
+                batcher.convert(10 ** 400, "g", "kg"),
+                batcher.convert(1, "tsp", "ml"),
+                return_exceptions=True,
+            )
+
+        cup, error, tsp = _run(asyncio.wait_for(scenario(), 2))
+        assert isinstance(error, OverflowError)
+        assert (cup, tsp) == pytest.approx([236.588, 4.929], rel=1e-4)
+
+    def test_max_batch_flushes_immediately(self):
+        batcher = ConvertBatcher(max_batch=2)
+
+        async def scenario():
+            return await asyncio.gather(*(batcher.convert(i, "g", "kg") for i in range(5)))
+
+        _run(scenario())
+        assert batcher.batches == 3
+
+
+class TestDispatch:
+    """Test endpoint dispatch."""
+
+    def test_convert(self):
+        status, payload = _run(ConversionServer().dispatch(
+            "POST", "/convert", b'{"value": 2, "from": "cups", "to": "ml"}'
+        ))
+        assert status == 200
+        assert payload["result"] == pytest.approx(473.176)
+
+    def test_convert_values(self):
+        status, payload = _run(ConversionServer().dispatch(
+            "POST", "/convert", b'{"values": [1, 2], "from": "kg", "to": "g"}'
+        ))
+        assert status == 200
+        assert payload["results"] == [1000, 2000]
+
+    def test_convert_natural(self):
+        status, payload = _run(ConversionServer().dispatch(
+            "POST", "/convert_natural", b'{"query": "2 cups to ml"}'
+        ))
+        assert status == 200
+        assert payload["result"] == "2 cups = 473.18 ml"
+        assert payload["conversion"]["to_unit"] == "ml"
+        assert payload["conversion"]["result"] == pytest.approx(473.176)
+
+    def test_scale_recipe(self):
+        body = json.dumps({
+            "recipe": {
+                "servings": 2,
+                "name": "Toast",
+                "ingredients": [{"amount": 1, "unit": "tsp", "name": "butter"}],
+            },
+            "servings": 6,
+            "normalize_units": True,
+        }).encode()
+        status, payload = _run(ConversionServer().dispatch("POST", "/scale_recipe", body))
+        assert status == 200
+        assert payload["recipe"]["servings"] == 6
+        assert payload["recipe"]["ingredients"][0]["unit"] == "tbsp"
+
+    def test_stats(self):
+        server = ConversionServer()
+        server.latency.record("/convert", 0.002)
+        status, payload = _run(server.dispatch("GET", "/stats", b""))
+        assert status == 200
+        assert payload["latency"]["/convert"]["p50_ms"] == pytest.approx(2)
+        assert "hits" in payload["unit_cache"]
+
+    @pytest.mark.parametrize("path, body, status", [
+        ("/nope", b"{}", 404),
+        ("/convert", b"not json", 400),
+        ("/convert", b"[1]", 400),
+        ("/convert", b'{"value": 1, "from": "cup"}', 400),
+        ("/convert", b'{"value": "1", "from": "cup", "to": "ml"}', 400),
+        ("/convert", b'{"value": 1, "from": "cup", "to": "g"}', 400),
+        ("/convert", b'{"value": 1%s, "from": "g", "to": "kg"}' % (b"0" * 400), 400),
+        ("/convert", b'{"values": [1%s], "from": "g", "to": "kg"}' % (b"0" * 400), 400),
+        ("/convert_natural", b'{"query": "gibberish"}', 400),
+        ("/convert_natural", b'{"query": 5}', 400),
+        ("/convert_natural", b'{"query": "%s cups to ml"}' % (b"9" * 400), 400),
+        ("/scale_recipe", b'{"recipe": {"servings": 0}, "servings": 2}', 400),
+    ])
+    def test_errors(self, path, body, status):
+        result, payload = _run(ConversionServer().dispatch("POST", path, body))
+        assert result == status
+        assert "error" in payload
+
+    def test_wrong_method(self):
+        status, _ = _run(ConversionServer().dispatch("GET", "/convert", b""))
+        assert status == 405
+
+
+class TestHTTP:
+    """Test the server end to end over a local socket."""
+
+    def test_keep_alive_requests(self):
+        async def scenario():
+            server = ConversionServer()
+            listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+            responses = []
+            for query in ("2 cups to ml", "gibberish"):
+                body = json.dumps({"query": query}).encode()
+                writer.write(
+                    b"POST /convert_natural HTTP/1.1\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                status = int((await reader.readline()).split()[1])
+                headers = {}
+                while (line := await reader.readline()) != b"\r\n":
+                    name, _, value = line.decode().partition(":")
+                    headers[name.lower()] = value.strip()
+                payload = json.loads(await reader.readexactly(int(headers["content-length"])))
+                responses.append((status, payload))
+
+            writer.close()
+            listener.close()
+            await listener.wait_closed()
+            return responses
+
+        (ok_status, ok), (error_status, error) = _run(scenario())
+        assert ok_status == 200
+        assert ok["result"] == "2 cups = 473.18 ml"
+        assert error_status == 400
+        assert "Could not parse" in error["error"]
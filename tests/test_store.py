@@ -0,0 +1,75 @@
+"""Tests for the binary recipe store."""
+
+import pytest
+from lethimcook import Ingredient, Recipe, scale_recipe
+from lethimcook.store import RecipeStore, write_store
+
+
+@pytest.fixture
+def recipes(recipe):
+    return [
+        recipe,
+        Recipe(servings=2, ingredients=[]),
+        Recipe(
+            servings=1,
+            name="Crème brûlée",
+            ingredients=[Ingredient(amount=3, unit="cups", name="cream")],
+        ),
+    ]
+
+
+@pytest.fixture
+def store_path(tmp_path, recipes):
+    path = tmp_path / "catalog.lhc"
+    assert write_store(path, recipes) == 3
+    return path
+
+
+class TestRecipeStore:
+    """Test writing and reading store files."""
+
+    def test_round_trip(self, store_path, recipes):
+        with RecipeStore(store_path) as store:
+            assert len(store) == 3
+            assert list(store.recipes()) == recipes
+
+    def test_units_are_interned(self, store_path):
+        with RecipeStore(store_path) as store:
+            assert store.units == ("cups", "tsp", "whole", "pinch", "smidgen")
+
+    def test_lazy_view(self, store_path):
+        with RecipeStore(store_path) as store:
+            view = store[2]
+            assert view.servings == 1
+            assert view.name == "Crème brûlée"
+            assert len(view) == 1
+            assert store[0].amounts() == [2, 1, 3, None, 1]
+
+    def test_negative_and_out_of_range_index(self, store_path):
+        with RecipeStore(store_path) as store:
+            assert store[-1].name == "Crème brûlée"
+            with pytest.raises(IndexError):
+                store[3]
+
+    def test_scale_single_recipe(self, store_path, recipes):
+        with RecipeStore(store_path) as store:
+            assert store[0].scale(8) == scale_recipe(recipes[0], 8)
+
+    def test_extra_fields_survive(self, store_path):
+        with RecipeStore(store_path) as store:
+            recipe = store[0].to_recipe()
+            assert recipe.cuisine == "american"
+            assert recipe.ingredients[1].brand == "Maldon"
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "not-a-store"
+        path.write_bytes(b"x" * 100)
+        with pytest.raises(ValueError, match="Not a recipe store"):
+            RecipeStore(path)
+
+    def test_empty_store(self, tmp_path):
+        path = tmp_path / "empty.lhc"
+        write_store(path, [])
+        with RecipeStore(path) as store:
+            assert len(store) == 0
+            assert list(store) == []
@@ -0,0 +1,110 @@
+"""Stress tests for concurrent use of the conversion paths."""
+
+import threading
+
+import pytest
+from lethimcook import Ingredient, Recipe, convert, convert_natural, metrics, scale_recipe
+from lethimcook.density import register_densities
+from lethimcook.units import UnitType, register_units, reset_units, set_resolution_cache_size
+
+THREADS = 8
+ITERATIONS = 300
+
+RECIPE = Recipe(
+    servings=4,
+    ingredients=[
+        Ingredient(amount=2, unit="cups", name="flour"),
+        Ingredient(amount=1, unit="tsp", name="salt"),
+        Ingredient(amount=3, unit="whole", name="eggs"),
+    ],
+)
+
+
+def _workload() -> tuple:
+    return (
+        convert(2, "cups", "ml"),
+        convert(350, "f", "c"),
+        convert(1, "cup", "g", ingredient="water"),
+        convert_natural("how many ml in 3 teaspoons"),
+        convert_natural("2 cups of flour to grams"),
+        scale_recipe(RECIPE, 10, normalize_units=True),
+        scale_recipe(RECIPE, 6, display_units={UnitType.VOLUME: "g"}),
+    )
+
+
+def _run_threads(target, count: int) -> None:
+    barrier = threading.Barrier(count)
+    errors = []
+
+    def run():
+        barrier.wait()
+        try:
+            target()
+        except BaseException as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+class TestConcurrentConversion:
+    """Run every conversion path from many threads at once."""
+
+    @pytest.fixture(autouse=True)
+    def restore(self):
+        yield
+        reset_units()
+        register_densities({}, replace=True)
+        set_resolution_cache_size(1024)
+        metrics.disable()
+
+    def test_results_match_single_threaded(self):
+        expected = _workload()
+
+        def work():
+            for _ in range(ITERATIONS):
+                assert _workload() == expected
+
+        _run_threads(work, THREADS)
+
+    def test_reloads_during_conversion(self):
+        expected = _workload()
+        stop = threading.Event()
+
+        def work():
+            for _ in range(ITERATIONS):
+                assert _workload() == expected
+            stop.set()
+
+        def churn():
+            # Reloads only add units and densities, so results must not change
+            while not stop.is_set():
+                register_units({"stick": {"type": "weight", "scale": 113.4}}, replace=True)
+                register_densities({"matcha powder": 0.4}, replace=True)
+                set_resolution_cache_size(4)
+                set_resolution_cache_size(1024)
+                metrics.enable()
+                metrics.disable()
+
+        churner = threading.Thread(target=churn)
+        churner.start()
+        try:
+            _run_threads(work, THREADS)
+        finally:
+            stop.set()
+            churner.join()
+
+    def test_metrics_counts_are_exact(self):
+        registry = metrics.enable()
+
+        def work():
+            for _ in range(ITERATIONS):
+                convert(1, "cup", "ml")
+
+        _run_threads(work, THREADS)
+        assert registry.to_dict()["units.resolve"]["count"] == THREADS * ITERATIONS
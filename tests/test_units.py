@@ -0,0 +1,321 @@
+"""Tests for unit definitions and the unit registry."""
+
+import pytest
+from lethimcook import convert
+from lethimcook.units import (
+    BUILTIN_UNITS,
+    DEFAULT_CACHE_SIZE,
+    CONVERSIONS,
+    UNIT_TYPES,
+    UnitDefinition,
+    UnitRegistry,
+    UnitType,
+    get_registry,
+    get_unit_type,
+    load_units,
+    register_units,
+    reset_units,
+    resolution_cache_info,
+    resolve_unit,
+    set_resolution_cache_size,
+)
+
+
+class TestUnitRegistry:
+    """Test the compiled unit registry."""
+
+    def test_aliases_share_an_id(self):
+        registry = get_registry()
+        assert registry.lookup("tsp") == registry.lookup("Teaspoons ")
+        assert registry.name(registry.lookup("fl oz")) == "floz"
+
+    def test_unknown_unit(self):
+        with pytest.raises(ValueError, match="Unknown unit"):
+            get_registry().lookup("blorg")
+
+    def test_transform_is_precomputed(self):
+        registry = get_registry()
+        scale, offset = registry.transform(registry.lookup("cup"), registry.lookup("ml"))
+        assert scale == 236.588
+        assert offset == 0
+
+    def test_temperature_transform_is_affine(self):
+        registry = get_registry()
+        f, c = registry.lookup("f"), registry.lookup("c")
+        assert registry.convert(212, f, c) == pytest.approx(100)
+        assert registry.convert(100, c, f) == pytest.approx(212)
+
+    def test_identity_transform(self):
+        registry = get_registry()
+        unit_id = registry.lookup("kelvin")
+        assert registry.transform(unit_id, unit_id) == (1.0, 0.0)
+
+    def test_incompatible_types(self):
+        registry = get_registry()
+        with pytest.raises(ValueError, match="Cannot convert between"):
+            registry.transform(registry.lookup("cup"), registry.lookup("g"))
+
+    def test_duplicate_alias(self):
+        with pytest.raises(ValueError, match="Duplicate unit alias"):
+            UnitRegistry([
+                *BUILTIN_UNITS,
+                UnitDefinition("teaspoon", UnitType.VOLUME, 5.0),
+            ])
+
+    def test_without_builtin_ladder_units(self):
+        registry = UnitRegistry([
+            UnitDefinition("x", UnitType.VOLUME, 1.0),
+            UnitDefinition("ml", UnitType.VOLUME, 1.0, aliases=("millilitre",)),
+            UnitDefinition("l", UnitType.VOLUME, 1000.0),
+        ])
+        x, ml = registry.lookup("x"), registry.lookup("ml")
+        assert registry.convert(2, x, ml) == 2
+        assert registry.readable(5, x) == (5, x)
+        assert registry.name(registry.readable(1500, ml)[1]) == "l"
+
+
+class TestModuleMappings:
+    """Test the backward-compatible module-level mappings."""
+
+    def test_conversions_view(self):
+        assert CONVERSIONS["cups"] == 236.588
+        assert CONVERSIONS["kg"] == 1000.0
+        assert "fahrenheit" not in CONVERSIONS
+
+    def test_unit_types_view(self):
+        assert UNIT_TYPES["fl oz"] == UnitType.VOLUME
+        assert UNIT_TYPES["k"] == UnitType.TEMPERATURE
+        assert len(UNIT_TYPES) == len(get_registry().ids)
+
+    def test_views_are_read_only(self):
+        with pytest.raises(TypeError):
+            UNIT_TYPES["blorg"] = UnitType.COUNT
+
+    def test_get_unit_type(self):
+        assert get_unit_type(" Pounds") == UnitType.WEIGHT
+
+
+class TestResolutionCache:
+    """Test memoized unit resolution."""
+
+    def test_resolve_record(self):
+        resolved = resolve_unit("Cups ")
+        assert resolved.name == "cup"
+        assert resolved.unit_type == UnitType.VOLUME
+        assert resolved.scale == 236.588
+        assert resolved.unit_id == get_registry().lookup("cup")
+
+    def test_hits_and_misses(self):
+        registry = UnitRegistry(BUILTIN_UNITS)
+        registry.resolve("TBSP")
+        registry.resolve("TBSP")
+        registry.resolve("fl oz")
+        info = registry.cache_info()
+        assert info.hits == 1
+        assert info.misses == 2
+        assert info.currsize == 2
+
+    def test_size_bound_evicts_least_recent(self):
+        registry = UnitRegistry(BUILTIN_UNITS, cache_size=2)
+        registry.resolve("cup")
+        registry.resolve("tsp")
+        registry.resolve("cup")
+        registry.resolve("g")
+        assert registry.cache_info().currsize == 2
+        registry.resolve("cup")
+        registry.resolve("tsp")
+        assert registry.cache_info().hits == 2
+        assert registry.cache_info().misses == 4
+
+    def test_set_cache_size_resets_stats(self):
+        registry = UnitRegistry(BUILTIN_UNITS)
+        registry.resolve("cup")
+        registry.set_cache_size(8)
+        info = registry.cache_info()
+        assert info.maxsize == 8
+        assert info.currsize == 0
+
+    def test_unknown_units_are_not_cached(self):
+        registry = UnitRegistry(BUILTIN_UNITS)
+        with pytest.raises(ValueError, match="Unknown unit"):
+            registry.resolve("blorg")
+        assert registry.cache_info().currsize == 0
+
+    def test_module_cache_info(self):
+        resolve_unit("pounds")
+        assert resolution_cache_info().currsize >= 1
+
+
+class TestReadableUnits:
+    """Test readable unit ladders."""
+
+    def test_picks_largest_reached_unit(self):
+        registry = get_registry()
+        value, unit_id = registry.readable(2000, registry.lookup("g"))
+        assert registry.name(unit_id) == "kg"
+        assert value == 2
+
+    def test_tolerates_rounded_factors(self):
+        registry = get_registry()
+        _, unit_id = registry.readable(3, registry.lookup("tsp"))
+        assert registry.name(unit_id) == "tbsp"
+
+    def test_falls_back_to_smallest_unit(self):
+        registry = get_registry()
+        value, unit_id = registry.readable(0.25, registry.lookup("tbsp"))
+        assert registry.name(unit_id) == "tsp"
+        assert value == pytest.approx(0.75, abs=0.001)
+
+    def test_units_off_ladder_unchanged(self):
+        registry = get_registry()
+        unit_id = registry.lookup("fahrenheit")
+        assert registry.readable(500, unit_id) == (500, unit_id)
+
+
+class TestCustomUnits:
+    """Test registering units from dicts and files."""
+
+    @pytest.fixture(autouse=True)
+    def restore(self):
+        yield
+        reset_units()
+
+    def test_register_absolute(self):
+        register_units({"metric cup": {"type": "volume", "scale": 250, "aliases": ["metric cups"]}})
+        assert convert(2, "metric cups", "ml") == pytest.approx(500)
+        assert get_unit_type("metric cup") == UnitType.VOLUME
+
+    def test_register_relative(self):
+        register_units({
+            "dessertspoon": {"amount": 2, "unit": "tsp", "aliases": ["dsp"]},
+            "double dessertspoon": {"amount": 2, "unit": "dsp"},
+        })
+        assert convert(1, "dsp", "tsp") == pytest.approx(2)
+        assert convert(1, "double dessertspoon", "tsp") == pytest.approx(4)
+
+    def test_custom_units_use_compiled_tables(self):
+        registry = register_units([UnitDefinition("stick", UnitType.WEIGHT, 113.4)])
+        assert registry is get_registry()
+        stick, gram = registry.lookup("stick"), registry.lookup("g")
+        assert registry.transform(stick, gram) == (113.4, 0.0)
+
+    def test_registrations_accumulate(self):
+        register_units({"stick": {"type": "weight", "scale": 113.4}})
+        register_units({"imperial pint": {"type": "volume", "scale": 568.261}})
+        assert "stick" in get_registry()
+        assert "imperial pint" in get_registry()
+
+    def test_replace(self):
+        register_units({"stick": {"type": "weight", "scale": 113.4}})
+        register_units({"imperial pint": {"type": "volume", "scale": 568.261}}, replace=True)
+        assert "stick" not in get_registry()
+        assert "imperial pint" in get_registry()
+
+    def test_reset(self):
+        register_units({"stick": {"type": "weight", "scale": 113.4}})
+        reset_units()
+        assert len(get_registry()) == len(BUILTIN_UNITS)
+
+    def test_cache_size_is_kept(self):
+        set_resolution_cache_size(16)
+        register_units({"stick": {"type": "weight", "scale": 113.4}})
+        assert resolution_cache_info().maxsize == 16
+        set_resolution_cache_size(DEFAULT_CACHE_SIZE)
+
+    @pytest.mark.parametrize("spec, message", [
+        ({"type": "volume"}, "either scale or amount"),
+        ({"type": "distance", "scale": 1}, "type must be one of"),
+        ({"type": "volume", "scale": -1}, "scale must be positive"),
+        ({"type": "volume", "scale": float("nan")}, "scale must be positive and finite"),
+        ({"type": "volume", "scale": float("inf")}, "scale must be positive and finite"),
+        ({"amount": float("inf"), "unit": "cup"}, "scale must be positive and finite"),
+        ({"type": "temperature", "scale": 1, "offset": float("nan")}, "offset must be finite"),
+        ({"type": "volume", "scale": "big"}, "scale must be a number"),
+        ({"type": "volume", "scale": 1, "offset": 3}, "offset is only allowed"),
+        ({"amount": 2, "unit": "smidgen"}, "unknown unit"),
+        ({"amount": 2, "unit": "celsius"}, "relative to celsius"),
+        ({"amount": 2, "unit": "cup", "type": "weight"}, "not a weight unit"),
+        ({"type": "volume", "scale": 1, "aliases": "x"}, "list of strings"),
+        ({"type": "volume", "scale": 1, "colour": "red"}, "unknown keys colour"),
+    ])
+    def test_invalid_spec(self, spec, message):
+        with pytest.raises(ValueError, match=message):
+            register_units({"thing": spec})
+        assert "thing" not in get_registry()
+
+    def test_duplicate_alias_between_specs(self):
+        with pytest.raises(ValueError, match="Duplicate unit alias: stick"):
+            register_units({
+                "stick": {"type": "weight", "scale": 113.4},
+                "butter stick": {"type": "weight", "scale": 113.4, "aliases": ["stick"]},
+            })
+        assert "stick" not in get_registry()
+
+    @pytest.mark.parametrize("definition, message", [
+        (UnitDefinition("stick", UnitType.WEIGHT, 0), "scale must be positive"),
+        (UnitDefinition("stick", UnitType.WEIGHT, float("nan")), "scale must be positive"),
+        (UnitDefinition("stick", "distance", 1), "type must be one of"),
+        (UnitDefinition("stick", UnitType.WEIGHT, 1, 5), "offset is only allowed"),
+        (UnitDefinition("", UnitType.WEIGHT, 1), "Invalid unit name"),
+    ])
+    def test_invalid_definition(self, definition, message):
+        registry = get_registry()
+        with pytest.raises(ValueError, match=message):
+            register_units([definition])
+        assert get_registry() is registry
+
+    def test_alias_conflict_leaves_registry_untouched(self):
+        registry = get_registry()
+        with pytest.raises(ValueError, match="Duplicate unit alias: cup"):
+            register_units({"metric cup": {"type": "volume", "scale": 250, "aliases": ["cup"]}})
+        assert get_registry() is registry
+
+    def test_load_toml(self, tmp_path):
+        path = tmp_path / "units.toml"
+        path.write_text(
+            '[units.dessertspoon]\namount = 2\nunit = "tsp"\naliases = ["dsp"]\n'
+            '[units."imperial pint"]\ntype = "volume"\nscale = 568.261\n'
+        )
+        load_units(path)
+        assert convert(1, "imperial pint", "ml") == pytest.approx(568.261)
+        assert convert(1, "dsp", "tsp") == pytest.approx(2)
+
+    def test_load_json(self, tmp_path):
+        path = tmp_path / "units.json"
+        path.write_text('{"units": {"stick": {"type": "weight", "scale": 113.4}}}')
+        load_units(path)
+        assert convert(2, "stick", "g") == pytest.approx(226.8)
+
+    def test_load_invalid_file(self, tmp_path):
+        path = tmp_path / "units.toml"
+        path.write_text("units = [")
+        with pytest.raises(ValueError, match="Could not parse unit file"):
+            load_units(path)
+        path.write_text('stick = 1\n')
+        with pytest.raises(ValueError, match="no units table"):
+            load_units(path)
+
+    def test_concurrent_reloads(self):
+        import threading
+
+        specs = [{"stick": {"type": "weight", "scale": 113.4}}, {}]
+        errors = []
+
+        def reload(index):
+            for _ in range(50):
+                register_units(specs[index % 2], replace=True)
+
+        def read():
+            for _ in range(2000):
+                try:
+                    assert convert(1, "cup", "ml") == pytest.approx(236.588)
+                except Exception as e:  # pragma: no cover - reported below
+                    errors.append(e)
+
+        threads = [threading.Thread(target=reload, args=(i,)) for i in range(2)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []